@@ -4,9 +4,27 @@
 try:
     # from . import variation  # noqa
     from .safesort import safesorted  # noqa
+    from ._tracking import (  # noqa
+        ExactTracker,
+        SampledTracker,
+        TopKTracker,
+        resolve_tracker,
+    )
+    from ._transformcache import TransformCache, get_transform_cache  # noqa
+    from ._usage import UsageReport  # noqa
     from ._alias import Alias, resolve_variations  # noqa
     from ._aliasfrozen import FrozenAlias  # noqa
-    from ._aliasresolver import AliasResolver, resolve_aliases  # noqa
+    from ._aliasresolver import (  # noqa
+        AliasResolver,
+        report_collisions,
+        resolve_aliases,
+    )
+    from ._aliasresolverfrozen import FrozenAliasResolver  # noqa
+    from ._aliascompact import CompactAlias  # noqa
+    from ._aliasmapped import MappedAliasResolver  # noqa
+    from ._aliasperfect import PerfectHashResolver  # noqa
+    from ._aliasresolverconcurrent import ConcurrentAliasResolver  # noqa
+    from ._aliasresolveroverlay import OverlayAliasResolver  # noqa
 
     from ._coerce_errors import CoercionError, InvalidConverterError  # noqa
     from ._coerce_explicit import (  # noqa
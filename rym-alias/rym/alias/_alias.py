@@ -37,8 +37,9 @@ transformations may be provided, too.
 """
 
 import dataclasses as dcs
+import itertools
 import logging
-from collections import abc, defaultdict
+from collections import Counter, abc
 from functools import singledispatch
 from typing import (
     Any,
@@ -46,15 +47,27 @@ from typing import (
     Generator,
     Hashable,
     Iterable,
+    List,
     Mapping,
     Optional,
+    Sequence,
     Tuple,
 )
 
 from . import variation
+from ._lazy import VariantIndex, is_lazy, split_transforms
+from ._tracking import resolve_tracker
+from ._transformcache import get_transform_cache
+from ._usage import UsageReport, build_usage_report
 from .safesort import safesorted
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
 
 
 class AliasError(KeyError):
@@ -83,6 +96,14 @@ class Alias:
         transforms: An iterable of functions to apply to each alias.
             Each function should take one string and return one string.
             Default: Upper and lower case of each alias.
+        tracking: How to count lookup attempts, e.g., "exact" (default),
+            "sampled", "topk", or "off". See rym.alias.resolve_tracker.
+        casefold: If true, store and match casefolded names only.
+            Case variations then match without being stored separately.
+        lazy: If true, do not store names made by transforms that support
+            lazy expansion, e.g., case and (de)essing. They are found on
+            demand instead (see rym.alias._lazy). Stored names win over
+            transformed names, and transform failures are never raised.
     """
 
     identity: Hashable
@@ -94,6 +115,9 @@ class Alias:
     logger: logging.Logger = dcs.field(
         default=None, repr=False, hash=False, compare=False
     )
+    tracking: Any = dcs.field(default="exact", repr=False, hash=False, compare=False)
+    casefold: bool = False
+    lazy: bool = False
     _lookup: Mapping[str, int] = dcs.field(init=False, repr=False)
     _attempts: Mapping[str, int] = dcs.field(
         init=False,
@@ -101,6 +125,20 @@ class Alias:
         hash=False,
         compare=False,
     )
+    _variants: Optional[VariantIndex] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
+    _sorted_names: Optional[Tuple[Hashable, ...]] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
 
     def __post_init__(self):
         # allow users to explicitly provide 'None"
@@ -113,17 +151,34 @@ class Alias:
             self.aliases = [self.aliases]
 
         # setup alias internal data
-        opts = self.names
-        self._attempts = defaultdict(int, {k: 0 for k in self.names})
-        self._lookup = {
-            **{k: 1 for k in opts},
-            **dict(self._yield_lookup(opts, self.transforms, strict=self.strict)),
-        }
+        self.set_tracking(self.tracking)
+        self._lookup = self._build_lookup(self.transforms)
 
     @property
     def names(self) -> Iterable[str]:
         return [self.identity, *self.aliases]
 
+    def _build_lookup(
+        self,
+        transforms: Iterable[Callable],
+        names: Optional[Iterable[Hashable]] = None,
+        expand: bool = False,
+    ) -> Mapping[Hashable, int]:
+        """Return lookup for the given names (default: all) and transformed names.
+
+        Names made by lazy transforms are only included if expand is true.
+        """
+        opts = self.names if names is None else names
+        if self.lazy and not expand:
+            transforms = [x for x in transforms if not is_lazy(x)]
+        lookup = {
+            **{k: 1 for k in opts},
+            **dict(self._yield_lookup(opts, transforms, strict=self.strict)),
+        }
+        if self.casefold:
+            return dict.fromkeys(transform_many(variation.casefold, list(lookup)), 1)
+        return lookup
+
     @staticmethod
     def _yield_lookup(
         opts: Iterable[Hashable],
@@ -137,8 +192,16 @@ class Alias:
             transforms: One or more transforms to apply to each name.
             strict: If true, will raise if unable to apply transform.
         """
-        for name in opts:
-            for func in transforms:
+        opts = opts if isinstance(opts, list) else list(opts)
+        for func in transforms:
+            try:
+                names = transform_many(func, opts)
+            except Exception:
+                names = None  # find (and handle) failures one name at a time
+            if names is not None:
+                yield from zip(names, itertools.repeat(1))
+                continue
+            for name in opts:
                 try:
                     yield (func(name), 1)
                 except Exception:
@@ -153,23 +216,66 @@ class Alias:
         if value in self.aliases:
             self.logger.warning("existing alias: %s", value)
             return  # do not add more than once
-        lookup = self._yield_lookup([value], self.transforms, strict=self.strict)
-        self._lookup.update(lookup)
+        self._lookup.update(self._build_lookup(self.transforms, [value]))
         self.aliases.append(value)
+        self._clear_derived()
+
+    def remove_alias(self, value: Hashable) -> None:
+        """Remove given alias from lookup, including transformed names.
+
+        Transformed names that other names also make are kept. Lookup
+        attempts of removed names are dropped.
+
+        Raises:
+            AliasError (KeyError) if unknown alias given.
+        """
+        if value not in self.aliases:
+            raise AliasError(value)
+        self.aliases.remove(value)
+        removed = self._lookup.keys() - self._build_lookup(self.transforms).keys()
+        for key in removed:
+            del self._lookup[key]
+            if self._attempts is not None:
+                self._attempts.pop(key, None)
+        self._clear_derived()
+
+    def discard(self, value: Hashable) -> None:
+        """Remove given alias if present. See remove_alias."""
+        if value in self.aliases:
+            self.remove_alias(value)
+
+    def _clear_derived(self) -> None:
+        """Drop data derived from the lookup. Rebuilt on demand."""
+        self._variants = None
+        self._sorted_names = None
 
     def all_names(
         self,
         _sorted: Optional[Callable] = None,
+        variants: bool = False,
         **kwargs,
     ) -> Iterable[str]:
         """Return all known aliases and transformations.
 
+        NOTE: The default sort order is cached until the lookup changes.
+
         Arguments:
             _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
+            variants: If true, list each transformed name even if not stored,
+                e.g., upper and lower case names when casefolded or lazy.
             **kwargs: Keywords for "sorted".
         """
+        if not (_sorted or variants or kwargs):
+            if self._sorted_names is None:
+                self._sorted_names = tuple(safesorted(self._lookup.keys()))
+            return list(self._sorted_names)
         _sorted = _sorted or safesorted
-        return _sorted(self._lookup.keys(), **kwargs)
+        if not variants:
+            return _sorted(self._lookup.keys(), **kwargs)
+        opts = self.names
+        names = dict.fromkeys(opts, 1)
+        names.update(self._yield_lookup(opts, self.transforms, strict=False))
+        return _sorted(names.keys(), **kwargs)
 
     def add_transform(self, value: Callable[[str], str]) -> None:
         """Add given transform and update alias lookup."""
@@ -177,9 +283,9 @@ class Alias:
             if func in self.transforms:
                 self.logger.warning("existing transform: %s", func)
                 return  # do not add more than once
-            lookup = self._yield_lookup(self.names, [func], strict=self.strict)
-            self._lookup.update(lookup)
+            self._lookup.update(self._build_lookup([func]))
             self.transforms.append(func)
+            self._clear_derived()
 
     def identify(self, value: str) -> str:
         """Return identity for the given alias value.
@@ -191,12 +297,187 @@ class Alias:
         Raises:
             AliasError (KeyError) if unknown alias given.
         """
-        self._attempts[value] += 1  # know which aliases are used / needed
+        if self.casefold:
+            value = variation.casefold(value)
+        if self._attempts is not None:
+            self._attempts.track(value)  # know which aliases are used / needed
         match = self._lookup.get(value)  # faster than itrable and try:except
+        if not match and self.lazy:
+            match = self._find_variant(value)
         if not match:
             raise AliasError(value)
         return self.identity
 
+    def _find_variant(self, value: Hashable) -> bool:
+        """Return true if a lazy transform makes the given (folded) value."""
+        if self._variants is None:
+            self._variants = VariantIndex(variation.casefold if self.casefold else None)
+            self._variants.add(self.names, self.transforms, True)
+        return self._variants.find(value, False)
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values.
+
+        Arguments:
+            values: Aliases to match. May be a numpy array.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            List of identities (or array, if given an array).
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        return identify_many(values, self._identify_unique, default=default)
+
+    def _identify_unique(self, counts: Mapping[Hashable, int], default: Any) -> dict:
+        """Return identity for each counted value and track attempts."""
+        fold = variation.casefold if self.casefold else None
+        if self._attempts is not None:
+            self._attempts.track_many(fold_counts(counts, fold))
+        lookup = self._lookup
+        lazy = self.lazy
+        resolved = {}
+        for value in counts:
+            key = fold(value) if fold else value
+            if key in lookup or (lazy and self._find_variant(key)):
+                resolved[value] = self.identity
+            elif _DEFAULT != default:
+                resolved[value] = default
+            else:
+                raise AliasError(value)
+        return resolved
+
+    def usage(self, top: int = 10) -> UsageReport:
+        """Report lookup attempts by name, and the top misses.
+
+        Arguments:
+            top: Maximum number of unknown values to report.
+        Returns:
+            A UsageReport instance. See rym.alias._usage.
+        Raises:
+            ValueError if attempts are not tracked.
+        """
+        if self._attempts is None:
+            raise ValueError("lookup attempts are not tracked")
+        names = dict.fromkeys(self._lookup, self.identity)
+        return build_usage_report(
+            self._attempts,
+            names,
+            [self.identity],
+            find=self._find_variant_identity,
+            top=top,
+        )
+
+    def _find_variant_identity(self, value: Hashable) -> Hashable:
+        """Return identity for a name found on demand. See Alias.lazy.
+
+        Raises:
+            AliasError (KeyError) if unknown.
+        """
+        if self.lazy and self._find_variant(value):
+            return self.identity
+        raise AliasError(value)
+
+    def set_tracking(self, value: Any) -> None:
+        """Replace how lookup attempts are counted.
+
+        A mode starts new counts. A tracker instance is used as is, so it
+        keeps its counts.
+
+        Arguments:
+            value: Tracking mode or tracker. See rym.alias.resolve_tracker.
+        Returns:
+            None
+        """
+        self._attempts = resolve_tracker(value)
+        self.tracking = value
+        if self._attempts is not None:
+            names = self.names
+            if self.casefold:
+                names = [variation.casefold(k) for k in names]
+            self._attempts.register(names)
+
+    def set_casefold(self, value: bool) -> None:
+        """Enable or disable casefolded lookup and update lookup.
+
+        Arguments:
+            value: If true, store and match casefolded names only.
+        Returns:
+            None
+        """
+        if value == self.casefold:
+            return  # EARLY EXIT: lookup is already up to date
+        self.casefold = value
+        self._lookup = self._build_lookup(self.transforms)
+        self._clear_derived()
+        self.set_tracking(self.tracking)
+
+    def set_lazy(self, value: bool) -> None:
+        """Enable or disable lazy expansion and update lookup.
+
+        Arguments:
+            value: If true, find names made by lazy transforms on demand.
+        Returns:
+            None
+        """
+        if value == self.lazy:
+            return  # EARLY EXIT: lookup is already up to date
+        self.lazy = value
+        self._lookup = self._build_lookup(self.transforms)
+        self._clear_derived()
+
+    def _pack(self) -> tuple:
+        """Return fields and stored names, e.g., to send to another process.
+
+        Derived data (e.g., attempts) is not included. See _unpack.
+        """
+        return (
+            self.identity,
+            self.aliases,
+            self.transforms,
+            self.strict,
+            self.logger,
+            self.tracking,
+            self.casefold,
+            self.lazy,
+            tuple(self._lookup),
+        )
+
+    @classmethod
+    def _unpack(cls, packed: tuple) -> "Alias":
+        """Return alias from packed fields without transforming names again.
+
+        Arguments:
+            packed: Fields and stored names. See _pack.
+        Returns:
+            Alias instance.
+        """
+        alias = cls.__new__(cls)
+        (
+            alias.identity,
+            alias.aliases,
+            alias.transforms,
+            alias.strict,
+            alias.logger,
+            alias.tracking,
+            alias.casefold,
+            alias.lazy,
+            names,
+        ) = packed
+        alias._lookup = dict.fromkeys(names, 1)
+        alias._clear_derived()
+        alias.set_tracking(alias.tracking)
+        return alias
+
+    def _set_lookup(self, names: Iterable[Hashable], transforms: Iterable[Callable]):
+        """Replace lookup with the given names, already transformed and folded."""
+        self._lookup = dict.fromkeys(names, 1)
+        self.transforms = list(transforms)
+        self._clear_derived()
+
     def set_transforms(self, value: Iterable[Callable[[str], str]]) -> None:
         """Replace current transforms and update lookup.
 
@@ -206,14 +487,167 @@ class Alias:
             None
         """
         value = resolve_variations(value)
-        opts = self.names
-        lookup_gen = self._yield_lookup(self.names, value, strict=self.strict)
-        lookup = {
-            **{k: 1 for k in opts},
-            **dict(lookup_gen),
-        }
-        self._lookup = lookup
+        if value == self.transforms:
+            return  # EARLY EXIT: lookup is already up to date
+        self._lookup = self._build_lookup(value)
         self.transforms = value[:]
+        self._clear_derived()
+
+    def _expand_lookup(self) -> Iterable[Hashable]:
+        """Return stored names and names made by lazy transforms."""
+        if not self.lazy:
+            return self._lookup
+        _, lazy = split_transforms(self.transforms)
+        return {**self._build_lookup(lazy, expand=True), **self._lookup}
+
+
+# batch transforms
+# ----------------------------------
+
+
+def transform_many(func: Callable[[Hashable], Hashable], values: List) -> List:
+    """Return the given transform applied to each value.
+
+    Uses the batch implementation of the transform, if any, and the shared
+    transform cache. See rym.alias.variation and rym.alias._transformcache.
+
+    Arguments:
+        func: Transform to apply.
+        values: Values to transform.
+    Returns:
+        List of transformed values, in the same order.
+    Raises:
+        Any exception raised by the transform.
+    """
+    return get_transform_cache().transform_many(func, values)
+
+
+def set_transforms_many(aliases: Sequence[Alias], value: Any) -> None:
+    """Replace transforms on each alias, transforming all names at once.
+
+    Equivalent to calling set_transforms on each alias, but each transform
+    is applied to the names of every alias in one batch.
+
+    Arguments:
+        aliases: Aliases to update.
+        value: Transforms. See resolve_variations.
+    Returns:
+        None
+    """
+    value = resolve_variations(value)
+    pending = [x for x in aliases if list(x.transforms) != value]
+    groups = [x.names for x in pending]
+    flat = list(itertools.chain.from_iterable(groups))
+    lazy = [getattr(x, "lazy", False) for x in pending]
+    funcs = split_transforms(value)[0] if all(lazy) else value
+    try:
+        transformed = [(func, transform_many(func, flat)) for func in funcs]
+    except Exception:
+        for alias in pending:  # find (and handle) failures per alias
+            alias.set_transforms(value)
+        return
+
+    start = 0
+    for alias, names, is_lazy_alias in zip(pending, groups, lazy):
+        stop = start + len(names)
+        lookup = dict.fromkeys(names, 1)
+        for func, found in transformed:
+            if is_lazy_alias and is_lazy(func):
+                continue  # found on demand
+            lookup.update(dict.fromkeys(found[start:stop], 1))
+        if alias.casefold:
+            lookup = transform_many(variation.casefold, list(lookup))
+        alias._set_lookup(lookup, value)
+        start = stop
+
+
+def expand_lookup_many(aliases: Sequence[Alias]) -> List[Iterable[Hashable]]:
+    """Return stored names and names found on demand for each alias.
+
+    Equivalent to calling _expand_lookup on each alias, but each lazy
+    transform is applied to the names of every lazy alias in one batch.
+
+    Arguments:
+        aliases: Aliases to expand. Only lazy aliases are transformed.
+    Returns:
+        Names of each alias, in the same order.
+    """
+    expanded = [x._lookup for x in aliases]
+    groups = {}  # transforms: positions of lazy aliases
+    for i, alias in enumerate(aliases):
+        if getattr(alias, "lazy", False):
+            groups.setdefault(tuple(alias.transforms), []).append(i)
+    for transforms, positions in groups.items():
+        funcs = split_transforms(transforms)[1]
+        names = [aliases[i].names for i in positions]
+        flat = list(itertools.chain.from_iterable(names))
+        try:
+            transformed = [transform_many(func, flat) for func in funcs]
+        except Exception:
+            for i in positions:  # find (and handle) failures per alias
+                expanded[i] = aliases[i]._expand_lookup()
+            continue
+        start = 0
+        for i, group in zip(positions, names):
+            stop = start + len(group)
+            lookup = dict.fromkeys(group, 1)
+            for found in transformed:
+                lookup.update(dict.fromkeys(found[start:stop], 1))
+            if aliases[i].casefold:
+                lookup = transform_many(variation.casefold, list(lookup))
+            expanded[i] = {**dict.fromkeys(lookup, 1), **aliases[i]._lookup}
+            start = stop
+    return expanded
+
+
+# identify many
+# ----------------------------------
+
+
+def identify_many(
+    values: Iterable[Hashable],
+    identify_unique: Callable[[Mapping[Hashable, int], Any], Mapping],
+    default: Any = _DEFAULT,
+) -> Iterable[Hashable]:
+    """Resolve each unique value once and map results back to the input.
+
+    Arguments:
+        values: Aliases to match. May be a numpy array.
+        identify_unique: Called with a count of each unique value and the
+            default; returns a mapping of value to identity.
+        default: Passed to identify_unique.
+    Returns:
+        List of identities (or object array of the same shape, if given one).
+    """
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        flat = values.ravel().tolist()
+        resolved = identify_unique(Counter(flat), default)
+        table = numpy.empty(len(resolved), dtype=object)
+        positions = {}
+        for i, (value, identity) in enumerate(resolved.items()):
+            table[i] = identity  # avoid numpy unpacking sequence identities
+            positions[value] = i
+        codes = numpy.fromiter(
+            (positions[x] for x in flat), dtype=numpy.intp, count=len(flat)
+        )
+        return table[codes].reshape(values.shape)
+
+    values = values if isinstance(values, list) else list(values)
+    resolved = identify_unique(Counter(values), default)
+    return [resolved[x] for x in values]
+
+
+def fold_counts(
+    counts: Mapping[Hashable, int],
+    fold: Optional[Callable[[Hashable], Hashable]],
+) -> Mapping[Hashable, int]:
+    """Return counts with keys merged by the given fold, if any."""
+    if not fold:
+        return counts
+    folded = Counter()
+    for value, n in counts.items():
+        folded[fold(value)] += n
+    return folded
 
 
 # resolve variation
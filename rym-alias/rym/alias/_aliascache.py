@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Cache Compiled Aliases
+^^^^^^^^^^^^^^^^^^^^^^
+
+Parsing a large alias file and applying transforms to every alias is slow.
+Cache the result keyed by the file path, modification time, and any other
+given parts, e.g., the transforms applied.
+
+NOTE: Cache files are pickles. Only use a cache directory you trust.
+
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Hashable, Union
+
+from .__about__ import __version__
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_cache_path(path: Path, cache_dir: Union[str, Path], *parts: Hashable) -> Path:
+    """Return the cache location for the current version of the given file.
+
+    Arguments:
+        path: Source file.
+        cache_dir: Directory for cache files.
+        *parts: Additional key parts. Must have a stable repr.
+    Returns:
+        Path to the cache file (may not exist).
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    source = _digest((str(path), *parts))
+    content = _digest((__version__, stat.st_mtime_ns, stat.st_size))
+    return Path(cache_dir, f"{path.stem}-{source}-{content}.pickle")
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha1(repr(value).encode()).hexdigest()[:16]
+
+
+def load_cached(
+    path: Path,
+    loader: Callable[[Path], Any],
+    cache_dir: Union[str, Path],
+    *parts: Hashable,
+    logger: logging.Logger = None,
+) -> Any:
+    """Return cached value for the given file. Load and cache if stale.
+
+    Arguments:
+        path: Source file.
+        loader: Called with the path if the cache is missing or stale.
+        cache_dir: Directory for cache files.
+        *parts: Additional key parts. Must have a stable repr.
+        logger: Optional logger.
+    Returns:
+        The cached (or loaded) value.
+    """
+    logger = logger or LOGGER
+    cache_path = get_cache_path(path, cache_dir, *parts)
+    try:
+        with cache_path.open("rb") as stream:
+            return pickle.load(stream)
+    except FileNotFoundError:
+        ...  # load below
+    except Exception as err:
+        logger.warning("ignoring invalid cache: %s (%s)", cache_path, err)
+
+    value = loader(path)
+    save_cached(cache_path, value, logger=logger)
+    return value
+
+
+def save_cached(cache_path: Path, value: Any, logger: logging.Logger = None) -> bool:
+    """Write value to the given cache path and remove stale versions.
+
+    Caching is best-effort: failures are logged, never raised.
+
+    Arguments:
+        cache_path: Cache file location. See get_cache_path.
+        value: Thing to cache.
+        logger: Optional logger.
+    Returns:
+        True if cached.
+    """
+    logger = logger or LOGGER
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as stream:
+            pickle.dump(value, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)  # atomic; safe with concurrent readers
+    except Exception as err:
+        logger.warning("unable to cache: %s (%s)", cache_path, err)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            ...  # nothing to clean up, e.g., directory missing
+        return False
+
+    prefix = cache_path.name.rsplit("-", 1)[0]
+    try:
+        for stale in cache_path.parent.glob(f"{prefix}-*.pickle"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)  # may be removed by another process
+    except OSError as err:
+        logger.warning("unable to remove stale cache: %s (%s)", cache_path, err)
+    return True
+
+
+# __END__
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Compact Aliases
+^^^^^^^^^^^^^^^
+
+A CompactAlias stores the same lookup as an Alias in less memory, for use
+when holding many aliases, e.g., in a large AliasResolver.
+
+- No per-instance __dict__ (uses __slots__)
+- Lookup is a tuple of names; a frozenset only if there are many names
+- Equal sets of module-level transforms share one tuple
+- Identity and alias strings are interned
+- No logger and no tracking of lookup attempts
+
+>>> from rym.alias import AliasResolver, CompactAlias
+>>> x = CompactAlias('prd', aliases=['prod'])
+>>> x.identify('PROD')
+'prd'
+>>> x.all_names()
+['PRD', 'PROD', 'Prd', 'Prod', 'prd', 'prod']
+>>> AliasResolver.build(x, dev=['develop']).identify('prod')
+'prd'
+
+"""
+
+import logging
+import sys
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import variation
+from ._alias import Alias, AliasError, _default_transforms, resolve_variations
+from ._aliasresolver import _yield_aliases
+from .safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
+
+Lookup = Union[Tuple[Hashable, ...], FrozenSet[Hashable]]
+
+_SMALL_LOOKUP = 16  # a tuple scan is fast and much smaller than a set
+_TRANSFORMS: Dict[Tuple[Callable, ...], Tuple[Callable, ...]] = {}
+
+
+def _intern(value: Hashable) -> Hashable:
+    """Intern exact strings. Other values returned as is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _freeze(names: Iterable[Hashable]) -> Lookup:
+    """Return unique names as a tuple (few) or frozenset (many)."""
+    names = tuple(dict.fromkeys(names))
+    return names if len(names) <= _SMALL_LOOKUP else frozenset(names)
+
+
+def _share_transforms(value: Iterable[Callable]) -> Tuple[Callable, ...]:
+    """Return one shared tuple for each distinct sequence of transforms.
+
+    Only tuples of module-level transforms are shared. Others, e.g.,
+    lambdas, are returned as is so that they are not kept alive forever.
+    """
+    value = tuple(value)
+    if not all(_is_static(x) for x in value):
+        return value
+    return _TRANSFORMS.setdefault(value, value)
+
+
+def _is_static(func: Callable) -> bool:
+    """Return true if the transform lives as long as its module or class."""
+    owner = getattr(func, "__self__", None)
+    if owner is not None and not isinstance(owner, (type, types.ModuleType)):
+        return False  # bound to an instance
+    name = getattr(func, "__qualname__", None)
+    return isinstance(name, str) and "<" not in name  # e.g., <lambda>, <locals>
+
+
+class CompactAlias:
+    """Memory-compact Alias.
+
+    NOTE: Transform failures are never raised (same as Alias, strict=False).
+    NOTE: Lookup attempts are not tracked.
+
+    Attributes:
+        identity: The "true name" of the alias.
+        aliases: Tuple of names to alias.
+        transforms: Tuple of functions to apply to each alias.
+            Default: Upper and lower case of each alias.
+        casefold: If true, store and match casefolded names only.
+    """
+
+    __slots__ = ("identity", "aliases", "transforms", "casefold", "_lookup")
+
+    def __init__(
+        self,
+        identity: Hashable,
+        aliases: Optional[Iterable[Hashable]] = None,
+        transforms: Any = _DEFAULT,
+        casefold: bool = False,
+    ) -> None:
+        if isinstance(aliases, str):
+            aliases = [aliases]  # support single alias
+        if _DEFAULT == transforms:
+            transforms = _default_transforms()
+        self.identity = _intern(identity)
+        self.aliases = tuple(_intern(x) for x in aliases or [])
+        self.transforms = _share_transforms(resolve_variations(transforms))
+        self.casefold = casefold
+        self._lookup = self._build_lookup(self.transforms)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactAlias):
+            return NotImplemented
+        return (
+            self.identity == other.identity
+            and self.aliases == other.aliases
+            and self.transforms == other.transforms
+            and self.casefold == other.casefold
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(identity={self.identity!r},"
+            f" aliases={list(self.aliases)!r}, transforms={list(self.transforms)!r})"
+        )
+
+    @classmethod
+    def clone(cls, alias: Alias) -> "CompactAlias":
+        """Return a compact copy of the given alias."""
+        return cls(
+            alias.identity,
+            alias.aliases,
+            transforms=alias.transforms,
+            casefold=alias.casefold,
+        )
+
+    @property
+    def names(self) -> Iterable[Hashable]:
+        return [self.identity, *self.aliases]
+
+    def _build_lookup(
+        self,
+        transforms: Iterable[Callable],
+        names: Optional[Iterable[Hashable]] = None,
+    ) -> Lookup:
+        """Return lookup for the given names (default: all) and transformed names."""
+        opts = self.names if names is None else list(names)
+        found = [k for k, _ in Alias._yield_lookup(opts, transforms, strict=False)]
+        if self.casefold:
+            return _freeze(map(variation.casefold, [*opts, *found]))
+        return _freeze([*opts, *found])
+
+    def _set_lookup(self, names: Iterable[Hashable], transforms: Iterable[Callable]):
+        """Replace lookup with the given names, already transformed and folded."""
+        self._lookup = _freeze(names)
+        self.transforms = _share_transforms(transforms)
+
+    def add_alias(self, value: Hashable) -> None:
+        """Add given alias to lookup, including transformed names."""
+        if value in self.aliases:
+            LOGGER.warning("existing alias: %s", value)
+            return  # do not add more than once
+        names = self._build_lookup(self.transforms, [value])
+        self._lookup = _freeze([*self._lookup, *names])
+        self.aliases = (*self.aliases, _intern(value))
+
+    def remove_alias(self, value: Hashable) -> None:
+        """Remove given alias from lookup, including transformed names.
+
+        Raises:
+            AliasError (KeyError) if unknown alias given.
+        """
+        if value not in self.aliases:
+            raise AliasError(value)
+        aliases = list(self.aliases)
+        aliases.remove(value)
+        self.aliases = tuple(aliases)
+        self._lookup = self._build_lookup(self.transforms)
+
+    def discard(self, value: Hashable) -> None:
+        """Remove given alias if present. See remove_alias."""
+        if value in self.aliases:
+            self.remove_alias(value)
+
+    def add_transform(self, value: Callable[[str], str]) -> None:
+        """Add given transform and update alias lookup."""
+        for func in resolve_variations(value):
+            if func in self.transforms:
+                LOGGER.warning("existing transform: %s", func)
+                return  # do not add more than once
+            self._lookup = _freeze([*self._lookup, *self._build_lookup([func])])
+            self.transforms = _share_transforms([*self.transforms, func])
+
+    def all_names(
+        self,
+        _sorted: Optional[Callable] = None,
+        **kwargs,
+    ) -> Iterable[str]:
+        """Return all known aliases and transformations.
+
+        Arguments:
+            _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
+            **kwargs: Keywords for "sorted".
+        """
+        _sorted = _sorted or safesorted
+        return _sorted(self._lookup, **kwargs)
+
+    def identify(self, value: Hashable) -> Hashable:
+        """Return identity for the given alias value.
+
+        Raises:
+            AliasError (KeyError) if unknown alias given.
+        """
+        if self.casefold:
+            value = variation.casefold(value)
+        if value in self._lookup:
+            return self.identity
+        raise AliasError(value)
+
+    def set_casefold(self, value: bool) -> None:
+        """Enable or disable casefolded lookup and update lookup."""
+        if value == self.casefold:
+            return  # EARLY EXIT: lookup is already up to date
+        self.casefold = value
+        self._lookup = self._build_lookup(self.transforms)
+
+    def set_transforms(self, value: Iterable[Callable[[str], str]]) -> None:
+        """Replace current transforms and update lookup."""
+        value = _share_transforms(resolve_variations(value))
+        if value == self.transforms:
+            return  # EARLY EXIT: lookup is already up to date
+        self._lookup = self._build_lookup(value)
+        self.transforms = value
+
+
+@_yield_aliases.register(CompactAlias)
+def _(value: CompactAlias, **options) -> Generator[CompactAlias, None, None]:
+    yield value
+
+
+# __END__
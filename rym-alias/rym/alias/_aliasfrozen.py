@@ -2,10 +2,11 @@
 
 import dataclasses as dcs
 import logging
-from typing import Callable, Hashable, Iterable, Optional
+from typing import Callable, FrozenSet, Hashable, Iterable, Optional, Tuple
 
 from rym.alias.safesort import safesorted
 
+from . import variation
 from ._alias import Alias, AliasError
 
 LOGGER = logging.getLogger(__name__)
@@ -16,7 +17,18 @@ class FrozenAlias:
     """Hashable Alias."""
 
     identity: Hashable
-    _lookup: Iterable[Hashable] = dcs.field(repr=False)
+    _lookup: FrozenSet[Hashable] = dcs.field(repr=False)
+    casefold: bool = False
+    _sorted_names: Optional[Tuple[Hashable, ...]] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        # support O(1) membership
+        object.__setattr__(self, "_lookup", frozenset(self._lookup))
 
     @classmethod
     def build(cls, *args, **kwargs) -> "FrozenAlias":
@@ -25,7 +37,13 @@ class FrozenAlias:
 
     @classmethod
     def clone(cls, alias: Alias) -> "FrozenAlias":
-        return cls(identity=alias.identity, _lookup=tuple(alias.all_names()))
+        lazy = getattr(alias, "lazy", False)  # see Alias.lazy
+        lookup = alias._expand_lookup() if lazy else alias._lookup
+        return cls(
+            identity=alias.identity,
+            _lookup=frozenset(lookup),
+            casefold=alias.casefold,
+        )
 
     def all_names(
         self,
@@ -34,14 +52,23 @@ class FrozenAlias:
     ) -> Iterable[str]:
         """Return all known aliases and transformations.
 
+        NOTE: The default sort order is computed once.
+
         Arguments:
             _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
             **kwargs: Keywords for "sorted".
         """
+        if not (_sorted or kwargs):
+            if self._sorted_names is None:
+                names = tuple(safesorted(self._lookup))
+                object.__setattr__(self, "_sorted_names", names)
+            return list(self._sorted_names)
         _sorted = _sorted or safesorted
         return _sorted(self._lookup, **kwargs)
 
     def identify(self, value: Hashable) -> Hashable:
+        if self.casefold:
+            value = variation.casefold(value)
         if value in self._lookup:
             return self.identity
         raise AliasError(value)
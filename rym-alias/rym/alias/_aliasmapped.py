@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Share a Resolver Between Processes
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Dump a resolver's lookup to a file once. Each process can then open it
+without parsing or transforming anything. The file is memory-mapped, so
+processes on the same host share the same physical pages.
+
+>>> import tempfile
+>>> from pathlib import Path
+>>> from rym.alias import AliasResolver
+>>> tmpdir = tempfile.TemporaryDirectory()
+>>> path = Path(tmpdir.name, 'aliases.rym')
+>>> AliasResolver.build(prd=['prod'], dev=['develop']).dump(path)
+>>> with AliasResolver.open(path) as x:
+...     x.identify('PROD')
+'prd'
+>>> tmpdir.cleanup()
+
+File Layout
+-----------
+
+All integers are little-endian.
+
+- header (see _HEADER)
+- slots: open-addressing hash table of string names (linear probing)
+    Each slot is (name offset, name length, identity index).
+- identities: (offset, length) of each encoded identity
+- arena: UTF-8 names and encoded identities
+- extra: pickled mapping of non-string names to identity index
+
+Encoded identities start with a type tag: "s" for UTF-8 strings and "p"
+for pickles.
+
+NOTE: Identities and non-string names are pickles. Only open files you trust.
+
+"""
+
+import logging
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, Union
+
+from . import variation
+from ._alias import AliasError, identify_many
+from .safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
+
+_MAGIC = b"RYMALIAS"
+_VERSION = 1
+_CASEFOLD = 1  # flag
+_EMPTY = 0xFFFFFFFF  # identity index of an empty slot
+
+# magic, version, flags, slots, names, identities, and section offsets
+_HEADER = struct.Struct("<8sIIQQQQQQQ")
+_SLOT = struct.Struct("<QII")  # name offset, name length, identity index
+_IDENTITY = struct.Struct("<QI")  # offset, length
+
+
+def _hash(value: bytes) -> int:
+    return zlib.crc32(value)
+
+
+def _encode_identity(value: Hashable) -> bytes:
+    if type(value) is str:
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    return b"p" + pickle.dumps(value)
+
+
+def _decode_identity(value: bytes) -> Hashable:
+    if value[:1] == b"s":
+        return value[1:].decode("utf-8", "surrogatepass")
+    return pickle.loads(value[1:])
+
+
+def dump_lookup(
+    path: Union[str, Path],
+    lookup: Mapping[Hashable, int],
+    identities: Iterable[Hashable],
+    casefold: bool = False,
+) -> None:
+    """Write the given lookup to a file for use with MappedAliasResolver.
+
+    Arguments:
+        path: Destination. Replaced atomically.
+        lookup: Mapping of each name to its identity index.
+        identities: Identity for each index.
+        casefold: If true, names are casefolded and queries are folded.
+    Returns:
+        None
+    """
+    names = {}  # encoded string name: identity index
+    extra = {}  # any other name: identity index
+    for name, idx in lookup.items():
+        if isinstance(name, str):
+            names[name.encode("utf-8", "surrogatepass")] = idx
+        else:
+            extra[name] = idx
+
+    n_slots = 8
+    while n_slots < 2 * len(names):  # keep load factor at or below 0.5
+        n_slots *= 2
+    mask = n_slots - 1
+
+    arena = bytearray()
+    slots = [(0, 0, _EMPTY)] * n_slots
+    for name, idx in names.items():
+        i = _hash(name) & mask
+        while slots[i][2] != _EMPTY:
+            i = (i + 1) & mask
+        slots[i] = (len(arena), len(name), idx)
+        arena += name
+
+    table = bytearray()
+    for identity in identities:
+        encoded = _encode_identity(identity)
+        table += _IDENTITY.pack(len(arena), len(encoded))
+        arena += encoded
+    n_identities = len(table) // _IDENTITY.size
+
+    slots_offset = _HEADER.size
+    table_offset = slots_offset + n_slots * _SLOT.size
+    arena_offset = table_offset + len(table)
+    extra_offset = arena_offset + len(arena)
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        _CASEFOLD if casefold else 0,
+        n_slots,
+        len(names),
+        n_identities,
+        slots_offset,
+        table_offset,
+        arena_offset,
+        extra_offset,
+    )
+
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as stream:
+            stream.write(header)
+            stream.write(b"".join(_SLOT.pack(*x) for x in slots))
+            stream.write(table)
+            stream.write(arena)
+            pickle.dump(extra, stream)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class MappedAliasResolver:
+    """Read-only resolver backed by a memory-mapped lookup file.
+
+    Opening the file reads only the header and non-string names. Names are
+    found by hashing into the mapped table. Identities are decoded when
+    first matched.
+
+    NOTE: Lookup attempts are not tracked.
+
+    Attributes:
+        path: Lookup file. See dump_lookup.
+        casefold: If true, queries are casefolded.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_header()
+        except Exception:
+            self._mmap.close()
+            raise
+        self._identities = {}  # decoded identities by index
+
+    def _load_header(self) -> None:
+        (
+            magic,
+            version,
+            flags,
+            self._n_slots,
+            self._n_names,
+            self._n_identities,
+            self._slots_offset,
+            self._table_offset,
+            self._arena_offset,
+            extra_offset,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"invalid lookup file: {self.path}")
+        self.casefold = bool(flags & _CASEFOLD)
+        self._mask = self._n_slots - 1
+        self._extra = pickle.loads(self._mmap[extra_offset:])
+
+    def __enter__(self) -> "MappedAliasResolver":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n_names + len(self._extra)
+
+    def close(self) -> None:
+        """Unmap the lookup file."""
+        self._mmap.close()
+
+    def _find(self, value: Hashable) -> Optional[int]:
+        """Return identity index for the given name. None if unknown."""
+        if not isinstance(value, str):
+            try:
+                return self._extra.get(value)
+            except TypeError:
+                return None  # unhashable
+        key = value.encode("utf-8", "surrogatepass")
+        data = self._mmap
+        arena = self._arena_offset
+        slots = self._slots_offset
+        mask = self._mask
+        i = _hash(key) & mask
+        while True:
+            offset, size, idx = _SLOT.unpack_from(data, slots + i * _SLOT.size)
+            if idx == _EMPTY:
+                return None
+            if size == len(key) and data[arena + offset : arena + offset + size] == key:
+                return idx
+            i = (i + 1) & mask
+
+    def _get_identity(self, idx: int) -> Hashable:
+        try:
+            return self._identities[idx]
+        except KeyError:
+            ...  # decode below
+        offset, size = _IDENTITY.unpack_from(
+            self._mmap, self._table_offset + idx * _IDENTITY.size
+        )
+        start = self._arena_offset + offset
+        identity = _decode_identity(self._mmap[start : start + size])
+        self._identities[idx] = identity
+        return identity
+
+    def all_names(self, _sorted: Optional[Callable] = None, **kwargs) -> Iterable[str]:
+        """Return all known aliases and transformations.
+
+        Arguments:
+            _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
+            **kwargs: Keywords for "sorted".
+        """
+        _sorted = _sorted or safesorted
+        data = self._mmap
+        arena = self._arena_offset
+        slots = self._slots_offset
+        names = list(self._extra)
+        for i in range(self._n_slots):
+            offset, size, idx = _SLOT.unpack_from(data, slots + i * _SLOT.size)
+            if idx != _EMPTY:
+                name = data[arena + offset : arena + offset + size]
+                names.append(name.decode("utf-8", "surrogatepass"))
+        return _sorted(names, **kwargs)
+
+    def identify(self, value: Hashable, default: Any = _DEFAULT) -> Hashable:
+        """Return identity for the given alias value.
+
+        Arguments:
+            value: Alias to match.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            Identity for the given alias.
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        if self.casefold:
+            value = variation.casefold(value)
+        idx = self._find(value)
+        if idx is not None:
+            return self._get_identity(idx)
+        if _DEFAULT != default:
+            return default
+        raise AliasError(value)
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values.
+
+        Arguments:
+            values: Aliases to match. May be a numpy array.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            List of identities (or array, if given an array).
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        return identify_many(values, self._identify_unique, default=default)
+
+    def _identify_unique(self, counts: Mapping[Hashable, int], default: Any) -> dict:
+        """Return identity for each counted value."""
+        return {value: self.identify(value, default) for value in counts}
+
+
+# __END__
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Compile a Static AliasResolver
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A PerfectHashResolver is a read-only snapshot of an AliasResolver that
+places every name in its own slot of a minimal perfect hash table
+(hash-and-displace). A lookup takes at most two hashes and one key
+comparison, and the table uses less memory than a dict.
+
+>>> from rym.alias import AliasResolver
+>>> x = AliasResolver.build(prd=['prod'], dev=['develop']).compile()
+>>> x.identify('PROD')
+'prd'
+>>> x.identify('nope', None) is None
+True
+
+Algorithm
+---------
+
+Names are grouped into buckets by hash. Buckets with several names are
+placed first, largest first: each tries displacements 1, 2, ... until every
+name in the bucket hashes to a free slot. Single names then take the
+remaining free slots directly. The bucket table stores the displacement,
+or -(slot + 1) for a directly placed name.
+
+NOTE: Python hashes strings with a per-process seed, so the table is
+    compiled in the process that uses it. A pickled resolver is compiled
+    again when loaded.
+NOTE: A CPython dict lookup is implemented in C and is still faster. Use
+    AliasResolver.compile(perfect=False) for small, hot resolvers.
+
+"""
+
+import logging
+from array import array
+from collections import defaultdict
+from typing import Any, Callable, Generator, Hashable, Iterable, Mapping, Optional
+
+from . import variation
+from ._alias import Alias, AliasError, identify_many
+from ._aliasresolver import AliasResolver, _yield_aliases
+from .safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
+
+
+def _slot(displacement: int, hashed: int, size: int) -> int:
+    return hash((displacement, hashed)) % size
+
+
+def build_perfect_hash(hashes: Iterable[int]) -> "array[int]":
+    """Return bucket table that maps each of the given hashes to its own slot.
+
+    Arguments:
+        hashes: Unique hash values.
+    Returns:
+        Bucket table with one entry per hash. See PerfectHashResolver.slot.
+    """
+    hashes = list(hashes)
+    size = len(hashes)
+    buckets = defaultdict(list)
+    for hashed in hashes:
+        buckets[hashed % size].append(hashed)
+
+    table = array("q", bytes(8 * size))
+    used = bytearray(size)
+    singles = []
+    for idx, hashes in sorted(buckets.items(), key=lambda x: -len(x[1])):
+        if len(hashes) == 1:
+            singles.append((idx, hashes[0]))
+            continue
+        displacement = 1
+        while True:
+            slots = {_slot(displacement, h, size) for h in hashes}
+            if len(slots) == len(hashes) and not any(used[i] for i in slots):
+                break
+            displacement += 1
+        table[idx] = displacement
+        for i in slots:
+            used[i] = 1
+
+    free = (i for i, x in enumerate(used) if not x)
+    for idx, _ in singles:
+        table[idx] = -next(free) - 1
+    return table
+
+
+class PerfectHashResolver:
+    """Read-only resolver compiled into a minimal perfect hash table.
+
+    NOTE: Lookup attempts are not tracked.
+
+    Attributes:
+        casefold: If true, queries are casefolded.
+    """
+
+    __slots__ = ("casefold", "_identities", "_keys", "_overflow", "_table", "_values")
+
+    def __init__(
+        self,
+        lookup: Mapping[Hashable, int],
+        identities: Iterable[Hashable],
+        casefold: bool = False,
+    ) -> None:
+        """Compile the given lookup.
+
+        Arguments:
+            lookup: Mapping of each name to its identity index.
+            identities: Identity for each index.
+            casefold: If true, names are casefolded and queries are folded.
+        """
+        self.casefold = casefold
+        self._identities = list(identities)
+        main = {}  # hash: (key, identity index)
+        self._overflow = {}  # keys with the same hash as another key (rare)
+        for key, idx in lookup.items():
+            hashed = hash(key)
+            if hashed in main:
+                self._overflow[key] = idx
+            else:
+                main[hashed] = (key, idx)
+
+        self._table = build_perfect_hash(main)
+        self._keys = [None] * len(main)
+        self._values = array("I", bytes(4 * len(main)))
+        for hashed, (key, idx) in main.items():
+            slot = self.slot(key)
+            self._keys[slot] = key
+            self._values[slot] = idx
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._overflow)
+
+    def __reduce__(self) -> tuple:
+        # the table depends on the hash seed; compile again when loaded
+        lookup = dict(zip(self._keys, self._values))
+        lookup.update(self._overflow)
+        return (type(self), (lookup, self._identities, self.casefold))
+
+    @classmethod
+    def compile(cls, resolver: AliasResolver) -> "PerfectHashResolver":
+        """Return a compiled snapshot of the given resolver."""
+        identities = [None if x is None else x.identity for x in resolver.aliases]
+        lookup = resolver._expand_lookup()
+        return cls(lookup, identities, casefold=resolver.casefold)
+
+    def slot(self, value: Hashable) -> int:
+        """Return the table slot for the given value.
+
+        NOTE: Any value maps to a slot. Compare the key stored in the slot.
+        Raises:
+            TypeError if unhashable value given.
+        """
+        hashed = hash(value)
+        size = len(self._table)
+        displacement = self._table[hashed % size]
+        if displacement < 0:
+            return -displacement - 1
+        return hash((displacement, hashed)) % size
+
+    def all_names(
+        self,
+        _sorted: Optional[Callable] = None,
+        **kwargs,
+    ) -> Iterable[str]:
+        """Return all known aliases and transformations.
+
+        Arguments:
+            _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
+            **kwargs: Keywords for "sorted".
+        """
+        _sorted = _sorted or safesorted
+        return _sorted([*self._keys, *self._overflow], **kwargs)
+
+    def identify(self, value: Hashable, default: Any = _DEFAULT) -> Hashable:
+        """Return identity for the given alias value.
+
+        Arguments:
+            value: Alias to match.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            Identity for the given alias.
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        if self.casefold:
+            value = variation.casefold(value)
+        table = self._table
+        if table:
+            # inline self.slot: this is the hot path
+            hashed = hash(value)
+            size = len(table)
+            displacement = table[hashed % size]
+            if displacement < 0:
+                slot = -displacement - 1
+            else:
+                slot = hash((displacement, hashed)) % size
+            key = self._keys[slot]
+            if key is value or key == value:
+                return self._identities[self._values[slot]]
+        if self._overflow and value in self._overflow:
+            return self._identities[self._overflow[value]]
+        if _DEFAULT != default:
+            return default
+        raise AliasError(value)
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values.
+
+        Arguments:
+            values: Aliases to match. May be a numpy array.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            List of identities (or array, if given an array).
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        return identify_many(values, self._identify_unique, default=default)
+
+    def _identify_unique(self, counts: Mapping[Hashable, int], default: Any) -> dict:
+        """Return identity for each counted value."""
+        return {value: self.identify(value, default) for value in counts}
+
+
+@_yield_aliases.register(PerfectHashResolver)
+def _(value: PerfectHashResolver, **options) -> Generator[Alias, None, None]:
+    names = defaultdict(list)
+    for key, idx in zip(value._keys, value._values):
+        names[idx].append(key)
+    for key, idx in value._overflow.items():
+        names[idx].append(key)
+    for idx, aliases in names.items():
+        yield Alias(
+            value._identities[idx],
+            aliases,
+            transforms=None,
+            casefold=value.casefold,
+        )
+
+
+# __END__
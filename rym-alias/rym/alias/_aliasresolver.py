@@ -29,18 +29,54 @@ AliasResolver(aliases=[...])
 
 """
 
+import copy
 import dataclasses as dcs
+import heapq
 import itertools
 import json
 import logging
-from collections import ChainMap, abc, defaultdict
-from functools import singledispatch
+import os
+from collections import abc
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, singledispatch
 from pathlib import Path
-from pprint import pformat
-from typing import Any, Callable, Generator, Iterable, Mapping, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 
-from ._alias import Alias, AliasError
+from . import variation
+from ._alias import (
+    Alias,
+    AliasError,
+    expand_lookup_many,
+    fold_counts,
+    identify_many,
+    resolve_variations,
+    set_transforms_many,
+)
+from ._aliascache import load_cached
 from ._aliasfrozen import FrozenAlias
+from ._aliasmapped import MappedAliasResolver, dump_lookup
+from ._frontcache import FrontCache
+from ._fuzzy import BKTree
+from ._lazy import VariantIndex, split_transforms
+from ._prefix import PrefixIndex
+from ._tracking import resolve_tracker
+from ._transformcache import CacheInfo
+from ._usage import UsageReport, build_usage_report
+from .safesort import safesorted
 
 
 def _load_pkg(names: Iterable[str]):
@@ -72,6 +108,8 @@ yaml = _load_pkg(["yaml"])
 
 LOGGER = logging.getLogger(__name__)
 _DEFAULT = __file__
+_TRANSFORM_CHUNK_SIZE = 1024
+_SHARDS_PER_WORKER = 4  # smaller shards balance uneven work
 
 
 class CollisionError(ValueError):
@@ -80,26 +118,105 @@ class CollisionError(ValueError):
 
 @dcs.dataclass
 class AliasResolver:
-    """Group of aliases."""
+    """Group of aliases.
+
+    Attributes:
+        aliases: Aliases to resolve.
+        tracking: How to count lookup attempts, e.g., "exact" (default),
+            "sampled", "topk", or "off". See rym.alias.resolve_tracker.
+        casefold: If true, index and match casefolded names only.
+            Added aliases are casefolded copies. See Alias.casefold.
+        lazy: If true, added aliases find transformed names on demand
+            instead of storing them. See Alias.lazy.
+        front_cache: Optional number of recent queries to map directly to
+            their identity in `identify`. Helps most when queries are folded
+            (casefold); a plain lookup is already one dict access.
+            See rym.alias._frontcache.
+
+    NOTE: A removed alias leaves None in `aliases` (a tombstone) so other
+        positions do not change. See remove_identity and compact.
+    """
 
     aliases: Iterable[Alias]
     logger: logging.Logger = dcs.field(
         default=None, repr=False, hash=False, compare=False
     )
+    tracking: Any = dcs.field(default="exact", repr=False, hash=False, compare=False)
+    casefold: bool = dcs.field(default=False, repr=False)
+    lazy: bool = dcs.field(default=False, repr=False)
+    front_cache: int = dcs.field(default=0, repr=False)
     _lookup: Mapping[str, int] = dcs.field(init=False, repr=False)
+    _identities: Dict[Hashable, List[int]] = dcs.field(
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
     _attempts: Mapping[str, int] = dcs.field(
         init=False,
         repr=False,
         hash=False,
         compare=False,
     )
+    _fuzzy: Optional[BKTree] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
+    _prefix: Optional[PrefixIndex] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
+    _variants: Optional[VariantIndex] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
+    _front: Optional[FrontCache] = dcs.field(
+        default=None,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
+    _tombstones: int = dcs.field(
+        default=0,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
+    _casefolded: bool = dcs.field(
+        default=False,
+        init=False,
+        repr=False,
+        hash=False,
+        compare=False,
+    )
 
     def __post_init__(self):
         self.logger = self.logger or LOGGER
+        self._front = FrontCache(self.front_cache) if self.front_cache else None
 
         # setup alias internal data
         self._build_lookup_index()
 
+    def __contains__(self, value: Hashable) -> bool:
+        """Return true if the given name is known. Does not count an attempt."""
+        key = variation.casefold(value) if self.casefold else value
+        if key in self._lookup:
+            return True
+        if self._variants is not None and self._variants.find(key) is not None:
+            return True
+        return self._casefolded and self._find_casefolded(key) is not None
+
     @classmethod
     def build(
         cls,
@@ -107,6 +224,12 @@ class AliasResolver:
         strict: bool = True,
         transforms: Optional[Iterable[Callable[[str], str]]] = _DEFAULT,
         logger: logging.Logger = None,
+        tracking: Any = "exact",
+        casefold: bool = False,
+        lazy: bool = False,
+        front_cache: int = 0,
+        cache: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None,
         _resolver: Callable = None,
         **kwargs,
     ) -> "AliasResolver":
@@ -118,6 +241,15 @@ class AliasResolver:
             transforms: Optional transforms to apply to all aliases.
                 If given, will replace existing transforms on each alias.
                 Use 'None' to disable all transformations
+            tracking: How to count lookup attempts. See resolve_tracker.
+            casefold: If true, index and match casefolded names only.
+            lazy: If true, find transformed names on demand. See Alias.lazy.
+            front_cache: Optional number of recent queries to cache.
+            cache: Optional directory to cache aliases loaded from file paths.
+                Cached aliases are reused while the file and transforms are
+                unchanged. See rym.alias._aliascache.
+            workers: Optional number of processes to build aliases with.
+                See resolve_aliases_parallel.
             _resolver: Inject an alias factory.
             **kwargs: Supported formats as keyword arguments
         Returns:
@@ -126,15 +258,266 @@ class AliasResolver:
             alias_factory
         """
         _resolver = _resolver or resolve_aliases
-        aliases = _resolver(*args, transforms=transforms, **kwargs)
-        instance = cls(aliases=[], logger=logger)
-        instance.add(aliases, strict=strict)
-        return instance
+        if cache:
+            args = [
+                (
+                    _load_cached_aliases(x, transforms, cache, logger=logger)
+                    if isinstance(x, Path)
+                    else x
+                )
+                for x in args
+            ]
+        if workers and workers > 1 and _resolver is resolve_aliases:
+            aliases, collisions = _resolve_shards(
+                args,
+                kwargs,
+                transforms=transforms,
+                workers=workers,
+                logger=logger,
+                casefold=casefold,
+                lazy=lazy,
+            )
+        else:
+            aliases = _resolver(*args, transforms=transforms, **kwargs)
+            collisions = None  # check here
+        instance = cls(
+            aliases=[],
+            logger=logger,
+            tracking=tracking,
+            casefold=casefold,
+            lazy=lazy,
+            front_cache=front_cache,
+        )
+        return instance._add_aliases(aliases, strict=strict, collisions=collisions)
 
     def _build_lookup_index(self) -> None:
         """Index alias lookup."""
-        self._lookup = {k: i for i, x in enumerate(self.aliases) for k in x.all_names()}
-        self._attempts = defaultdict(int, {k: 0 for k in self._lookup.keys()})
+        self._lookup = {}
+        self._identities = {}
+        self._attempts = resolve_tracker(self.tracking)
+        self._fuzzy = None  # build on demand
+        self._prefix = None  # build on demand
+        self._variants = None  # build when a lazy alias is added
+        self._casefolded = False  # set when a casefolded alias is added
+        if self._front is not None:
+            self._front.invalidate()
+        self._update_lookup_index(self.aliases, offset=0)
+
+    def _update_lookup_index(self, aliases: Iterable[Alias], offset: int) -> None:
+        """Add the given aliases to the existing lookup index.
+
+        NOTE: Later aliases win on collision, same as a full rebuild.
+
+        Arguments:
+            aliases: Aliases to index.
+            offset: Position of the first given alias in self.aliases.
+        Returns:
+            None.
+        """
+        identities = self._identities
+        for i, alias in enumerate(aliases, offset):
+            if alias is None:
+                continue  # tombstone
+            identities.setdefault(alias.identity, []).append(i)
+            if alias.casefold and not self.casefold:
+                self._casefolded = True  # see _find_casefolded
+            self._index_names(alias._lookup, i)
+            self._index_variants(alias, i)
+
+    def _index_names(self, names: Iterable[Hashable], idx: int) -> None:
+        """Point the given names at the alias at the given position.
+
+        Arguments:
+            names: Names to index. Casefolded here if needed.
+            idx: Position of the alias in self.aliases.
+        Returns:
+            None.
+        """
+        if self.casefold:
+            names = [variation.casefold(k) for k in names]
+        self._lookup.update(dict.fromkeys(names, idx))
+        if self._attempts is not None:
+            self._attempts.register(names)
+        if self._fuzzy is not None:
+            self._fuzzy.update(names)
+        if self._prefix is not None:
+            self._prefix.update(names)
+
+    def _unindex_names(self, names: Iterable[Hashable], idx: int) -> None:
+        """Remove the given names of the alias at the given position.
+
+        Names that point at another alias (e.g., after a collision) are
+        kept. Fuzzy and prefix indexes skip removed names on search.
+
+        Arguments:
+            names: Names to remove. Casefolded here if needed.
+            idx: Position of the alias in self.aliases.
+        Returns:
+            None.
+        """
+        if self.casefold:
+            names = [variation.casefold(k) for k in names]
+        lookup = self._lookup
+        attempts = self._attempts
+        for key in names:
+            if lookup.get(key) == idx:
+                del lookup[key]
+                if attempts is not None:
+                    attempts.pop(key, None)
+
+    def _index_variants(
+        self,
+        alias: Alias,
+        idx: int,
+        names: Optional[Iterable[Hashable]] = None,
+    ) -> None:
+        """Index names the given alias finds on demand. See Alias.lazy.
+
+        Arguments:
+            alias: Alias at the given position.
+            idx: Position of the alias in self.aliases.
+            names: Raw names to index. Default: all names of the alias.
+        Returns:
+            None.
+        """
+        if not getattr(alias, "lazy", False):
+            return  # EARLY EXIT: every name is stored
+        if self._variants is None:
+            self._variants = VariantIndex(variation.casefold if self.casefold else None)
+        names = alias.names if names is None else names
+        self._variants.add(names, alias.transforms, idx)
+        if self._fuzzy is None and self._prefix is None:
+            return  # EARLY EXIT: no search index to update
+        variants = self._yield_variants(alias, names)
+        if self._fuzzy is not None:
+            self._fuzzy.update(variants)
+        if self._prefix is not None:
+            self._prefix.update(variants)
+
+    def _yield_variants(
+        self,
+        alias: Alias,
+        names: Optional[Iterable[Hashable]] = None,
+    ) -> Iterable[Hashable]:
+        """Return the given names of a lazy alias with names found on demand.
+
+        Arguments:
+            alias: A lazy alias. See Alias.lazy.
+            names: Raw names to expand. Default: all names of the alias.
+        Returns:
+            Names, casefolded here if needed.
+        """
+        if names is None:
+            found = alias._expand_lookup()
+        else:
+            _, lazy = split_transforms(alias.transforms)
+            found = alias._build_lookup(lazy, names, expand=True)
+        if self.casefold:
+            return [variation.casefold(k) for k in found]
+        return found
+
+    def _find_casefolded(self, key: Hashable) -> Optional[int]:
+        """Return position of a casefolded alias with the given name, if any.
+
+        Casefolded aliases store casefolded names only. If self does not
+        casefold queries, a missed query is folded and matched against
+        casefolded aliases only.
+
+        Arguments:
+            key: Name that did not match as given.
+        Returns:
+            Position of the alias in self.aliases or None.
+        """
+        folded = variation.casefold(key)
+        idx = self._lookup.get(folded)
+        if idx is None and self._variants is not None:
+            idx = self._variants.find(folded)  # see Alias.lazy
+        if idx is None or not self.aliases[idx].casefold:
+            return None
+        return idx
+
+    def _expand_lookup(self) -> Mapping[Hashable, int]:
+        """Return lookup, including names that lazy aliases find on demand."""
+        lazy = [i for i, x in enumerate(self.aliases) if getattr(x, "lazy", False)]
+        if not lazy:
+            return self._lookup
+        lookup = {}
+        for idx in lazy:
+            lookup.update(dict.fromkeys(self._yield_variants(self.aliases[idx]), idx))
+        lookup.update(self._lookup)  # stored names win
+        return lookup
+
+    def _find_identity(self, identity: Hashable) -> int:
+        """Return position of the alias with the given identity.
+
+        NOTE: Later aliases win if an identity is used more than once.
+
+        Raises:
+            AliasError (KeyError) if unknown identity.
+        """
+        return self._find_identities(identity)[-1]
+
+    def _find_identities(self, identity: Hashable) -> List[int]:
+        """Return positions of every alias with the given identity, in order.
+
+        Raises:
+            AliasError (KeyError) if unknown identity.
+        """
+        try:
+            return self._identities[identity]
+        except (KeyError, TypeError):
+            raise AliasError(identity) from None
+
+    def alias_of(self, identity: Hashable) -> Alias:
+        """Return the alias with the given identity.
+
+        Raises:
+            AliasError (KeyError) if unknown identity.
+        """
+        return self.aliases[self._find_identity(identity)]
+
+    def names_of(self, identity: Hashable) -> Iterable[Hashable]:
+        """Return stored names of the given identity, unsorted.
+
+        Unlike Alias.all_names, nothing is copied or sorted. Names lost to a
+        later alias on collision are included; see validate.
+
+        Arguments:
+            identity: Identity of the alias.
+        Returns:
+            Read-only collection of names, in insertion order.
+        Raises:
+            AliasError (KeyError) if unknown identity.
+        """
+        names = self.alias_of(identity)._lookup
+        return names.keys() if isinstance(names, dict) else names
+
+    def _find_index_collisions(self, aliases: Iterable[Alias]) -> Iterable[str]:
+        """Check given aliases for collisions with the index or each other.
+
+        Only the names of the given aliases are checked, so the cost is
+        proportional to the new aliases rather than everything indexed.
+        Names that lazy aliases find on demand are checked, too: new names
+        are expanded, and indexed names are found by normalized key.
+
+        Arguments:
+            aliases: Aliases to check.
+        Returns:
+            Sorted list of colliding names.
+        """
+        fold = variation.casefold if self.casefold else None
+        lookup = self._lookup.keys()
+        variants = self._variants
+        seen = set()
+        collisions = set()
+        for keys in expand_lookup_many(aliases):
+            keys = set(map(fold, keys)) if fold else keys
+            if not (seen.isdisjoint(keys) and lookup.isdisjoint(keys)):
+                collisions.update(k for k in keys if k in seen or k in lookup)
+            if variants is not None:
+                collisions.update(k for k in keys if variants.find(k) is not None)
+            seen.update(keys)
+        return safesorted(collisions)
 
     def add(
         self,
@@ -147,7 +530,27 @@ class AliasResolver:
         """Add aliases to self."""
         _resolver = _resolver or resolve_aliases
         aliases = _resolver(*args, transforms=transforms, **kwargs)
-        collisions = self.find_collisions(self.aliases, aliases)
+        return self._add_aliases(aliases, strict=strict)
+
+    def _add_aliases(
+        self,
+        aliases: List[Alias],
+        strict: bool,
+        collisions: Optional[List[Hashable]] = None,
+    ) -> "AliasResolver":
+        """Add resolved aliases to self. See add.
+
+        Arguments:
+            aliases: Resolved aliases.
+            strict: If true, will raise if collisions detected.
+            collisions: Colliding names, if already known, e.g., merged from
+                shards built for an empty resolver. Checked here if not given.
+        Returns:
+            Self (support chaining).
+        """
+        aliases = self._prepare_aliases(aliases)
+        if collisions is None:
+            collisions = self._find_index_collisions(aliases)
         if not collisions:
             ...
         elif strict:
@@ -155,31 +558,380 @@ class AliasResolver:
         else:
             self.logger.warning("Collisions detected: %s", collisions)
 
+        offset = len(self.aliases)
         self.aliases.extend(aliases)
-        self._build_lookup_index()
+        self._update_lookup_index(aliases, offset)
+        if self._front is not None:
+            self._front.invalidate()  # added names may win a collision
+        return self  # support chaining
+
+    def _prepare_aliases(self, aliases: Iterable[Alias]) -> List[Alias]:
+        """Return the given aliases with the lazy and casefold settings of self.
+
+        Aliases are copied if changed, so aliases shared with the caller (or
+        another resolver) keep their settings.
+
+        Arguments:
+            aliases: Resolved aliases to add.
+        Returns:
+            List of aliases to add.
+        """
+        prepared = []
+        for alias in aliases:
+            changes = {}
+            if self.lazy and not getattr(alias, "lazy", True):
+                changes["lazy"] = True
+            if self.casefold and not getattr(alias, "casefold", True):
+                changes["casefold"] = True
+            if changes and isinstance(alias, Alias):
+                alias = dcs.replace(alias, aliases=list(alias.aliases), **changes)
+            elif changes:
+                alias = copy.copy(alias)  # e.g., CompactAlias shares no state
+                alias.set_casefold(True)
+            prepared.append(alias)
+        return prepared
+
+    def add_alias(
+        self,
+        identity: Hashable,
+        value: Hashable,
+        strict: bool = True,
+    ) -> "AliasResolver":
+        """Add a name (and its transformations) to an existing alias.
+
+        Arguments:
+            identity: Identity of the alias to update.
+            value: Name to add.
+            strict: If true, will raise if collisions detected.
+        Returns:
+            Self (support chaining).
+        Raises:
+            AliasError (KeyError) if unknown identity.
+            CollisionError if strict and the new names are already used.
+        """
+        idx = self._find_identity(identity)
+        alias = self.aliases[idx]
+        names = alias._build_lookup(alias.transforms, [value])
+        keys = (
+            alias._build_lookup(alias.transforms, [value], expand=True)
+            if getattr(alias, "lazy", False)
+            else names
+        )  # check names found on demand, too
+        if self.casefold:
+            keys = [variation.casefold(k) for k in keys]
+        lookup = self._lookup
+        variants = self._variants
+        collisions = safesorted(
+            k
+            for k in keys
+            if lookup.get(k, idx) != idx
+            or (variants is not None and variants.find(k) not in (None, idx))
+        )
+        if not collisions:
+            ...
+        elif strict:
+            raise CollisionError(collisions)
+        else:
+            self.logger.warning("Collisions detected: %s", collisions)
+
+        alias.add_alias(value)
+        self._index_names(names, idx)
+        self._index_variants(alias, idx, [value])
+        if self._front is not None:
+            self._front.invalidate()
+        return self  # support chaining
+
+    def remove_alias(self, identity: Hashable, value: Hashable) -> "AliasResolver":
+        """Remove a name (and its transformations) from an existing alias.
+
+        NOTE: Names the alias lost to a later alias on collision are kept,
+            and names it took from an earlier alias are not restored.
+
+        Arguments:
+            identity: Identity of the alias to update.
+            value: Name to remove.
+        Returns:
+            Self (support chaining).
+        Raises:
+            AliasError (KeyError) if unknown identity or alias.
+        """
+        idx = self._find_identity(identity)
+        alias = self.aliases[idx]
+        before = list(alias._lookup)
+        alias.remove_alias(value)
+        self._unindex_names(set(before).difference(alias._lookup), idx)
+        if self._variants is not None and getattr(alias, "lazy", False):
+            self._variants.discard([value], idx)
+        if self._front is not None:
+            self._front.invalidate()
+        return self  # support chaining
+
+    def remove_identity(self, identity: Hashable) -> "AliasResolver":
+        """Remove every alias with the given identity and all of their names.
+
+        Each alias is replaced by a tombstone, so no other alias moves.
+        Tombstones are compacted once they are half of `aliases`.
+
+        NOTE: Names the alias took from an earlier alias (of another
+            identity) on collision are not restored.
+
+        Arguments:
+            identity: Identity of the aliases to remove.
+        Returns:
+            Self (support chaining).
+        Raises:
+            AliasError (KeyError) if unknown identity.
+        """
+        positions = self._find_identities(identity)
+        for idx in positions:
+            alias = self.aliases[idx]
+            self._unindex_names(alias._lookup, idx)
+            if self._variants is not None and getattr(alias, "lazy", False):
+                self._variants.discard(alias.names, idx)
+            self.aliases[idx] = None
+        del self._identities[identity]
+        self._tombstones += len(positions)
+        if self._front is not None:
+            self._front.invalidate()
+        if 2 * self._tombstones > len(self.aliases):
+            self.compact()  # amortized: at most once per len(aliases) / 2
+        return self  # support chaining
+
+    def discard(self, identity: Hashable) -> "AliasResolver":
+        """Remove every alias with the given identity, if any."""
+        if identity in self._identities:
+            self.remove_identity(identity)
+        return self  # support chaining
+
+    def compact(self) -> "AliasResolver":
+        """Drop tombstones left by removed aliases and renumber the index.
+
+        Lookup attempts are kept. Fuzzy and prefix indexes are rebuilt on
+        demand without removed names.
+
+        Returns:
+            Self (support chaining).
+        """
+        if not self._tombstones:
+            return self  # EARLY EXIT: nothing to drop
+        position = {}  # old position: new position
+        kept = []
+        for i, alias in enumerate(self.aliases):
+            if alias is not None:
+                position[i] = len(kept)
+                kept.append(alias)
+        self.aliases[:] = kept
+        self._tombstones = 0
+        self._lookup = {k: position[i] for k, i in self._lookup.items()}
+        self._identities = {
+            k: [position[i] for i in v] for k, v in self._identities.items()
+        }
+        self._fuzzy = None  # build on demand
+        self._prefix = None  # build on demand
+        self._variants = None  # rebuild from lazy aliases
+        for i, alias in enumerate(kept):
+            self._index_variants(alias, i)
+        return self  # support chaining
+
+    def add_transform(self, value: Callable[[str], str]) -> "AliasResolver":
+        """Add the given transform to every alias and update the index.
+
+        NOTE: Later aliases win on collision. See validate.
+
+        Arguments:
+            value: Transform(s). See resolve_variations.
+        Returns:
+            Self (support chaining).
+        """
+        self.compact()
+        for alias in self.aliases:
+            alias.add_transform(value)
+        self._reindex()
         return self  # support chaining
 
+    def set_transforms(self, value: Any) -> "AliasResolver":
+        """Replace transforms on every alias and update the index.
+
+        NOTE: Later aliases win on collision. See validate.
+
+        Arguments:
+            value: Transforms. See resolve_variations. None to clear current.
+        Returns:
+            Self (support chaining).
+        """
+        self.compact()
+        set_transforms_many(self.aliases, value)
+        self._reindex()
+        return self  # support chaining
+
+    def _reindex(self) -> None:
+        """Rebuild the index from the current aliases. Keep attempts."""
+        attempts = self._attempts
+        self._build_lookup_index()
+        if attempts is not None:
+            attempts.register(self._lookup)
+            self._attempts = attempts
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write lookup to a file that can be shared via AliasResolver.open.
+
+        Only names and identities are written, not aliases or transforms.
+
+        Arguments:
+            path: Destination. Replaced atomically.
+        Returns:
+            None
+        """
+        self.compact()  # do not write tombstones
+        identities = [x.identity for x in self.aliases]
+        lookup = self._expand_lookup()
+        dump_lookup(path, lookup, identities, casefold=self.casefold)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> MappedAliasResolver:
+        """Return a read-only resolver for a file written by AliasResolver.dump.
+
+        The file is memory-mapped, not parsed, so opening is fast and the
+        pages are shared by every process that opens it.
+
+        Arguments:
+            path: Lookup file.
+        Returns:
+            A MappedAliasResolver instance. Close when done.
+        """
+        return MappedAliasResolver(path)
+
+    def compile(self, perfect: bool = True) -> Any:
+        """Return a read-only snapshot for resolvers that no longer change.
+
+        Arguments:
+            perfect: If true, compile into a minimal perfect hash table, which
+                uses less memory and bounds the work per lookup. Otherwise,
+                copy into a dict of name to identity, which is faster to
+                query in CPython (no tracking and no alias indirection).
+        Returns:
+            A PerfectHashResolver or FrozenAliasResolver instance.
+        See also:
+            rym.alias._aliasperfect
+        """
+        # avoid circular import
+        from ._aliasperfect import PerfectHashResolver
+        from ._aliasresolverfrozen import FrozenAliasResolver
+
+        if perfect:
+            return PerfectHashResolver.compile(self)
+        return FrozenAliasResolver.clone(self)
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> Iterable[Hashable]:
+        """Return identities with a name that starts with the given prefix.
+
+        Identities are ranked by their best matching name: shortest first
+        (an exact match is always first), then alphabetically.
+        Names are indexed in a sorted array on first use, and the index is
+        then updated as aliases are added.
+
+        Arguments:
+            prefix: Start of the names to match.
+            limit: Maximum number of identities to return.
+        Returns:
+            List of identities.
+        """
+        if self.casefold:
+            prefix = variation.casefold(prefix)
+        if self._prefix is None:
+            self._prefix = PrefixIndex(self._expand_lookup())
+        variants = self._variants
+        best = {}  # alias position: (name length, name)
+        for name in self._prefix.search(prefix):
+            idx = self._lookup.get(name)
+            if idx is None and variants is not None:
+                idx = variants.find(name)  # see Alias.lazy
+            if idx is None:
+                continue
+            rank = (len(name), name)
+            if idx not in best or rank < best[idx]:
+                best[idx] = rank
+        items = best.items()
+        ranked = (
+            sorted(items, key=_itemgetter_1)
+            if limit is None
+            else heapq.nsmallest(limit, items, key=_itemgetter_1)
+        )
+        return [self.aliases[idx].identity for idx, _ in ranked]
+
     @classmethod
     def find_collisions(
         cls,
         *aliases: Iterable[Alias],
         logger: logging.Logger = None,
     ) -> Iterable[str]:
-        """Check for alias collisions."""
+        """Check for alias collisions. See report_collisions."""
         logger = logger or LOGGER
-        lookup = ChainMap(*[x._lookup for x in resolve_aliases(aliases)])
-        keys = set()
-        lost = defaultdict(list)
-        collisions = set()
-        for child in lookup.maps:
-            both = keys & child.keys()
-            for k in both:
-                lost[k].append(child[k])
-            keys |= child.keys()
-            collisions |= both
-        if lost:
-            logger.debug("Lost aliases due to collisions: %s", pformat(lost))
-        return sorted(collisions)
+        report = report_collisions(resolve_aliases(aliases))
+        if report:
+            logger.debug("Lost aliases due to collisions: %s", report)
+        return list(report)
+
+    def usage(self, top: int = 10) -> UsageReport:
+        """Report lookup attempts by name and identity, and the top misses.
+
+        Arguments:
+            top: Maximum number of unknown values to report.
+        Returns:
+            A UsageReport instance. See rym.alias._usage.
+        Raises:
+            ValueError if attempts are not tracked.
+        """
+        if self._attempts is None:
+            raise ValueError("lookup attempts are not tracked")
+        aliases = self.aliases
+        names = {k: aliases[i].identity for k, i in self._lookup.items()}
+        return build_usage_report(
+            self._attempts,
+            names,
+            [x.identity for x in aliases if x is not None],
+            find=self._find_variant_identity,
+            top=top,
+        )
+
+    def _find_variant_identity(self, value: Hashable) -> Hashable:
+        """Return identity for a name found on demand. See Alias.lazy.
+
+        Raises:
+            AliasError (KeyError) if unknown.
+        """
+        idx = None if self._variants is None else self._variants.find(value)
+        if idx is None:
+            raise AliasError(value)
+        return self.aliases[idx].identity
+
+    def validate(self) -> Dict[Hashable, List[Hashable]]:
+        """Report names shared by more than one alias.
+
+        Collisions are ignored when adding aliases with strict=False (the
+        later alias wins), so use this to review them afterward.
+
+        Returns:
+            Mapping of colliding name to every identity that uses it.
+        """
+        aliases = [x for x in self.aliases if x is not None]
+        return report_collisions(aliases, casefold=self.casefold)
+
+    def set_tracking(self, value: Any) -> None:
+        """Replace how lookup attempts are counted.
+
+        A mode starts new counts. A tracker instance is used as is, so it
+        keeps its counts.
+
+        Arguments:
+            value: Tracking mode or tracker. See rym.alias.resolve_tracker.
+        Returns:
+            None
+        """
+        self._attempts = resolve_tracker(value)
+        self.tracking = value
+        if self._attempts is not None:
+            self._attempts.register(self._lookup)
 
     def identify(self, value: str, default: Any = _DEFAULT) -> str:
         """Return identity for the given alias value.
@@ -191,15 +943,166 @@ class AliasResolver:
         Raises:
             AliasError (KeyError) if unknown alias given.
         """
-        self._attempts[value] += 1  # know which aliases are used / needed
-        idx = self._lookup.get(value)  # faster than iterable and try:except
+        front = self._front
+        if front is not None:
+            entry = front._data.get(value)  # inline FrontCache.get: hot path
+            if entry is not None:
+                entry[1] = True
+                front.hits += 1
+                identity, key = entry[0]
+                if self._attempts is not None:
+                    self._attempts.track(key)
+                return identity
+            front.misses += 1
+        key = variation.casefold(value) if self.casefold else value
+        if self._attempts is not None:
+            self._attempts.track(key)  # know which aliases are used / needed
+        idx = self._lookup.get(key)  # faster than iterable and try:except
+        if idx is None and self._variants is not None:
+            idx = self._variants.find(key)  # see Alias.lazy
+        if idx is None and self._casefolded:
+            idx = self._find_casefolded(key)
+        if idx is not None:
+            ...  # handle below
+        elif _DEFAULT != default:
+            return default
+        else:
+            raise AliasError(key)
+        identity = self.aliases[idx].identity
+        if front is not None:
+            front.put(value, (identity, key))
+        return identity
+
+    def front_cache_info(self) -> CacheInfo:
+        """Return hits, misses, maxsize, and size of the front cache."""
+        if self._front is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._front.cache_info()
+
+    def identify_fuzzy(
+        self,
+        value: str,
+        max_distance: int = 2,
+        default: Any = _DEFAULT,
+    ) -> Tuple[Hashable, int]:
+        """Return identity and edit distance of the closest alias.
+
+        Exact matches have a distance of 0. Otherwise, the closest name
+        within the given edit distance is used (first sorted name on a tie).
+        Names (including names found on demand) are indexed in a BK-tree on
+        first use, and the tree is then updated as aliases are added.
+
+        Arguments:
+            value: Alias to match.
+            max_distance: Maximum number of edits (Levenshtein distance).
+            default: Return if no name is close enough. Raise if not given.
+        Returns:
+            Tuple of identity and distance for the given alias.
+        Raises:
+            AliasError (KeyError) if no match and no default.
+        """
+        if self.casefold:
+            value = variation.casefold(value)
+        if self._attempts is not None:
+            self._attempts.track(value)  # know which aliases are used / needed
+        distance = 0
+        idx = self._lookup.get(value)
+        if idx is None and self._variants is not None:
+            idx = self._variants.find(value)  # see Alias.lazy
+        if idx is None and self._casefolded:
+            idx = self._find_casefolded(value)
+        if idx is None:
+            if self._fuzzy is None:
+                self._fuzzy = BKTree(self._expand_lookup())
+            variants = self._variants
+            for distance, name in self._fuzzy.search(value, max_distance):
+                idx = self._lookup.get(name)
+                if idx is None and variants is not None:
+                    idx = variants.find(name)  # see Alias.lazy
+                if idx is not None:
+                    break
         if idx is not None:
             ...  # handle below
         elif _DEFAULT != default:
             return default
         else:
             raise AliasError(value)
-        return self.aliases[idx].identity
+        return self.aliases[idx].identity, distance
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values.
+
+        Repeated values are resolved once and attempts are counted in bulk.
+
+        Arguments:
+            values: Aliases to match. May be a numpy array.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            List of identities (or array, if given an array).
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        return identify_many(values, self._identify_unique, default=default)
+
+    def _identify_unique(self, counts: Mapping[Hashable, int], default: Any) -> dict:
+        """Return identity for each counted value and track attempts."""
+        fold = variation.casefold if self.casefold else None
+        if self._attempts is not None:
+            self._attempts.track_many(fold_counts(counts, fold))
+        lookup = self._lookup
+        aliases = self.aliases
+        resolved = {}
+        for value in counts:
+            key = fold(value) if fold else value
+            idx = lookup.get(key)
+            if idx is None and self._variants is not None:
+                idx = self._variants.find(key)  # see Alias.lazy
+            if idx is None and self._casefolded:
+                idx = self._find_casefolded(key)
+            if idx is not None:
+                resolved[value] = aliases[idx].identity
+            elif _DEFAULT != default:
+                resolved[value] = default
+            else:
+                raise AliasError(value)
+        return resolved
+
+
+def report_collisions(
+    aliases: Iterable[Alias],
+    casefold: bool = False,
+) -> Dict[Hashable, List[Hashable]]:
+    """Return every identity for each name used by more than one alias.
+
+    Arguments:
+        aliases: Aliases to check.
+        casefold: If true, compare casefolded names.
+    Returns:
+        Mapping of colliding name to identities (in given order), sorted by name.
+    """
+    fold = variation.casefold if casefold else None
+    owners = {}  # name: first alias
+    report = {}
+    aliases = list(aliases)
+    for alias, keys in zip(aliases, expand_lookup_many(aliases)):
+        keys = set(map(fold, keys)) if fold else keys
+        for k in keys:
+            owner = owners.setdefault(k, alias)
+            if owner is alias:
+                continue
+            if k in report:
+                report[k].append(alias.identity)
+            else:
+                report[k] = [owner.identity, alias.identity]
+    return {k: report[k] for k in safesorted(report)}
+
+
+def _itemgetter_1(item: Tuple[Any, Any]) -> Any:
+    return item[1]
 
 
 def resolve_aliases(
@@ -220,8 +1123,10 @@ def resolve_aliases(
         - Encoding of supported format
             - May be string (json only)
             - May be file path (json, toml, yaml)
+            - May be streamed from file path (ndjson/jsonl, multi-document yaml)
 
     NOTE: TOML requires a root object (not an array)
+    NOTE: Streamed files are parsed one line (or document) at a time.
 
     Arguments:
             *args: Supported formats as positional arguments
@@ -231,80 +1136,332 @@ def resolve_aliases(
     Returns:
         Iterable of Alias instances.
     """
-    aliases = list(
-        itertools.chain(
-            _yield_aliases(args),
-            _yield_aliases(kwargs),
-        )
+    if transforms == _DEFAULT:
+        options = {}
+    else:
+        # build new aliases without transforms, then transform all at once
+        transforms = resolve_variations(transforms)
+        options = {"transforms": None}
+    aliases = itertools.chain(
+        _yield_aliases(args, **options),
+        _yield_aliases(kwargs, **options),
+    )
+    if options:
+        aliases = _yield_transformed(aliases, transforms)
+    return list(aliases)
+
+
+def resolve_aliases_parallel(
+    *args,
+    transforms: Optional[Iterable[Callable[[str], str]]] = _DEFAULT,
+    workers: Optional[int] = None,
+    logger: logging.Logger = None,
+    **kwargs,
+) -> Iterable[Alias]:
+    """Build aliases from multiple supported formats using a process pool.
+
+    Files and encoded strings are decoded here. The decoded definitions are
+    split into contiguous shards, and each shard is built in a separate
+    process. Shards are merged in order, so the result matches
+    resolve_aliases.
+
+    Workers return compact aliases (fields and stored names), so names are
+    not transformed again here. Even so, each name is sent back once, so
+    this only pays off for costly transforms and with free cores.
+
+    NOTE: Transforms must be picklable, e.g., not lambdas. Otherwise, the
+        aliases are built in this process.
+    NOTE: Aliases are also built in this process if there is only one CPU.
+
+    Arguments:
+            *args: Supported formats as positional arguments
+            transforms: Optional transforms to apply to all aliases.
+                Use 'None' to disable.
+            workers: Maximum number of processes, up to the CPU count.
+                Default: CPU count.
+            **kwargs: Supported formats as keyword arguments
+    Returns:
+        Iterable of Alias instances.
+    """
+    aliases, _ = _resolve_shards(
+        args, kwargs, transforms=transforms, workers=workers, logger=logger
     )
-    if transforms != _DEFAULT:
-        for alias in aliases:
-            alias.set_transforms(transforms)
     return aliases
 
 
+def _resolve_shards(
+    args: Iterable[Any],
+    kwargs: Mapping[str, Any],
+    transforms: Optional[Iterable[Callable[[str], str]]] = _DEFAULT,
+    workers: Optional[int] = None,
+    logger: logging.Logger = None,
+    casefold: bool = False,
+    lazy: bool = False,
+) -> Tuple[List[Alias], Optional[List[Hashable]]]:
+    """Build aliases in a process pool and merge the shard collision reports.
+
+    Arguments:
+        args: Supported formats. See resolve_aliases.
+        kwargs: Supported formats as keyword arguments.
+        transforms: Optional transforms to apply to all aliases.
+        workers: Maximum number of processes, up to the CPU count.
+        logger: Optional logger.
+        casefold: If true, build aliases as a casefold resolver adds them.
+        lazy: If true, build aliases as a lazy resolver adds them.
+    Returns:
+        Tuple of aliases and sorted colliding names. Colliding names are
+        None if the aliases were built in this process.
+    """
+    logger = logger or LOGGER
+    cpus = os.cpu_count() or 1
+    workers = min(workers or cpus, cpus)  # more only adds overhead
+    if workers < 2:
+        return resolve_aliases(*args, transforms=transforms, **kwargs), None
+    if _get_transforms_key(transforms) is None:
+        logger.warning("unable to build in parallel with transforms: %s", transforms)
+        return resolve_aliases(*args, transforms=transforms, **kwargs), None
+
+    definitions = list(_yield_definitions([args, kwargs]))
+    size = max(1, -(-len(definitions) // (workers * _SHARDS_PER_WORKER)))  # ceil
+    shards = [definitions[i : i + size] for i in range(0, len(definitions), size)]
+    build = partial(_resolve_shard, transforms=transforms, casefold=casefold, lazy=lazy)
+    aliases = []
+    seen = set()
+    collisions = set()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for packed, names, found in executor.map(build, shards):  # in order
+            collisions.update(found)
+            if not seen.isdisjoint(names):
+                collisions.update(names & seen)  # across shards
+            seen.update(names)
+            aliases.extend(
+                Alias._unpack(x) if isinstance(x, tuple) else x for x in packed
+            )
+    return aliases, safesorted(collisions)
+
+
+def _resolve_shard(
+    definitions: List[Any],
+    transforms: Optional[Iterable[Callable[[str], str]]],
+    casefold: bool,
+    lazy: bool,
+) -> Tuple[List[Any], Set[Hashable], Set[Hashable]]:
+    """Build the aliases of one shard. See _resolve_shards.
+
+    Returns:
+        Tuple of packed aliases (see Alias._pack), indexed names (including
+        names found on demand), and names used by more than one alias.
+    """
+    resolver = AliasResolver([], tracking="off", casefold=casefold, lazy=lazy)
+    aliases = resolve_aliases(definitions, transforms=transforms)
+    aliases = resolver._prepare_aliases(aliases)
+    fold = variation.casefold if casefold else None
+    seen = set()
+    collisions = set()
+    for keys in expand_lookup_many(aliases):
+        keys = set(map(fold, keys)) if fold else keys
+        if not seen.isdisjoint(keys):
+            collisions.update(k for k in keys if k in seen)
+        seen.update(keys)
+    packed = [x._pack() if isinstance(x, Alias) else x for x in aliases]
+    return packed, seen, collisions
+
+
+def _yield_transformed(
+    aliases: Iterable[Alias],
+    transforms: Optional[Iterable[Callable[[str], str]]],
+) -> Generator[Alias, None, None]:
+    """Set transforms on each alias as it is loaded.
+
+    Aliases are transformed in chunks so that each transform is applied to
+    many names at once. See rym.alias._alias.set_transforms_many.
+    """
+    transforms = resolve_variations(transforms)
+    aliases = iter(aliases)
+    while True:
+        chunk = list(itertools.islice(aliases, _TRANSFORM_CHUNK_SIZE))
+        if not chunk:
+            return
+        set_transforms_many(chunk, transforms)
+        yield from chunk
+
+
+def _load_cached_aliases(
+    path: Path,
+    transforms: Optional[Iterable[Callable[[str], str]]],
+    cache_dir: Union[str, Path],
+    logger: logging.Logger = None,
+) -> Iterable[Alias]:
+    """Load aliases from file, using the cache if possible."""
+    logger = logger or LOGGER
+    loader = partial(resolve_aliases, transforms=transforms)
+    key = _get_transforms_key(transforms)
+    if key is None:
+        logger.debug("unable to cache aliases with transforms: %s", transforms)
+        return loader(path)
+    return load_cached(path, loader, cache_dir, key, logger=logger)
+
+
+def _get_transforms_key(
+    transforms: Optional[Iterable[Callable[[str], str]]],
+) -> Optional[Tuple[str, ...]]:
+    """Return a stable key for the given transforms. None if not possible."""
+    if _DEFAULT == transforms:
+        return ("default",)
+    key = []
+    for func in resolve_variations(transforms):
+        name = getattr(func, "__qualname__", "<unknown>")
+        if "<" in name:
+            return None  # e.g., lambdas and closures
+        key.append(f"{func.__module__}.{name}")
+    return tuple(key)
+
+
 @singledispatch
-def _yield_aliases(value: Any) -> Generator[Alias, None, None]:
+def _yield_aliases(value: Any, **options) -> Generator[Alias, None, None]:
+    """Yield aliases from the given value.
+
+    Arguments:
+        value: Supported format. See resolve_aliases.
+        **options: Keywords for each new Alias, e.g., transforms. Ignored for
+            given instances and snapshots.
+    """
     if value is not None:
         raise TypeError(f"invalid alias: {value}")
     yield from []
 
 
 @_yield_aliases.register(str)
-def _(value: str) -> Generator[Alias, None, None]:
-    yield from _yield_aliases(json.loads(value))
+def _(value: str, **options) -> Generator[Alias, None, None]:
+    yield from _yield_aliases(json.loads(value), **options)
 
 
 @_yield_aliases.register(Alias)
-def _(value: Alias) -> Generator[Alias, None, None]:
+def _(value: Alias, **options) -> Generator[Alias, None, None]:
     yield value
 
 
 @_yield_aliases.register(AliasResolver)
-def _(value: AliasResolver) -> Generator[Alias, None, None]:
-    yield from value.aliases
+def _(value: AliasResolver, **options) -> Generator[Alias, None, None]:
+    yield from (x for x in value.aliases if x is not None)
 
 
 @_yield_aliases.register(FrozenAlias)
-def _(value: FrozenAlias) -> Generator[Alias, None, None]:
-    alias = Alias(value.identity, aliases=value.all_names(), transforms=None)
+def _(value: FrozenAlias, **options) -> Generator[Alias, None, None]:
+    alias = Alias(
+        value.identity,
+        aliases=value.all_names(),
+        transforms=None,
+        casefold=value.casefold,
+    )
     yield alias
 
 
 @_yield_aliases.register(abc.Iterable)
-def _(value: Iterable) -> Generator[Alias, None, None]:
+def _(value: Iterable, **options) -> Generator[Alias, None, None]:
     for item in value:
-        yield from _yield_aliases(item)
+        yield from _yield_aliases(item, **options)
 
 
 @_yield_aliases.register(abc.Mapping)
-def _(value: Mapping) -> Generator[Alias, None, None]:
+def _(value: Mapping, **options) -> Generator[Alias, None, None]:
     try:
-        yield Alias(**value)
+        yield Alias(**{**value, **options})
     except TypeError:
         for identity, aliases in value.items():
             if identity == "aliases":
-                yield from _yield_aliases(aliases)
+                yield from _yield_aliases(aliases, **options)
             else:
-                yield Alias(identity, aliases)
+                yield Alias(identity, aliases, **options)
 
 
 @_yield_aliases.register(Path)
-def _(value: Path) -> Generator[Alias, None, None]:
+def _(value: Path, **options) -> Generator[Alias, None, None]:
+    for data in _yield_documents(value):
+        yield from _yield_aliases(data, **options)
+
+
+def _yield_documents(value: Path) -> Generator[Any, None, None]:
+    """Yield each decoded document from the given file."""
     cases = {
-        ".json": json.loads,
-        ".toml": getattr(toml, "loads", None),
-        ".yaml": getattr(yaml, "safe_load", None),
-        ".yml": getattr(yaml, "safe_load", None),
+        ".json": _read_json,
+        ".jsonl": _read_ndjson,
+        ".ndjson": _read_ndjson,
+        ".toml": _read_toml if toml else None,
+        ".yaml": _read_yaml if yaml else None,
+        ".yml": _read_yaml if yaml else None,
     }
 
     func = cases.get(value.suffix)
     if not func:
         raise ValueError(f"unavailable encoding: {value.suffix} ({value})") from None
 
-    content = value.read_text()
-    data = func(content)
-    yield from _yield_aliases(data)
+    with value.open() as stream:
+        yield from func(stream)
+
+
+# parallel build
+# ----------------------------------
+#   Decode supported formats into alias definitions, without building aliases.
+
+
+@singledispatch
+def _yield_definitions(value: Any) -> Generator[Any, None, None]:
+    yield value  # e.g., Alias instances (or invalid input, raised later)
+
+
+@_yield_definitions.register(str)
+def _(value: str) -> Generator[Any, None, None]:
+    yield from _yield_definitions(json.loads(value))
+
+
+@_yield_definitions.register(abc.Iterable)
+def _(value: Iterable) -> Generator[Any, None, None]:
+    for item in value:
+        yield from _yield_definitions(item)
+
+
+@_yield_definitions.register(abc.Mapping)
+def _(value: Mapping) -> Generator[Any, None, None]:
+    if "identity" in value:
+        yield value  # alias keywords
+        return
+    for identity, aliases in value.items():
+        if identity == "aliases":
+            yield from _yield_definitions(aliases)
+        else:
+            yield {identity: aliases}
+
+
+@_yield_definitions.register(Path)
+def _(value: Path) -> Generator[Any, None, None]:
+    for data in _yield_documents(value):
+        yield from _yield_definitions(data)
+
+
+# file readers
+# ----------------------------------
+#   Each reader yields one or more decoded documents from an open file.
+
+
+def _read_json(stream: TextIO) -> Generator[Any, None, None]:
+    yield json.load(stream)
+
+
+def _read_ndjson(stream: TextIO) -> Generator[Any, None, None]:
+    """Yield one alias definition per line."""
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _read_toml(stream: TextIO) -> Generator[Any, None, None]:
+    yield toml.loads(stream.read())
+
+
+def _read_yaml(stream: TextIO) -> Generator[Any, None, None]:
+    """Yield each document in the stream."""
+    yield from yaml.safe_load_all(stream)
 
 
 # __END__
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Share an AliasResolver Between Threads
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A ConcurrentAliasResolver serializes writes and publishes a new read-only
+snapshot after each one (copy-on-write). Readers use the latest snapshot,
+so they never block and never see a partial update.
+
+>>> from rym.alias import ConcurrentAliasResolver
+>>> x = ConcurrentAliasResolver.build(prd=['prod'], transforms=None)
+>>> snapshot = x.snapshot
+>>> x.add(dev=['develop']).identify('develop')
+'dev'
+>>> snapshot.identify('develop', None) is None
+True
+
+"""
+
+import dataclasses as dcs
+import logging
+import threading
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from ._aliasresolver import AliasResolver
+from ._aliasresolverfrozen import FrozenAliasResolver
+
+LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
+
+
+@dcs.dataclass
+class ConcurrentAliasResolver:
+    """Thread-safe AliasResolver.
+
+    Each write copies the lookup, so prefer fewer, larger writes, e.g.,
+    `add` several aliases at once.
+
+    NOTE: Lookup attempts are not tracked.
+
+    Attributes:
+        resolver: Writable resolver. Do not modify directly.
+    """
+
+    resolver: AliasResolver = dcs.field(repr=False)
+    _lock: threading.Lock = dcs.field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _snapshot: FrozenAliasResolver = dcs.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._snapshot = FrozenAliasResolver.clone(self.resolver)
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    @classmethod
+    def build(cls, *args, **kwargs) -> "ConcurrentAliasResolver":
+        """Build aliases to resolve. See AliasResolver.build."""
+        kwargs.setdefault("tracking", "off")
+        return cls(AliasResolver.build(*args, **kwargs))
+
+    @property
+    def snapshot(self) -> FrozenAliasResolver:
+        """Return the latest published snapshot."""
+        return self._snapshot
+
+    # write
+    # ----------------------------------
+
+    def add(self, *args, **kwargs) -> "ConcurrentAliasResolver":
+        """Add aliases to resolver. See AliasResolver.add."""
+        with self._lock:
+            self.resolver.add(*args, **kwargs)
+            self._publish()
+        return self
+
+    def add_alias(
+        self,
+        identity: Hashable,
+        value: Hashable,
+        strict: bool = True,
+    ) -> "ConcurrentAliasResolver":
+        """Add an alias value to an existing identity. See AliasResolver.add_alias."""
+        with self._lock:
+            self.resolver.add_alias(identity, value, strict=strict)
+            self._publish()
+        return self
+
+    def _publish(self) -> None:
+        """Replace the snapshot. Must hold the lock."""
+        # attribute assignment is atomic; readers see the old or new snapshot
+        self._snapshot = FrozenAliasResolver.clone(self.resolver)
+
+    # read
+    # ----------------------------------
+
+    def all_names(self, _sorted: Optional[Callable] = None, **kwargs) -> Iterable[str]:
+        """Return all known aliases and transformations. See AliasResolver."""
+        return self._snapshot.all_names(_sorted=_sorted, **kwargs)
+
+    def identify(self, value: Hashable, default: Any = _DEFAULT) -> Hashable:
+        """Return identity for the given alias value. See AliasResolver.identify."""
+        if _DEFAULT == default:
+            return self._snapshot.identify(value)
+        return self._snapshot.identify(value, default)
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values. See AliasResolver."""
+        snapshot = self._snapshot  # one snapshot for the whole batch
+        if _DEFAULT == default:
+            return snapshot.identify_many(values)
+        return snapshot.identify_many(values, default)
+
+
+# __END__
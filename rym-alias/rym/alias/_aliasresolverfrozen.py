@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Freeze an AliasResolver
+^^^^^^^^^^^^^^^^^^^^^^^
+
+A FrozenAliasResolver is a read-only, hashable, and picklable snapshot of an
+AliasResolver. Every name maps directly to its identity.
+
+>>> from rym.alias import AliasResolver, FrozenAliasResolver
+>>> x = FrozenAliasResolver.build(prd=['prod'], dev=['develop'])
+>>> x.identify('PROD')
+'prd'
+>>> x.identify('nope', None) is None
+True
+>>> y = FrozenAliasResolver.clone(AliasResolver.build(prd=['prod'], dev=['develop']))
+>>> x == y and hash(x) == hash(y)
+True
+
+"""
+
+import dataclasses as dcs
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Generator, Hashable, Iterable, Mapping, Optional
+
+from . import variation
+from ._alias import Alias, AliasError, identify_many
+from ._aliasresolver import AliasResolver, _yield_aliases
+from .safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
+
+
+@dcs.dataclass(frozen=True, eq=True)
+class FrozenAliasResolver:
+    """Hashable AliasResolver.
+
+    NOTE: Lookup attempts are not tracked.
+
+    Attributes:
+        _lookup: Mapping of every name to its identity.
+        casefold: If true, names are casefolded and matched without case.
+    """
+
+    _lookup: Mapping[Hashable, Hashable] = dcs.field(repr=False)
+    casefold: bool = False
+    _hash: Optional[int] = dcs.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # keep a private copy so the snapshot cannot change under us
+        object.__setattr__(self, "_lookup", dict(self._lookup))
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(frozenset(self._lookup.items())))
+        return self._hash
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+    def __reduce__(self) -> tuple:
+        # leave out the cached hash; string hashes differ between processes
+        return (type(self), (self._lookup, self.casefold))
+
+    @classmethod
+    def build(cls, *args, **kwargs) -> "FrozenAliasResolver":
+        """Build aliases to resolve. See AliasResolver.build."""
+        resolver = AliasResolver.build(*args, **kwargs)
+        return cls.clone(resolver)
+
+    @classmethod
+    def clone(cls, resolver: AliasResolver) -> "FrozenAliasResolver":
+        """Return a frozen snapshot of the given resolver."""
+        if isinstance(resolver, FrozenAliasResolver):
+            return cls(resolver._lookup, casefold=resolver.casefold)
+        aliases = resolver.aliases
+        expanded = resolver._expand_lookup()
+        lookup = {k: aliases[i].identity for k, i in expanded.items()}
+        return cls(lookup, casefold=resolver.casefold)
+
+    def all_names(
+        self,
+        _sorted: Optional[Callable] = None,
+        **kwargs,
+    ) -> Iterable[str]:
+        """Return all known aliases and transformations.
+
+        Arguments:
+            _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
+            **kwargs: Keywords for "sorted".
+        """
+        _sorted = _sorted or safesorted
+        return _sorted(self._lookup.keys(), **kwargs)
+
+    def identify(self, value: Hashable, default: Any = _DEFAULT) -> Hashable:
+        """Return identity for the given alias value.
+
+        Arguments:
+            value: Alias to match.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            Identity for the given alias.
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        if self.casefold:
+            value = variation.casefold(value)
+        try:
+            return self._lookup[value]
+        except KeyError:
+            if _DEFAULT != default:
+                return default
+            raise AliasError(value) from None
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values.
+
+        Arguments:
+            values: Aliases to match. May be a numpy array.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            List of identities (or array, if given an array).
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        return identify_many(values, self._identify_unique, default=default)
+
+    def _identify_unique(self, counts: Mapping[Hashable, int], default: Any) -> dict:
+        """Return identity for each counted value."""
+        fold = variation.casefold if self.casefold else None
+        lookup = self._lookup
+        resolved = {}
+        for value in counts:
+            try:
+                resolved[value] = lookup[fold(value) if fold else value]
+            except KeyError:
+                if _DEFAULT == default:
+                    raise AliasError(value) from None
+                resolved[value] = default
+        return resolved
+
+
+@_yield_aliases.register(FrozenAliasResolver)
+def _(value: FrozenAliasResolver, **options) -> Generator[Alias, None, None]:
+    names = defaultdict(list)
+    for name, identity in value._lookup.items():
+        names[identity].append(name)
+    for identity, aliases in names.items():
+        yield Alias(identity, aliases, transforms=None, casefold=value.casefold)
+
+
+# __END__
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Stack AliasResolvers in Layers
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+An OverlayAliasResolver looks up names in a stack of resolvers, top first,
+e.g., per-tenant overrides on top of a shared base. Layers are shared, not
+copied, so a new view costs the same no matter how large the base is.
+
+>>> from rym.alias import AliasResolver, OverlayAliasResolver
+>>> base = AliasResolver.build(prd=['prod'], dev=['develop'], transforms=None)
+>>> tenant = OverlayAliasResolver.build(base, live=['prod'], transforms=None)
+>>> tenant.identify('prod')
+'live'
+>>> tenant.identify('develop')
+'dev'
+>>> base.identify('prod')
+'prd'
+
+Each layer has a collision policy for names it shares with the layers below:
+"override" (default) shadows them, "warn" also logs a warning, and "strict"
+raises a CollisionError. Only the names of that layer are checked.
+
+>>> OverlayAliasResolver.build(base, live=['prod'], policy='strict')
+Traceback (most recent call last):
+...
+rym.alias._aliasresolver.CollisionError: ['prod']
+
+"""
+
+import copy
+import dataclasses as dcs
+import logging
+from typing import Any, Callable, Hashable, Iterable, List, Mapping, Optional
+
+from ._alias import AliasError, expand_lookup_many, identify_many
+from ._aliasresolver import AliasResolver, CollisionError, resolve_aliases
+from .safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+_DEFAULT = __file__
+_MISSING = object()
+
+POLICIES = ("override", "warn", "strict")
+
+
+@dcs.dataclass
+class OverlayAliasResolver:
+    """Read names from a stack of resolvers; write to the top layer.
+
+    Layers may be any resolver, e.g., an AliasResolver or a compiled
+    snapshot, but only an AliasResolver on top supports `add`.
+
+    NOTE: Each layer that is searched counts the attempt, so a name found
+        in a lower layer is also a miss in the layers above it.
+
+    Attributes:
+        layers: Resolvers, top first. Shared with the caller.
+        policies: Collision policy of each layer. Default: "override".
+    """
+
+    layers: List[Any]
+    policies: Optional[List[str]] = None
+    logger: logging.Logger = dcs.field(
+        default=None, repr=False, hash=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.logger = self.logger or LOGGER
+        self.layers = list(self.layers)
+        if self.policies is None:
+            self.policies = ["override"] * len(self.layers)
+        self.policies = list(self.policies)
+        if len(self.policies) != len(self.layers):
+            raise ValueError(
+                f"expected {len(self.layers)} policies, not {len(self.policies)}"
+            )
+        for i, policy in enumerate(self.policies):
+            _validate_policy(policy)
+            if policy != "override":
+                self._check_names(_yield_layer_names(self.layers[i]), i)
+
+    @classmethod
+    def build(
+        cls,
+        base: Any,
+        *args,
+        policy: str = "override",
+        logger: logging.Logger = None,
+        **kwargs,
+    ) -> "OverlayAliasResolver":
+        """Build a new top layer over the given base.
+
+        Arguments:
+            base: A resolver or an OverlayAliasResolver. Not copied.
+            *args: Supported formats as positional arguments.
+            policy: Collision policy of the new layer.
+            logger: Optional logger.
+            **kwargs: Keywords for AliasResolver.build, e.g., transforms.
+        Returns:
+            An OverlayAliasResolver instance.
+        """
+        top = AliasResolver.build(*args, logger=logger, **kwargs)
+        return cls.wrap(base, logger=logger).over(top, policy=policy)
+
+    @classmethod
+    def wrap(cls, base: Any, logger: logging.Logger = None) -> "OverlayAliasResolver":
+        """Return the given overlay, or a single-layer overlay of a resolver."""
+        if isinstance(base, cls):
+            return base
+        return cls([base], logger=logger)
+
+    def over(self, layer: Any, policy: str = "override") -> "OverlayAliasResolver":
+        """Return a new view with the given layer on top of these layers.
+
+        Arguments:
+            layer: Resolver to search first. Not copied.
+            policy: Collision policy of the given layer.
+        Returns:
+            A new OverlayAliasResolver that shares the existing layers.
+        """
+        _validate_policy(policy)
+        view = copy.copy(self)  # existing layers were already checked
+        view.layers = [layer, *self.layers]
+        view.policies = [policy, *self.policies]
+        if policy != "override":
+            view._check_names(_yield_layer_names(layer), 0)
+        return view
+
+    @property
+    def top(self) -> Any:
+        """Return the layer that is searched first."""
+        return self.layers[0]
+
+    # write
+    # ----------------------------------
+
+    def add(
+        self,
+        *args,
+        strict: bool = True,
+        **kwargs,
+    ) -> "OverlayAliasResolver":
+        """Add aliases to the top layer. See AliasResolver.add.
+
+        Names are checked against lower layers using the top layer policy,
+        and against the top layer using `strict`. Names are checked as the
+        top layer stores them, e.g., casefolded.
+
+        Raises:
+            CollisionError if a name collides and the policy is "strict".
+            TypeError if the top layer is read-only.
+        """
+        top = self._get_writable_top()
+        aliases = resolve_aliases(*args, **kwargs)
+        aliases = top._prepare_aliases(aliases)  # e.g., casefold
+        self._check_names((k for x in expand_lookup_many(aliases) for k in x), 0)
+        top._add_aliases(aliases, strict=strict)
+        return self  # support chaining
+
+    def add_alias(
+        self,
+        identity: Hashable,
+        value: Hashable,
+        strict: bool = True,
+    ) -> "OverlayAliasResolver":
+        """Add a name to an alias of the top layer. See AliasResolver.add_alias.
+
+        Raises:
+            AliasError (KeyError) if unknown identity in the top layer.
+            CollisionError if a name collides and the policy is "strict".
+            TypeError if the top layer is read-only.
+        """
+        top = self._get_writable_top()
+        alias = top.alias_of(identity)
+        names = alias._build_lookup(alias.transforms, [value], expand=True)
+        self._check_names(names, 0)
+        top.add_alias(identity, value, strict=strict)
+        return self  # support chaining
+
+    def _get_writable_top(self) -> AliasResolver:
+        """Return the top layer. Raise if it cannot be updated."""
+        top = self.layers[0]
+        if not isinstance(top, AliasResolver):
+            raise TypeError(f"top layer is read-only: {type(top).__name__}")
+        return top
+
+    def _check_names(self, names: Iterable[Hashable], idx: int) -> None:
+        """Apply the policy of the given layer to names found below it."""
+        policy = self.policies[idx]
+        lower = self.layers[idx + 1 :]
+        if policy == "override" or not lower:
+            return  # EARLY EXIT: nothing to check
+        collisions = safesorted(
+            {k for k in names if any(_has_name(x, k) for x in lower)}
+        )
+        if not collisions:
+            ...
+        elif policy == "strict":
+            raise CollisionError(collisions)
+        else:
+            self.logger.warning("Collisions with lower layers: %s", collisions)
+
+    # read
+    # ----------------------------------
+
+    def all_names(self, _sorted: Optional[Callable] = None, **kwargs) -> Iterable[str]:
+        """Return names of every layer, without duplicates.
+
+        Arguments:
+            _sorted: Inject sorting function. Uses rym.alias.safesorted by default.
+            **kwargs: Keywords for "sorted".
+        """
+        _sorted = _sorted or safesorted
+        names = {}
+        for layer in self.layers:
+            names.update(dict.fromkeys(_yield_layer_names(layer)))
+        return _sorted(names, **kwargs)
+
+    def identify(self, value: Hashable, default: Any = _DEFAULT) -> Hashable:
+        """Return identity for the given alias value from the first layer found.
+
+        Arguments:
+            value: Alias to match.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            Identity for the given alias.
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        for layer in self.layers:
+            identity = layer.identify(value, _MISSING)
+            if identity is not _MISSING:
+                return identity
+        if _DEFAULT != default:
+            return default
+        raise AliasError(value)
+
+    def identify_many(
+        self,
+        values: Iterable[Hashable],
+        default: Any = _DEFAULT,
+    ) -> Iterable[Hashable]:
+        """Return identity for each of the given alias values.
+
+        Each layer resolves the values not found above it in one batch.
+
+        Arguments:
+            values: Aliases to match. May be a numpy array.
+            default: Return for unknown aliases. Raise if not given.
+        Returns:
+            List of identities (or array, if given an array).
+        Raises:
+            AliasError (KeyError) if unknown alias given and no default.
+        """
+        return identify_many(values, self._identify_unique, default=default)
+
+    def _identify_unique(self, counts: Mapping[Hashable, int], default: Any) -> dict:
+        """Return identity for each counted value, searching layers in order."""
+        resolved = dict.fromkeys(counts, _MISSING)
+        pending = counts
+        for layer in self.layers:
+            found = layer._identify_unique(pending, _MISSING)
+            resolved.update((k, v) for k, v in found.items() if v is not _MISSING)
+            pending = {k: pending[k] for k, v in found.items() if v is _MISSING}
+            if not pending:
+                break
+        for value in pending:
+            if _DEFAULT == default:
+                raise AliasError(value)
+            resolved[value] = default
+        return resolved
+
+
+def _validate_policy(value: str) -> None:
+    """Raise if the given collision policy is not supported."""
+    if value not in POLICIES:
+        raise ValueError(f"invalid policy: {value}; expected {POLICIES}")
+
+
+def _has_name(layer: Any, name: Hashable) -> bool:
+    """Return true if the given layer resolves the given name."""
+    try:
+        if isinstance(layer, AliasResolver):
+            return name in layer  # does not count an attempt
+        return layer.identify(name, _MISSING) is not _MISSING
+    except TypeError:
+        return False  # unhashable
+
+
+def _yield_layer_names(layer: Any) -> Iterable[Hashable]:
+    """Return stored names of the given layer, unsorted."""
+    if isinstance(layer, AliasResolver):
+        return layer._expand_lookup().keys()  # includes lazy names
+    return layer.all_names(_sorted=list)
+
+
+# __END__
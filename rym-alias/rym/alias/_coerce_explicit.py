@@ -37,6 +37,7 @@ from typing import (
 
 from ._alias import Alias, AliasError
 from ._aliasresolver import AliasResolver
+from ._aliasresolverfrozen import FrozenAliasResolver
 from ._coerce_errors import CoercionError, InvalidConverterError
 
 try:
@@ -147,22 +148,22 @@ def _yield_from(value: Iterable) -> Generator[Any, None, None]:
 
 
 @cache
-def get_alias_bool() -> AliasResolver:
+def get_alias_bool() -> FrozenAliasResolver:
     return AliasResolver.build(
         {True: [True, "true"]},
         {False: [False, "false"]},
-    )
+    ).compile(perfect=False)
 
 
 @cache
-def get_alias_iterable() -> AliasResolver:
+def get_alias_iterable() -> FrozenAliasResolver:
     return AliasResolver.build(
         {iter: ["iter"]},
         {_yield_from: ["generator", "yield"]},
         {list: ["list"]},
         {set: ["set"]},
         {tuple: ["tuple"]},
-    )
+    ).compile(perfect=False)
 
 
 @cache
@@ -171,8 +172,8 @@ def get_alias_null() -> Alias:
 
 
 @cache
-def get_type_resolver() -> AliasResolver:
-    """Return an AliasResolver for data types (cached)."""
+def get_type_resolver() -> FrozenAliasResolver:
+    """Return a compiled AliasResolver for data types (cached)."""
     return AliasResolver.build(
         {None: ["null", "None", None]},
         {bool: ["bool", "boolean"]},
@@ -182,12 +183,12 @@ def get_type_resolver() -> AliasResolver:
         {json.dumps: ["json.dumps"]},
         {str: ["str", "string"]},
         get_alias_iterable(),
-    )
+    ).compile(perfect=False)
 
 
 @cache
-def get_safe_type_resolver() -> AliasResolver:
-    """Return an AliasResolver for safe data types (cached).
+def get_safe_type_resolver() -> FrozenAliasResolver:
+    """Return a compiled AliasResolver for safe data types (cached).
 
     This resolver maps existing types to their safe counterparts where available.
     """
@@ -200,7 +201,7 @@ def get_safe_type_resolver() -> AliasResolver:
         {partial(safe_iterable, itertype=tuple): [tuple]},
         {partial(safe_iterable, itertype=set): [set]},
         {partial(safe_iterable, itertype=list): [list]},
-    )
+    ).compile(perfect=False)
 
 
 # Safe Types
@@ -10,6 +10,7 @@ from types import SimpleNamespace
 from typing import Any, Optional, Union
 
 from ._aliasresolver import AliasResolver
+from ._aliasresolverfrozen import FrozenAliasResolver
 from ._coerce_explicit import coerce_explicit, get_alias_bool, get_alias_null
 
 try:
@@ -158,11 +159,11 @@ def _(value: Union[int, float], alias: Optional[AliasResolver] = None) -> int:
 
 
 @cache
-def get_default_value_aliases() -> AliasResolver:
+def get_default_value_aliases() -> FrozenAliasResolver:
     return AliasResolver.build(
         get_alias_null(),
         get_alias_bool(),
-    )
+    ).compile(perfect=False)
 
 
 # __END__
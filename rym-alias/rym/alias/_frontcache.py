@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Cache Hot Names
+^^^^^^^^^^^^^^^
+
+Lookups are often skewed: a few names make up most of the traffic. A
+FrontCache maps recent queries directly to their result, in front of the
+index. Entries used since the last eviction are kept (second chance), so
+hot names survive a burst of cold ones.
+
+>>> from rym.alias import AliasResolver
+>>> x = AliasResolver.build(prd=['prod'], dev=['develop'], front_cache=2)
+>>> x.identify('PROD')
+'prd'
+>>> x.identify('PROD')
+'prd'
+>>> x.front_cache_info()
+CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+"""
+
+import logging
+from typing import Any, Hashable, Optional
+
+from ._transformcache import CacheInfo
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FrontCache:
+    """Small cache of query to result with second-chance eviction.
+
+    When full, entries not used since the last eviction are removed. If
+    every entry was used, the oldest half is removed.
+
+    Attributes:
+        maxsize: Maximum number of entries.
+        hits: Number of queries found.
+        misses: Number of queries not found.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_data")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError(f"invalid maxsize: {maxsize}; expected 1 or more")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = {}  # query: [result, used since last eviction]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def cache_clear(self) -> None:
+        """Remove entries and reset statistics."""
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return hits, misses, maxsize, and current size."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return cached result for the given query. None if not cached.
+
+        Raises:
+            TypeError if unhashable query given.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        entry[1] = True
+        self.hits += 1
+        return entry[0]
+
+    def invalidate(self) -> None:
+        """Remove entries, but keep statistics."""
+        self._data.clear()
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache the given result (not None) for the given query."""
+        if len(self._data) >= self.maxsize:
+            self._evict()
+        self._data[key] = [value, False]
+
+    def _evict(self) -> None:
+        """Remove entries not used since the last eviction.
+
+        Leaves room for at least one new entry.
+        """
+        kept = {}
+        for key, entry in self._data.items():
+            if entry[1]:
+                entry[1] = False
+                kept[key] = entry
+        if len(kept) >= self.maxsize:
+            # keep the newest half, but never fill the cache
+            size = min(len(kept) - len(kept) // 2, self.maxsize - 1)
+            kept = dict(list(kept.items())[len(kept) - size :])
+        self._data = kept
+
+
+# __END__
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Approximate Name Matching
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A BK-tree indexes names by edit distance, so names within a small distance
+of a query can be found without comparing against every name.
+
+>>> from rym.alias._fuzzy import BKTree
+>>> x = BKTree(['production', 'develop', 'staging'])
+>>> x.search('prodcution', 2)
+[(2, 'production')]
+>>> x.search('dev', 2)
+[]
+
+"""
+
+import logging
+from typing import Callable, Iterable, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Return the edit distance between the given strings.
+
+    Counts single character insertions, deletions, and substitutions.
+    """
+    if a == b:
+        return 0
+    # common prefix and suffix do not change the distance
+    start = 0
+    limit = min(len(a), len(b))
+    while start < limit and a[start] == b[start]:
+        start += 1
+    a, b = a[start:], b[start:]
+    while a and b and a[-1] == b[-1]:
+        a, b = a[:-1], b[:-1]
+    if len(a) > len(b):
+        a, b = b, a  # keep the row short
+    previous = list(range(len(a) + 1))
+    for i, y in enumerate(b, 1):
+        current = [i]
+        for j, x in enumerate(a, 1):
+            current.append(
+                min(
+                    previous[j] + 1,  # deletion
+                    current[j - 1] + 1,  # insertion
+                    previous[j - 1] + (x != y),  # substitution
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree for approximate lookup by edit distance.
+
+    NOTE: Only strings are indexed. Other keys are ignored.
+
+    Attributes:
+        distance: Metric used to compare keys. Default: levenshtein.
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        distance: Optional[Callable[[str, str], int]] = None,
+    ) -> None:
+        self.distance = distance or levenshtein
+        self._root = None  # type: Optional[Tuple[str, dict]]
+        self._size = 0
+        self.update(keys or [])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> None:
+        """Add the given key to the tree."""
+        if not isinstance(key, str):
+            return
+        if self._root is None:
+            self._root = (key, {})
+            self._size += 1
+            return
+        node, children = self._root
+        while True:
+            d = self.distance(key, node)
+            if d == 0:
+                return  # already indexed
+            child = children.get(d)
+            if child is None:
+                children[d] = (key, {})
+                self._size += 1
+                return
+            node, children = child
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add each of the given keys to the tree."""
+        for key in keys:
+            self.add(key)
+
+    def search(self, key: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Return (distance, key) for keys within the given distance.
+
+        Arguments:
+            key: Query.
+            max_distance: Maximum edit distance to include.
+        Returns:
+            List of (distance, key) tuples, closest first.
+        """
+        if self._root is None or not isinstance(key, str):
+            return []
+        found = []
+        pending = [self._root]
+        while pending:
+            node, children = pending.pop()
+            d = self.distance(key, node)
+            if d <= max_distance:
+                found.append((d, node))
+            # triangle inequality: only these children may be close enough
+            for edge, child in children.items():
+                if d - max_distance <= edge <= d + max_distance:
+                    pending.append(child)
+        return sorted(found)
+
+
+# __END__
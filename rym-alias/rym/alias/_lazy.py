@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Lazy Transform Expansion
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+Most transformed names are never queried. A VariantIndex stores each raw
+name once per normalization, e.g., caseless for upper and lower case, and
+finds transformed names on a miss: the query is normalized, and only names
+with the same normalized key are transformed and compared.
+
+>>> from rym.alias import variation
+>>> from rym.alias._lazy import VariantIndex
+>>> x = VariantIndex()
+>>> x.add(['prod', 'production'], [variation.upper, variation.esser], 'prd')
+>>> x.find('PROD')
+'prd'
+>>> x.find('prods')
+'prd'
+>>> x.find('pRoD') is None
+True
+
+A transform supports lazy expansion if it has a `normalize` attribute such
+that normalize(transform(x)) == normalize(x). See rym.alias.variation.
+
+"""
+
+import logging
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+LOGGER = logging.getLogger(__name__)
+_MISSING = object()
+
+Candidate = Tuple[Hashable, Tuple[Callable, ...], Any]
+
+
+def is_lazy(func: Callable) -> bool:
+    """Return true if the given transform supports lazy expansion."""
+    return getattr(func, "normalize", None) is not None
+
+
+def split_transforms(
+    transforms: Iterable[Callable],
+) -> Tuple[List[Callable], List[Callable]]:
+    """Return eager and lazy transforms, in given order."""
+    eager = []
+    lazy = []
+    for func in transforms:
+        (lazy if is_lazy(func) else eager).append(func)
+    return eager, lazy
+
+
+class VariantIndex:
+    """Find names made by lazy transforms without storing them.
+
+    Added names are buffered and indexed on the next search. Matches are
+    memoized until more names are added.
+
+    Attributes:
+        fold: Optional function applied to each transformed name before
+            comparison, e.g., casefold for casefolded lookups.
+    """
+
+    def __init__(self, fold: Optional[Callable[[Hashable], Hashable]] = None):
+        self.fold = fold
+        self._index: Dict[Callable, Dict[Hashable, Any]] = {}
+        self._found: Dict[Hashable, Any] = {}
+        self._pending: List[Tuple[List[Hashable], Tuple[Callable, ...], Any]] = []
+        self._removed: Set[Tuple[Hashable, Any]] = set()  # (name, value)
+
+    def __len__(self) -> int:
+        self._merge()
+        return sum(
+            len(x) if type(x) is list else 1
+            for bucket in self._index.values()
+            for x in bucket.values()
+        )
+
+    def add(
+        self,
+        names: Iterable[Hashable],
+        transforms: Iterable[Callable],
+        value: Any,
+    ) -> None:
+        """Add the given names for each lazy transform.
+
+        Arguments:
+            names: Raw names, i.e., not transformed.
+            transforms: Transforms to find on demand. Others are ignored.
+            value: Returned when a transformed name is found.
+        Returns:
+            None
+        """
+        transforms = tuple(x for x in transforms if is_lazy(x))
+        if transforms:
+            names = list(names)
+            self._pending.append((names, transforms, value))
+            self._found.clear()
+            if self._removed:
+                self._removed.difference_update((k, value) for k in names)
+
+    def discard(self, names: Iterable[Hashable], value: Any) -> None:
+        """Stop finding the given names for the given value.
+
+        Removed candidates are skipped on search rather than unindexed.
+        Use clear (and add) to drop them.
+
+        Arguments:
+            names: Raw names, as added.
+            value: Value given with the names.
+        Returns:
+            None
+        """
+        self._removed.update((k, value) for k in names)
+        self._found.clear()
+
+    def _merge(self) -> None:
+        """Index pending names."""
+        if not self._pending:
+            return  # EARLY EXIT: up to date
+        pending, self._pending = self._pending, []
+        fold = self.fold
+        groups = {}  # transforms: normalize: transforms (shared tuple)
+        for names, transforms, value in pending:
+            if transforms not in groups:
+                funcs = {}
+                for func in transforms:
+                    funcs.setdefault(func.normalize, []).append(func)
+                groups[transforms] = {k: tuple(v) for k, v in funcs.items()}
+            for normalize, funcs in groups[transforms].items():
+                bucket = self._index.setdefault(normalize, {})
+                for name in names:
+                    try:
+                        key = normalize(fold(name) if fold else name)
+                    except Exception:
+                        continue  # unable to transform, e.g., not a string
+                    candidate = (name, funcs, value)
+                    entry = bucket.get(key)
+                    if entry is None:
+                        bucket[key] = candidate  # usually the only one
+                    elif type(entry) is list:
+                        entry.append(candidate)
+                    else:
+                        bucket[key] = [entry, candidate]
+
+    def clear(self) -> None:
+        """Remove all names."""
+        self._index.clear()
+        self._found.clear()
+        self._pending.clear()
+        self._removed.clear()
+
+    def find(self, value: Hashable, default: Any = None) -> Any:
+        """Return value for the given transformed name.
+
+        NOTE: Later names are checked first.
+
+        Arguments:
+            value: Query, folded if needed.
+            default: Return if not found.
+        Returns:
+            Value given with the matching name, or the default.
+        """
+        try:
+            found = self._found.get(value, _MISSING)
+        except TypeError:
+            return default  # unhashable
+        if found is not _MISSING:
+            return found
+        self._merge()
+        fold = self.fold
+        removed = self._removed
+        for normalize, bucket in self._index.items():
+            try:
+                entry = bucket.get(normalize(value))
+            except Exception:
+                continue  # unable to normalize, e.g., not a string
+            if entry is None:
+                continue
+            candidates = reversed(entry) if type(entry) is list else [entry]
+            for name, funcs, found in candidates:
+                if removed and (name, found) in removed:
+                    continue
+                for func in funcs:
+                    try:
+                        variant = func(name)
+                    except Exception:
+                        continue
+                    if (fold(variant) if fold else variant) == value:
+                        self._found[value] = found
+                        return found
+        return default
+
+
+# __END__
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Prefix Name Matching
+^^^^^^^^^^^^^^^^^^^^
+
+A sorted array of names supports prefix search via binary search, e.g., for
+completions. New names are buffered and merged on the next search.
+
+>>> from rym.alias._prefix import PrefixIndex
+>>> x = PrefixIndex(['develop', 'dev', 'production'])
+>>> x.add('deploy')
+>>> list(x.search('dev'))
+['dev', 'develop']
+>>> list(x.search('de'))
+['deploy', 'dev', 'develop']
+
+"""
+
+import logging
+from bisect import bisect_left
+from typing import Generator, Iterable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PrefixIndex:
+    """Sorted array of names for prefix search.
+
+    NOTE: Only strings are indexed. Other keys are ignored.
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None) -> None:
+        self._keys = []
+        self._pending = []
+        self.update(keys or [])
+
+    def __len__(self) -> int:
+        self._merge()
+        return len(self._keys)
+
+    def add(self, key: str) -> None:
+        """Add the given key to the index."""
+        if isinstance(key, str):
+            self._pending.append(key)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add each of the given keys to the index."""
+        self._pending.extend(k for k in keys if isinstance(k, str))
+
+    def _merge(self) -> None:
+        """Merge pending keys into the sorted array."""
+        if not self._pending:
+            return
+        pending = set(self._pending)
+        self._pending = []
+        if len(pending) < len(self._keys) // 8:
+            # skip names already indexed; cheap relative to a full re-sort
+            pending = [k for k in pending if not self._contains(k)]
+            self._keys.extend(pending)
+            self._keys.sort()  # timsort merges the two sorted runs
+        else:
+            self._keys = sorted(pending.union(self._keys))
+
+    def _contains(self, key: str) -> bool:
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def search(self, prefix: str) -> Generator[str, None, None]:
+        """Yield indexed keys that start with the given prefix, in order.
+
+        Arguments:
+            prefix: Start of the keys to find.
+        Returns:
+            Generator of keys.
+        """
+        self._merge()
+        keys = self._keys
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                break
+            yield key
+
+
+# __END__
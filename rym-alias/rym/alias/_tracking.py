@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Track Alias Usage
+^^^^^^^^^^^^^^^^^
+
+Every lookup is counted by default. Use `tracking` to count a sample of
+lookups, only the most frequent values, or to disable counting altogether.
+
+>>> from rym.alias import Alias
+>>> x = Alias('prd', aliases=['prod'], transforms=None)
+>>> x.identify('prod')
+'prd'
+>>> x._attempts
+{'prd': 0, 'prod': 1}
+
+>>> x = Alias('prd', aliases=['prod'], tracking='off')
+>>> x.identify('prod')
+'prd'
+>>> x._attempts is None
+True
+
+>>> from rym.alias import TopKTracker
+>>> x = Alias('prd', aliases=['prod'], tracking=TopKTracker(k=2))
+>>> _ = x.identify_many(['prod', 'prod', 'prod', 'a', 'b'], default=None)
+>>> x._attempts
+{'prod': 3, 'b': 2}
+
+"""
+
+import heapq
+import logging
+import random
+from functools import singledispatch
+from typing import Any, Hashable, Iterable, Mapping, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ExactTracker(dict):
+    """Count every lookup attempt."""
+
+    def __missing__(self, key: Hashable) -> int:
+        return 0
+
+    def register(self, keys: Iterable[Hashable]) -> None:
+        """Include the given keys, even if never attempted."""
+        for key in keys:
+            self.setdefault(key, 0)
+
+    def track(self, value: Hashable) -> None:
+        """Count one attempt."""
+        self[value] += 1
+
+    def track_many(self, counts: Mapping[Hashable, int]) -> None:
+        """Count attempts in bulk."""
+        for value, n in counts.items():
+            self[value] += n
+
+
+class SampledTracker(ExactTracker):
+    """Count roughly one in every `rate` lookup attempts.
+
+    Sampled attempts are scaled by `rate`, so counts are estimates of the
+    true number of attempts. Bulk counts (e.g., identify_many) are exact.
+
+    Attributes:
+        rate: Average number of attempts per sample.
+    """
+
+    def __init__(self, *args, rate: int = 100, **kwargs) -> None:
+        if rate < 1:
+            raise ValueError(f"invalid rate: {rate}; expected 1 or more")
+        super().__init__(*args, **kwargs)
+        self.rate = rate
+        self._countdown = self._next_countdown()
+
+    def _next_countdown(self) -> int:
+        # randomize the interval to avoid aliasing with periodic input
+        return random.randint(1, 2 * self.rate - 1)
+
+    def track(self, value: Hashable) -> None:
+        """Count one attempt if sampled."""
+        self._countdown -= 1
+        if self._countdown:
+            return
+        self._countdown = self._next_countdown()
+        self[value] += self.rate
+
+
+class TopKTracker(ExactTracker):
+    """Count attempts for (approximately) the k most frequent values.
+
+    Uses the "space-saving" algorithm: when full, an unseen value replaces
+    the least frequent value and inherits its count. Memory is bounded by
+    `k`, and counts are upper bounds for the values that are kept.
+
+    The least frequent value is found with a min-heap of (count, order,
+    value). Entries are not updated in place; an entry is stale once its
+    count no longer matches, and the heap is rebuilt when it grows past
+    twice `k`. Eviction is O(log k) amortized.
+
+    Attributes:
+        k: Maximum number of values to track.
+    """
+
+    def __init__(self, *args, k: int = 100, **kwargs) -> None:
+        if k < 1:
+            raise ValueError(f"invalid k: {k}; expected 1 or more")
+        super().__init__(*args, **kwargs)
+        self.k = k
+        self._heap = []  # (count, order, value)
+        self._order = 0  # break ties without comparing values
+        self._rebuild()
+
+    def register(self, keys: Iterable[Hashable]) -> None:
+        """Ignored. Only attempted values are tracked."""
+
+    def track(self, value: Hashable) -> None:
+        """Count one attempt."""
+        self._add(value, 1)
+
+    def track_many(self, counts: Mapping[Hashable, int]) -> None:
+        """Count attempts in bulk."""
+        for value, n in counts.items():
+            self._add(value, n)
+
+    def _add(self, value: Hashable, n: int) -> None:
+        """Count attempts for one value, evicting the least frequent if full."""
+        if value in self:
+            count = self[value] + n
+        elif len(self) < self.k:
+            count = n
+        else:
+            count = self.pop(self._pop_min()) + n
+        self[value] = count
+        self._order += 1
+        heapq.heappush(self._heap, (count, self._order, value))
+        if len(self._heap) > 2 * self.k:
+            self._rebuild()
+
+    def _pop_min(self) -> Hashable:
+        """Remove and return the least frequent value from the heap."""
+        heap = self._heap
+        while heap:
+            count, _, value = heapq.heappop(heap)
+            if self.get(value) == count:
+                return value
+            # stale: counted again or removed since
+        self._rebuild()  # every entry was stale, e.g., values set directly
+        return heapq.heappop(self._heap)[2]
+
+    def _rebuild(self) -> None:
+        """Replace the heap with one entry per tracked value. O(k)."""
+        self._heap = [(n, i, k) for i, (k, n) in enumerate(self.items())]
+        heapq.heapify(self._heap)
+        self._order = len(self._heap)
+
+
+# resolve tracker
+# ----------------------------------
+
+
+def resolve_tracker(value: Any) -> Optional[ExactTracker]:
+    """Resolve given value into an attempt tracker.
+
+    Supported:
+        - None, False, or "off" to disable tracking
+        - True or "exact" to count every attempt
+        - "sampled" to count a sample of attempts (see SampledTracker)
+        - "topk" to count only the most frequent values (see TopKTracker)
+        - tracker instances (used as is)
+
+    Arguments:
+        value: One of the supported input.
+    Returns:
+        A tracker instance or None if tracking is disabled.
+    Raises:
+        ValueError for invalid input.
+    """
+    return _resolve_tracker(value)
+
+
+@singledispatch
+def _resolve_tracker(value: Any) -> Optional[ExactTracker]:
+    if value is not None:
+        raise ValueError(f"invalid tracking: {value}")
+    return None
+
+
+@_resolve_tracker.register(bool)
+def _(value: bool) -> Optional[ExactTracker]:
+    return ExactTracker() if value else None
+
+
+@_resolve_tracker.register(str)
+def _(value: str) -> Optional[ExactTracker]:
+    cases = {
+        "off": lambda: None,
+        "exact": ExactTracker,
+        "sampled": SampledTracker,
+        "topk": TopKTracker,
+    }
+    try:
+        return cases[value]()
+    except KeyError:
+        raise ValueError(f"invalid tracking: {value}") from None
+
+
+@_resolve_tracker.register(ExactTracker)
+def _(value: ExactTracker) -> ExactTracker:
+    return value
+
+
+# __END__
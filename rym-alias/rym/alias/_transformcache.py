@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Share Transformed Names
+^^^^^^^^^^^^^^^^^^^^^^^
+
+Aliases often share names, e.g., "id" or "name", so the same transforms
+are applied to the same names again and again. A TransformCache remembers
+recent results for each transform. One cache is shared by all aliases.
+
+>>> from rym.alias import Alias, get_transform_cache
+>>> cache = get_transform_cache()
+>>> cache.cache_clear()
+>>> def shout(x):
+...     return f'{x.upper()}!'
+>>> _ = Alias('x', ['id'], transforms=[shout])
+>>> _ = Alias('y', ['id'], transforms=[shout])
+>>> cache.cache_info()
+CacheInfo(hits=1, misses=3, maxsize=65536, currsize=3)
+
+"""
+
+import itertools
+import logging
+import weakref
+from typing import Callable, Hashable, List, NamedTuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics. Same fields as functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TransformCache:
+    """Bounded memo of transform results, keyed by (transform, type, input).
+
+    Once a transform has more than `maxsize` results, only the newest half
+    are kept. Results are only kept while the transform exists.
+
+    NOTE: Transforms with a false `memo` attribute, transforms that do not
+        support weak references, e.g., str.title, and unhashable values are
+        not cached. See rym.alias.variation.
+
+    Attributes:
+        maxsize: Maximum number of results per transform. Use 0 to disable.
+    """
+
+    def __init__(self, maxsize: int = 2**16) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = weakref.WeakKeyDictionary()
+
+    def cache_clear(self) -> None:
+        """Clear results and statistics."""
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return hits, misses, maxsize, and current size."""
+        size = sum(len(x) for x in self._data.values())
+        return CacheInfo(self.hits, self.misses, self.maxsize, size)
+
+    def transform_many(self, func: Callable, values: List[Hashable]) -> List:
+        """Return the given transform applied to each value.
+
+        Arguments:
+            func: Transform to apply. Uses the batch implementation, if any.
+            values: Values to transform.
+        Returns:
+            List of transformed values, in the same order.
+        Raises:
+            Any exception raised by the transform. Nothing is cached.
+        """
+        if not self.maxsize or not getattr(func, "memo", True):
+            return _apply(func, values)
+        try:
+            memo = self._data.get(func)
+            if memo is None:
+                memo = self._data[func] = {}
+            # key by type, too; otherwise 1, 1.0, and True share a result
+            keys = [(type(x), x) for x in values]
+            missing = [k for k in dict.fromkeys(keys) if k not in memo]
+        except TypeError:
+            return _apply(func, values)  # unable to cache
+
+        if missing:
+            memo.update(zip(missing, _apply(func, [x for _, x in missing])))
+        found = [memo[k] for k in keys]
+        if len(memo) > self.maxsize:
+            # keep the newest half; rebuilding avoids a slow, hole-filled dict
+            keep = itertools.islice(memo.items(), len(memo) - self.maxsize // 2, None)
+            self._data[func] = dict(keep)
+        self.misses += len(missing)
+        self.hits += len(values) - len(missing)
+        return found
+
+
+def _apply(func: Callable, values: List[Hashable]) -> List:
+    """Apply transform to each value, using its batch implementation if any."""
+    batch = getattr(func, "batch", None)
+    if batch is None:
+        return [func(x) for x in values]
+    return batch(values)
+
+
+_TRANSFORM_CACHE = TransformCache()
+
+
+def get_transform_cache() -> TransformCache:
+    """Return the transform cache shared by all aliases."""
+    return _TRANSFORM_CACHE
+
+
+# __END__
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Report Alias Usage
+^^^^^^^^^^^^^^^^^^
+
+Lookup attempts show which names are used, which are never used, and which
+unknown values are requested most often. Use a UsageReport to prune
+catalogs or to find missing aliases.
+
+>>> import io
+>>> from rym.alias import AliasResolver
+>>> x = AliasResolver.build(prd=['prod'], dev=['develop'], transforms=None)
+>>> x.identify_many(['prod', 'prod', 'dev', 'qa'], default=None)
+['prd', 'prd', 'dev', None]
+>>> report = x.usage()
+>>> report.identities
+{'prd': 2, 'dev': 1}
+>>> report.unused()
+['prd', 'develop']
+>>> report.misses
+[('qa', 1)]
+>>> stream = io.StringIO()
+>>> report.to_csv(stream)
+>>> print(stream.getvalue().replace('\\r', ''))
+kind,value,identity,hits
+name,prd,prd,0
+name,prod,prd,2
+name,dev,dev,1
+name,develop,dev,0
+miss,qa,,1
+<BLANKLINE>
+
+Reports are built in one pass over the attempts. Only the top misses are
+ranked, using a heap, so nothing is fully sorted.
+
+NOTE: With sampled or top-k tracking, counts are estimates and names may
+    appear unused. See rym.alias._tracking.
+
+"""
+
+import csv
+import dataclasses as dcs
+import heapq
+import json
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class NameUsage(NamedTuple):
+    """Hits for one known name."""
+
+    name: Hashable
+    identity: Hashable
+    hits: int
+
+
+@dcs.dataclass
+class UsageReport:
+    """Lookup attempts of an alias or resolver.
+
+    Attributes:
+        names: Hits for each known name, in index order.
+        identities: Total hits for each identity, in index order.
+        misses: Most frequent unknown values and their counts, most first.
+    """
+
+    names: List[NameUsage]
+    identities: Dict[Hashable, int]
+    misses: List[Tuple[Hashable, int]]
+
+    def top(self, k: int = 10) -> List[NameUsage]:
+        """Return the k most used names, most first."""
+        return heapq.nlargest(k, self.names, key=_hits)
+
+    def unused(self) -> List[Hashable]:
+        """Return names that were never found."""
+        return [x.name for x in self.names if not x.hits]
+
+    def unused_identities(self) -> List[Hashable]:
+        """Return identities that were never found, e.g., to prune."""
+        return [k for k, v in self.identities.items() if not v]
+
+    def to_csv(self, stream: TextIO) -> None:
+        """Write one row per known name and per top miss.
+
+        Columns are kind ("name" or "miss"), value, identity, and hits.
+        """
+        writer = csv.writer(stream)
+        writer.writerow(["kind", "value", "identity", "hits"])
+        writer.writerows(("name", *x) for x in self.names)
+        writer.writerows(("miss", value, None, n) for value, n in self.misses)
+
+    def to_json(self, stream: TextIO, **kwargs) -> None:
+        """Write names, identities, and misses as a JSON object.
+
+        Values that JSON does not support are written as strings.
+
+        Arguments:
+            stream: Destination.
+            **kwargs: Keywords for json.dump.
+        Returns:
+            None
+        """
+        data = {
+            "names": [x._asdict() for x in self.names],
+            "identities": [
+                {"identity": k, "hits": v} for k, v in self.identities.items()
+            ],
+            "misses": [{"value": k, "hits": v} for k, v in self.misses],
+        }
+        kwargs.setdefault("default", str)
+        json.dump(data, stream, **kwargs)
+
+
+def _hits(item: NameUsage) -> int:
+    return item.hits
+
+
+def build_usage_report(
+    attempts: Mapping[Hashable, int],
+    names: Mapping[Hashable, Hashable],
+    identities: Iterable[Hashable],
+    find: Optional[Callable[[Hashable], Hashable]] = None,
+    top: int = 10,
+) -> UsageReport:
+    """Return usage for the given attempts.
+
+    Arguments:
+        attempts: Count for each attempted (and registered) value.
+        names: Identity for each known name.
+        identities: Every identity, including those never found.
+        find: Optional identity for values that are not known names, e.g.,
+            names found on demand. Raise KeyError if unknown.
+        top: Maximum number of misses to report.
+    Returns:
+        A UsageReport instance.
+    """
+    found = {}  # value: (identity, hits) for values found on demand
+    misses = []
+    for value, n in attempts.items():
+        if value in names:
+            continue
+        if find is not None:
+            try:
+                found[value] = (find(value), n)
+                continue
+            except KeyError:
+                ...  # unknown value
+        if n:
+            misses.append((value, n))
+
+    totals = dict.fromkeys(identities, 0)
+    usage = []
+    for name, identity in names.items():
+        n = attempts.get(name, 0)
+        totals[identity] += n
+        usage.append(NameUsage(name, identity, n))
+    for name, (identity, n) in found.items():
+        totals[identity] = totals.get(identity, 0) + n
+        usage.append(NameUsage(name, identity, n))
+
+    misses = heapq.nlargest(top, misses, key=_itemgetter_1)
+    return UsageReport(usage, totals, misses)
+
+
+def _itemgetter_1(item: Tuple[Any, Any]) -> Any:
+    return item[1]
+
+
+# __END__
@@ -1,49 +1,106 @@
 #!/usr/bin/env python3
-""".
-
 """
+Sort Mixed Types
+^^^^^^^^^^^^^^^^
 
-import logging
-from functools import singledispatch
-from typing import Any, Callable, Iterable, Optional, Tuple, Union
-
-LOGGER = logging.getLogger(__name__)
-
-
-def get_safekey(key: Optional[Callable]) -> Callable:
-    if not key:
-        return _safekey
-
-    def wrapper(value: Any) -> Tuple[int, str]:
-        try:
-            return (0, key(value))
-        except Exception:
-            return _safekey(value)
+Names may be strings, numbers, or other hashable values, which cannot be
+compared with each other. Values are grouped by kind, each group is sorted
+natively, and groups are joined in a safe order: values supported by `key`
+(if given), numbers, strings, then anything else by its string form.
 
-    return wrapper
+>>> from rym.alias.safesort import safesorted
+>>> safesorted(['b', 10, 'A', -1, 2.5, None])
+[-1, 2.5, 10, 'A', 'b', None]
 
+"""
 
-@singledispatch
-def _safekey(value: Any) -> Tuple[int, str]:
-    return (20, str(value))
-
-
-@_safekey.register(str)
-def _(value: str) -> Tuple[int, str]:
-    return (10, value)
-
+import itertools
+import logging
+import warnings
+from operator import itemgetter
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
-@_safekey.register(int)
-@_safekey.register(float)
-def _(value: Union[int, float]) -> Tuple[int, str]:
-    # will break with very large numbers, but not likely an issue
-    # - with 64 bits, max int is 19 characters
-    return (10, "{:64}".format(value))
+LOGGER = logging.getLogger(__name__)
 
 
-def safesorted(iterable: Iterable, *, key=None, **kwargs) -> Iterable:
-    """Return a new sorted list from items in iterable."""
-    return sorted(iterable, key=get_safekey(key), **kwargs)
+def safesorted(
+    iterable: Iterable,
+    *,
+    key: Optional[Callable] = None,
+    reverse: bool = False,
+) -> List:
+    """Return a new sorted list from items in iterable.
+
+    Arguments:
+        iterable: Values to sort. May mix types.
+        key: Optional key. Values it fails on are sorted by kind.
+        reverse: If true, sort in descending order.
+    Returns:
+        Sorted list. Equal values keep their given order.
+    """
+    keyed = []  # (key, value)
+    numbers = []
+    strings = []
+    others = []
+    for value in iterable:
+        if key is not None:
+            try:
+                keyed.append((key(value), value))
+                continue
+            except Exception:
+                ...  # sort by kind
+        kind = type(value)
+        if kind is str:
+            strings.append(value)
+        elif kind is int or kind is float:
+            numbers.append(value)
+        elif isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, (int, float)):
+            numbers.append(value)  # includes bool
+        else:
+            others.append(value)
+
+    groups = [
+        [x for _, x in sorted(keyed, key=itemgetter(0), reverse=reverse)],
+        sorted(numbers, reverse=reverse),
+        sorted(strings, reverse=reverse),
+        sorted(others, key=str, reverse=reverse),
+    ]
+    if reverse:
+        groups.reverse()
+    return list(itertools.chain.from_iterable(groups))
+
+
+def get_safekey(key: Optional[Callable] = None) -> Callable[[Any], Tuple[int, Any]]:
+    """Return a sort key that orders values the same way as safesorted.
+
+    Deprecated: use safesorted, which sorts each kind natively and is faster.
+
+    Arguments:
+        key: Optional key. Values it fails on are sorted by kind.
+    Returns:
+        Key function for sorted.
+    """
+    warnings.warn(
+        "get_safekey is deprecated; use safesorted instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
+    def safekey(value: Any) -> Tuple[int, Any]:
+        if key is not None:
+            try:
+                return (0, key(value))
+            except Exception:
+                ...  # sort by kind
+        if isinstance(value, str):
+            return (2, value)
+        if isinstance(value, (int, float)):
+            return (1, value)  # includes bool
+        return (3, str(value))
+
+    return safekey
 
 
 # __END__
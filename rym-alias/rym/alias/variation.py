@@ -1,13 +1,60 @@
 #!/usr/bin/env python3
 """Common variations for aliasing.
 
+Transforms may provide a `batch` attribute: a callable that takes a list of
+values and returns the list of transformed values. Aliases use it to
+transform many names in one call. Without it, each name is transformed
+individually.
+
+Transform results are cached and shared across aliases (see
+rym.alias.get_transform_cache). Set a `memo` attribute to False for
+transforms that are cheaper to repeat than to look up, e.g., str methods.
+
+Transforms may also provide a `normalize` attribute: a callable such that
+normalize(transform(x)) == normalize(x). Lazy aliases do not store names
+made by these transforms; they find them on demand (see rym.alias._lazy).
+
 """
 
 import logging
+from typing import Callable, List
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _batch(func: Callable[[List[str]], List[str]], memo: bool = False) -> Callable:
+    """Attach the given batch implementation to the decorated transform."""
+
+    def decorator(transform: Callable[[str], str]) -> Callable[[str], str]:
+        transform.batch = func
+        transform.memo = memo
+        return transform
+
+    return decorator
+
+
+def _normalize(func: Callable[[str], str]) -> Callable:
+    """Attach the given normalization to the decorated transform."""
+
+    def decorator(transform: Callable[[str], str]) -> Callable[[str], str]:
+        transform.normalize = func
+        return transform
+
+    return decorator
+
+
+def _caseless(value: str) -> str:
+    """Return the same key for any case of the given value."""
+    return value.upper().casefold()
+
+
+def _strip_s(value: str) -> str:
+    """Return the same key with or without trailing 's' characters."""
+    return value.rstrip("s")
+
+
+@_normalize(_caseless)
+@_batch(lambda values: list(map(str.capitalize, values)))
 def capitalize(value: str) -> str:
     """Capitalize.
 
@@ -16,6 +63,18 @@ def capitalize(value: str) -> str:
     return value.capitalize()
 
 
+@_normalize(_caseless)
+@_batch(lambda values: [casefold(x) for x in values])
+def casefold(value: str) -> str:
+    """Convert to casefold for caseless matching. Non-strings returned as is.
+
+    NOTE: Compatible signature for alias transforms.
+    """
+    return value.casefold() if isinstance(value, str) else value
+
+
+@_normalize(_strip_s)
+@_batch(lambda values: [x.rstrip("s") for x in values])
 def deesser(value: str) -> str:
     """Remove any trailing 's' characters.
 
@@ -27,6 +86,8 @@ def deesser(value: str) -> str:
     return value.rstrip("s")
 
 
+@_normalize(_strip_s)
+@_batch(lambda values: [x if x.endswith("s") else f"{x}s" for x in values])
 def esser(value: str) -> str:
     """Add an 's' to the end of a word -- if there isn't one.
 
@@ -40,6 +101,8 @@ def esser(value: str) -> str:
     return f"{value}s"
 
 
+@_normalize(_caseless)
+@_batch(lambda values: list(map(str.lower, values)))
 def lower(value: str) -> str:
     """Convert to lowercase.
 
@@ -48,6 +111,8 @@ def lower(value: str) -> str:
     return value.lower()
 
 
+@_normalize(_caseless)
+@_batch(lambda values: list(map(str.upper, values)))
 def upper(value: str) -> str:
     """Convert to uppercase.
 
@@ -8,6 +8,7 @@ import stringcase as sc
 
 import rym.alias as MOD
 from rym.alias import variation
+from rym.alias._alias import expand_lookup_many, set_transforms_many, transform_many
 
 LOGGER = logging.getLogger(__name__)
 
@@ -130,6 +131,13 @@ class TestAddAlias(ThisTestCase):
         found = subject.identify(given)
         self.assertEqual(expected, found)
 
+    def test_identifiable_without_transforms(self):
+        subject = self.get_subject(transforms=None)
+        expected = subject.identity
+        subject.add_alias("foo_bar")
+        found = subject.identify("foo_bar")
+        self.assertEqual(expected, found)
+
     def test_transformed(self):
         subject = self.get_subject()
         given = "foo_bar"
@@ -175,6 +183,131 @@ class TestAddTransform(ThisTestCase):
         self.assertEqual(expected, found)
 
 
+class TestCasefold(ThisTestCase):
+    """Test feature."""
+
+    def get_subject(self, **kwargs) -> MOD.Alias:
+        given = {
+            "identity": "fooBar",
+            "aliases": ["FOO_bar"],
+            "casefold": True,
+            **kwargs,
+        }
+        return MOD.Alias(**given)
+
+    def test_stores_casefolded_names_only(self):
+        subject = self.get_subject()
+        expected = ["foo_bar", "foobar"]
+        found = subject.all_names()
+        self.assertEqual(expected, found)
+
+    def test_lists_variants(self):
+        subject = self.get_subject()
+        expected = MOD.Alias("fooBar", ["FOO_bar"]).all_names()
+        found = subject.all_names(variants=True)
+        self.assertEqual(expected, found)
+
+    def test_identify_ignores_case(self):
+        subject = self.get_subject(transforms=None)
+        for value in ["FOOBAR", "foo_BAR", "Foo_Bar"]:
+            with self.subTest(value):
+                found = subject.identify(value)
+                self.assertEqual("fooBar", found)
+        with self.assertRaises(KeyError):
+            subject.identify("foo")
+
+    def test_identify_many_ignores_case(self):
+        subject = self.get_subject(transforms=None)
+        expected = ["fooBar", "fooBar", None]
+        found = subject.identify_many(["FOOBAR", "foobar", "foo"], default=None)
+        self.assertEqual(expected, found)
+        self.assertEqual({"foobar": 2, "foo_bar": 0, "foo": 1}, subject._attempts)
+
+    def test_supports_non_string(self):
+        subject = MOD.Alias(None, [None, 42, "NaN"], casefold=True)
+        self.assertIsNone(subject.identify(42))
+        self.assertIsNone(subject.identify("nan"))
+
+    def test_add_alias_and_transform(self):
+        subject = self.get_subject(transforms=None)
+        subject.add_alias("Meh")
+        subject.add_transform(sc.spinalcase)
+        self.assertEqual("fooBar", subject.identify("MEH"))
+        self.assertEqual("fooBar", subject.identify("FOO-BAR"))
+
+    def test_set_casefold(self):
+        subject = self.get_subject(casefold=False)
+        subject.set_casefold(True)
+        self.assertEqual(["foo_bar", "foobar"], subject.all_names())
+        subject.set_casefold(False)
+        with self.assertRaises(KeyError):
+            subject.identify("fOObAR")
+
+
+class TestLazy(ThisTestCase):
+    """Test feature."""
+
+    def get_subject(self, **kwargs) -> MOD.Alias:
+        given = {
+            "identity": "fooBar",
+            "aliases": ["foo_bar", 42],
+            "transforms": ["upper", "esser", sc.spinalcase],
+            "lazy": True,
+            **kwargs,
+        }
+        return MOD.Alias(**given)
+
+    def test_stores_raw_and_eager_names_only(self):
+        subject = self.get_subject()
+        expected = [42, "42", "foo-bar", "fooBar", "foo_bar"]
+        found = subject.all_names()
+        self.assertEqual(expected, found)
+
+    def test_lists_variants(self):
+        subject = self.get_subject()
+        expected = self.get_subject(lazy=False).all_names()
+        found = subject.all_names(variants=True)
+        self.assertEqual(expected, found)
+
+    def test_identify_matches_eager(self):
+        eager = self.get_subject(lazy=False)
+        tests = [*eager.all_names(), "FOO_BARs", "FoObAr", "foo_bars", "fooBarss"]
+        for casefold in (False, True):
+            subject = self.get_subject(casefold=casefold)
+            expected_subject = self.get_subject(casefold=casefold, lazy=False)
+            for value in tests:
+                with self.subTest(value, casefold=casefold):
+                    expected = expected_subject.identify_many([value], None)
+                    found = subject.identify_many([value], None)
+                    self.assertEqual(expected, found)
+                    if expected[0] is not None:
+                        self.assertEqual(expected[0], subject.identify(value))
+
+    def test_updates_on_change(self):
+        subject = self.get_subject()
+        self.assertEqual("fooBar", subject.identify("FOO_BAR"))
+        subject.add_alias("meh")
+        self.assertEqual("fooBar", subject.identify("MEH"))
+        subject.add_transform("lower")
+        self.assertEqual("fooBar", subject.identify("foobar"))
+        subject.set_transforms(None)
+        with self.assertRaises(KeyError):
+            subject.identify("FOO_BAR")
+
+    def test_set_lazy(self):
+        subject = self.get_subject(lazy=False)
+        subject.set_lazy(True)
+        self.assertEqual(self.get_subject().all_names(), subject.all_names())
+        subject.set_lazy(False)
+        expected = self.get_subject(lazy=False).all_names()
+        self.assertEqual(expected, subject.all_names())
+
+    def test_freeze_includes_variants(self):
+        expected = self.get_subject(lazy=False).all_names()
+        found = MOD.FrozenAlias.clone(self.get_subject()).all_names()
+        self.assertEqual(expected, found)
+
+
 class TestIdentify(ThisTestCase):
     """Test function."""
 
@@ -228,6 +361,147 @@ class TestIdentify(ThisTestCase):
         self.assertEqual(expected, found)
 
 
+class TestSetTracking(ThisTestCase):
+    """Test method."""
+
+    def test_disable(self):
+        subject = MOD.Alias("a", ["b"], tracking="off")
+        subject.identify("b")
+        subject.identify_many(["a", "b"])
+        self.assertIsNone(subject._attempts)
+
+    def test_replaces_tracker(self):
+        subject = MOD.Alias("a", ["b"])
+        subject.identify("b")
+        subject.set_tracking("topk")
+        subject.identify("b")
+        expected = {"b": 1}
+        found = subject._attempts
+        self.assertEqual(expected, found)
+        self.assertEqual("topk", subject.tracking)
+
+    def test_keeps_counts_of_given_tracker(self):
+        subject = MOD.Alias("a", ["b"], transforms=None)
+        subject.identify("b")
+        subject.set_tracking(subject._attempts)
+        subject.identify("b")
+        self.assertEqual({"a": 0, "b": 2}, subject._attempts)
+
+
+class TestRemoveAlias(ThisTestCase):
+    """Test method."""
+
+    def test_removes_transformed_names(self):
+        subject = MOD.Alias("foo", ["bar", "baz"], transforms=[variation.upper])
+        subject.remove_alias("bar")
+        self.assertEqual(["baz"], subject.aliases)
+        self.assertEqual(["BAZ", "FOO", "baz", "foo"], subject.all_names())
+        with self.assertRaises(KeyError):
+            subject.identify("BAR")
+
+    def test_keeps_names_made_by_other_names(self):
+        subject = MOD.Alias("foo", ["bar", "BAR"], transforms=[variation.upper])
+        subject.remove_alias("bar")
+        self.assertEqual("foo", subject.identify("BAR"))
+        self.assertNotIn("bar", subject._lookup)
+
+    def test_raises_if_unknown(self):
+        subject = MOD.Alias("foo", ["bar"])
+        for given in ["meh", "BAR", "foo"]:  # identity is not an alias
+            with self.subTest(given):
+                with self.assertRaisesRegex(KeyError, given):
+                    subject.remove_alias(given)
+
+    def test_discard(self):
+        subject = MOD.Alias("foo", ["bar"])
+        subject.discard("meh")  # should not raise
+        subject.discard("bar")
+        self.assertEqual([], subject.aliases)
+
+    def test_drops_attempts(self):
+        subject = MOD.Alias("foo", ["bar"], transforms=None)
+        subject.identify("bar")
+        subject.remove_alias("bar")
+        self.assertNotIn("bar", subject._attempts)
+        self.assertIn("foo", subject._attempts)
+
+    def test_lazy(self):
+        subject = MOD.Alias("foo", ["bar"], transforms=[variation.esser], lazy=True)
+        self.assertEqual("foo", subject.identify("bars"))
+        subject.remove_alias("bar")
+        with self.assertRaises(KeyError):
+            subject.identify("bars")
+        self.assertEqual("foo", subject.identify("foos"))
+
+
+class TestAllNames(ThisTestCase):
+    """Test method."""
+
+    def test_returns_copy(self):
+        subject = MOD.Alias("foo", ["bar"], transforms=None)
+        found = subject.all_names()
+        found.append("meh")
+        self.assertEqual(["bar", "foo"], subject.all_names())
+
+    def test_cache_cleared_on_change(self):
+        subject = MOD.Alias("foo", ["bar"], transforms=None)
+        tests = [
+            # (expected, given)
+            (["bar", "baz", "foo"], lambda: subject.add_alias("baz")),
+            (
+                ["BAR", "BAZ", "FOO", "bar", "baz", "foo"],
+                lambda: subject.add_transform("upper"),
+            ),
+            (
+                ["BARS", "BAZS", "FOOS", "bar", "baz", "foo"],
+                lambda: subject.set_transforms([lambda x: f"{x.upper()}S"]),
+            ),
+            (
+                ["bar", "bars", "baz", "bazs", "foo", "foos"],
+                lambda: subject.set_casefold(True),
+            ),
+            (["bar", "baz", "foo"], lambda: subject.set_transforms("upper")),
+            (["bar", "baz", "foo"], lambda: subject.set_lazy(True)),
+            (["bar", "baz", "foo"], lambda: set_transforms_many([subject], None)),
+        ]
+        for expected, given in tests:
+            with self.subTest(expected):
+                subject.all_names()  # cache
+                given()
+                found = subject.all_names()
+                self.assertEqual(expected, found)
+
+    def test_supports_custom_sort(self):
+        subject = MOD.Alias("foo", ["bar", 1], transforms=None)
+        self.assertEqual([1, "bar", "foo"], subject.all_names())
+        found = subject.all_names(reverse=True)
+        self.assertEqual(["foo", "bar", 1], found)
+        found = subject.all_names(_sorted=list)
+        self.assertEqual(["foo", "bar", 1], found)
+
+
+class TestIdentifyMany(ThisTestCase):
+    """Test method."""
+
+    def test_raises_if_unknown_alias(self):
+        subject = MOD.Alias("fooBar", ["FOO_bar"])
+        with self.assertRaisesRegex(KeyError, "foo"):
+            subject.identify_many(["fooBar", "foo"])
+
+    def test_returns_identity_for_each(self):
+        subject = MOD.Alias("a", ["b"])
+        expected = ["a", "a", None, "a"]
+        found = subject.identify_many(["A", "b", "c", "b"], default=None)
+        self.assertEqual(expected, found)
+
+    def test_tracks_attempts(self):
+        subject = MOD.Alias("a", ["b"], transforms=None)
+        subject.identify_many(iter(["a", "b", "b", "c"]), default=None)
+        expected = {"a": 1, "b": 2, "c": 1}
+        found = subject._attempts
+        self.assertEqual(expected, found)
+
+
 class TestSetTransforms(ThisTestCase):
     """Test method."""
 
@@ -274,6 +548,99 @@ class TestSetTransforms(ThisTestCase):
                 subject.identify("FOOBAR")  # default transform
 
 
+class TestSetTransformsMany(ThisTestCase):
+    """Test function."""
+
+    def test_matches_set_transforms(self):
+        transforms = [variation.esser, variation.upper, lambda x: f"_{x}"]
+        given = [
+            MOD.Alias("foo", ["bar"]),
+            MOD.Alias("hello", ["Hola", "aloha"], casefold=True),
+            MOD.Alias("meh", None, transforms=transforms),  # unchanged
+        ]
+        expected = [
+            MOD.Alias(x.identity, x.aliases[:], transforms, casefold=x.casefold)
+            for x in given
+        ]
+        set_transforms_many(given, transforms)
+        for expected_alias, found in zip(expected, given):
+            with self.subTest(found.identity):
+                self.assertEqual(expected_alias.transforms, found.transforms)
+                self.assertEqual(expected_alias._lookup, found._lookup)
+
+    def test_skips_lazy_transforms(self):
+        aliases = [
+            MOD.Alias("foo", ["bar"], transforms=None, lazy=True),
+            MOD.Alias("hello", ["hola"], transforms=None),
+        ]
+        set_transforms_many(aliases, ["upper", sc.spinalcase])
+        self.assertEqual(["bar", "foo"], aliases[0].all_names())
+        self.assertEqual("foo", aliases[0].identify("BAR"))
+        self.assertEqual(["HELLO", "HOLA", "hello", "hola"], aliases[1].all_names())
+
+    def test_handles_failure_per_alias(self):
+        given = [MOD.Alias(42, ["foo"]), MOD.Alias("bar", None)]
+        set_transforms_many(given, [variation.upper])
+        self.assertEqual({42: 1, "foo": 1, "FOO": 1}, given[0]._lookup)
+        self.assertEqual({"bar": 1, "BAR": 1}, given[1]._lookup)
+
+        given = [MOD.Alias(42, ["foo"], strict=True, transforms=None)]
+        with self.assertRaisesRegex(RuntimeError, "unable to create lookup"):
+            set_transforms_many(given, [variation.upper])
+
+
+class TestExpandLookupMany(ThisTestCase):
+    """Test function."""
+
+    def test_matches_expand_lookup(self):
+        transforms = [variation.esser, variation.upper, lambda x: f"_{x}"]
+        given = [
+            MOD.Alias("foo", ["bar"], transforms=transforms, lazy=True),
+            MOD.Alias("hi", ["Hola"], transforms, casefold=True, lazy=True),
+            MOD.Alias("meh", ["ugh"], transforms=transforms),  # not lazy
+            MOD.Alias(42, [42], transforms=[variation.upper], lazy=True),
+        ]
+        found = expand_lookup_many(given)
+        for alias, names in zip(given, found):
+            with self.subTest(alias.identity):
+                self.assertEqual(dict(alias._expand_lookup()), dict(names))
+
+
+class TestPack(ThisTestCase):
+    """Test methods."""
+
+    def test_unpack_matches_given(self):
+        transforms = [variation.esser, variation.upper]
+        tests = [
+            MOD.Alias("foo", ["bar"]),
+            MOD.Alias("hi", ["Hola"], transforms, casefold=True, lazy=True),
+            MOD.Alias(42, [42], transforms=None, tracking="off"),
+        ]
+        for given in tests:
+            with self.subTest(given.identity):
+                with mock.patch.object(MOD.Alias, "_build_lookup") as build:
+                    found = MOD.Alias._unpack(given._pack())
+                build.assert_not_called()  # names not transformed again
+                self.assertEqual(given, found)
+                self.assertEqual(given._lookup, found._lookup)
+                self.assertEqual(given._expand_lookup(), found._expand_lookup())
+                self.assertEqual(given.tracking, found.tracking)
+
+
+class TestTransformMany(ThisTestCase):
+    """Test function."""
+
+    def test_uses_batch(self):
+        func = mock.Mock(batch=mock.Mock(return_value=["A", "B"]))
+        found = transform_many(func, ["a", "b"])
+        self.assertEqual(["A", "B"], found)
+        func.assert_not_called()
+
+    def test_falls_back_to_single_transform(self):
+        found = transform_many(str.title, ["foo bar", "x"])
+        self.assertEqual(["Foo Bar", "X"], found)
+
+
 class TestResolveVariations(ThisTestCase):
     """Test function."""
 
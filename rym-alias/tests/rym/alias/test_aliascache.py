@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+import rym.alias._aliascache as MOD
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+    def get_temporary_directory(self) -> Path:
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        return Path(tmpdir.name)
+
+    def get_source(self) -> Path:
+        path = Path(self.get_temporary_directory(), "aliases.json")
+        path.write_text("[]")
+        return path
+
+
+class TestGetCachePath(ThisTestCase):
+    """Test function."""
+
+    def test_changes_with_key_parts(self):
+        path = self.get_source()
+        a = MOD.get_cache_path(path, "cache", "a")
+        b = MOD.get_cache_path(path, "cache", "b")
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, MOD.get_cache_path(path, "cache", "a"))
+
+    def test_changes_with_mtime(self):
+        path = self.get_source()
+        initial = MOD.get_cache_path(path, "cache")
+        os.utime(path, ns=(0, 0))
+        found = MOD.get_cache_path(path, "cache")
+        self.assertNotEqual(initial, found)
+
+
+class TestLoadCached(ThisTestCase):
+    """Test function."""
+
+    def test_loads_once(self):
+        path = self.get_source()
+        cache_dir = self.get_temporary_directory()
+        loader = mock.Mock(return_value={"a": 1})
+        for _ in range(3):
+            found = MOD.load_cached(path, loader, cache_dir, "key")
+            self.assertEqual({"a": 1}, found)
+        loader.assert_called_once_with(path)
+
+    def test_reloads_if_stale(self):
+        path = self.get_source()
+        cache_dir = self.get_temporary_directory()
+        loader = mock.Mock(side_effect=[1, 2])
+        MOD.load_cached(path, loader, cache_dir)
+        os.utime(path, ns=(0, 0))
+        found = MOD.load_cached(path, loader, cache_dir)
+        self.assertEqual(2, found)
+        self.assertEqual(1, len(list(cache_dir.iterdir())), "stale cache kept")
+
+    def test_ignores_invalid_cache(self):
+        path = self.get_source()
+        cache_dir = self.get_temporary_directory()
+        MOD.get_cache_path(path, cache_dir).write_bytes(b"not a pickle")
+        logger = mock.Mock()
+        found = MOD.load_cached(path, lambda x: 42, cache_dir, logger=logger)
+        self.assertEqual(42, found)
+        logger.warning.assert_called_once()
+
+    def test_returns_value_if_unable_to_cache(self):
+        path = self.get_source()
+        cache_dir = self.get_temporary_directory()
+        logger = mock.Mock()
+        found = MOD.load_cached(path, lambda x: lambda: 42, cache_dir, logger=logger)
+        self.assertEqual(42, found())
+        self.assertEqual([], list(cache_dir.iterdir()))
+        logger.warning.assert_called_once()
+
+    def test_returns_value_if_cache_dir_is_unusable(self):
+        path = self.get_source()
+        cache_dir = Path(path, "cache")  # parent is a file
+        logger = mock.Mock()
+        found = MOD.load_cached(path, lambda x: 42, cache_dir, logger=logger)
+        self.assertEqual(42, found)
+        self.assertEqual("unable to cache: %s (%s)", logger.warning.call_args[0][0])
+
+
+class TestSaveCached(ThisTestCase):
+    """Test function."""
+
+    def test_returns_false_if_unable_to_write(self):
+        cache_path = Path(self.get_temporary_directory(), "meh-a-b.pickle")
+        logger = mock.Mock()
+        with mock.patch.object(Path, "open", side_effect=PermissionError("nope")):
+            found = MOD.save_cached(cache_path, 42, logger=logger)
+        self.assertFalse(found)
+        self.assertEqual([], list(cache_path.parent.iterdir()))
+        logger.warning.assert_called_once()
+
+    def test_ignores_stale_files_removed_elsewhere(self):
+        cache_dir = self.get_temporary_directory()
+        stale = Path(cache_dir, "meh-a-old.pickle")
+        stale.write_bytes(b"")
+        cache_path = Path(cache_dir, "meh-a-new.pickle")
+        unlink = Path.unlink
+
+        def race(self, *args, **kwargs):
+            if self == stale:
+                unlink(self)  # removed by another process first
+            return unlink(self, *args, **kwargs)
+
+        with mock.patch.object(Path, "unlink", race):
+            found = MOD.save_cached(cache_path, 42)
+        self.assertTrue(found)
+        self.assertEqual([cache_path], list(cache_dir.iterdir()))
+
+
+# __END__
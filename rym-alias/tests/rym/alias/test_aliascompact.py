@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+import sys
+from unittest import TestCase
+
+import rym.alias._aliascompact as MOD
+from rym.alias import variation
+from rym.alias._alias import Alias
+from rym.alias._aliasresolver import AliasResolver
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestCompactAlias(ThisTestCase):
+    """Test class."""
+
+    def test_lookup_matches_alias(self):
+        tests = [
+            # (kwargs)
+            {},
+            {"transforms": None},
+            {"transforms": [variation.esser, variation.deesser]},
+            {"casefold": True},
+            {"transforms": [variation.upper, lambda x: x.title()], "casefold": True},
+        ]
+        for kwargs in tests:
+            with self.subTest(kwargs):
+                expected = Alias("foo", ["bar", "Baz", 42], **kwargs)
+                subject = MOD.CompactAlias("foo", ["bar", "Baz", 42], **kwargs)
+                self.assertEqual(set(expected._lookup), set(subject._lookup))
+                self.assertEqual(tuple(expected.transforms), subject.transforms)
+
+    def test_clone(self):
+        given = Alias("foo", ["bar"], transforms=[variation.esser], casefold=True)
+        subject = MOD.CompactAlias.clone(given)
+        self.assertEqual("foo", subject.identify("BARS"))
+        self.assertEqual(MOD.CompactAlias("foo", "bar", "esser", True), subject)
+
+    def test_is_compact(self):
+        subject = MOD.CompactAlias("foo", ["b" + "ar"])
+        other = MOD.CompactAlias("hello", ["hola"])
+        self.assertFalse(hasattr(subject, "__dict__"))
+        self.assertIs(subject.transforms, other.transforms)
+        self.assertIs(sys.intern("bar"), subject.aliases[0])
+        self.assertIsInstance(subject._lookup, tuple)
+        subject = MOD.CompactAlias("foo", [f"bar{i}" for i in range(8)])
+        self.assertIsInstance(subject._lookup, frozenset)  # many names
+
+    def test_shares_only_static_transforms(self):
+        def local(x):
+            return x
+
+        tests = [
+            # (expected, transforms)
+            (True, [variation.upper, str.lower, len]),
+            (False, [variation.upper, lambda x: x]),
+            (False, [local]),
+            (False, ["abc".upper]),  # bound to an instance
+        ]
+        for expected, transforms in tests:
+            with self.subTest(transforms):
+                size = len(MOD._TRANSFORMS)
+                subject = MOD.CompactAlias("foo", transforms=transforms)
+                other = MOD.CompactAlias("bar", transforms=transforms)
+                self.assertEqual(expected, subject.transforms is other.transforms)
+                self.assertLessEqual(len(MOD._TRANSFORMS), size + expected)
+
+    def test_identify(self):
+        subject = MOD.CompactAlias("foo", ["bar"])
+        self.assertEqual("foo", subject.identify("BAR"))
+        with self.assertRaisesRegex(KeyError, "bAR"):
+            subject.identify("bAR")
+        subject.set_casefold(True)
+        self.assertEqual("foo", subject.identify("bAR"))
+
+    def test_add_alias(self):
+        subject = MOD.CompactAlias("foo", ["bar"])
+        subject.add_alias("baz")
+        subject.add_alias("baz")  # should not add twice
+        self.assertEqual(("bar", "baz"), subject.aliases)
+        self.assertEqual("foo", subject.identify("BAZ"))
+
+    def test_remove_alias(self):
+        subject = MOD.CompactAlias("foo", ["bar", "baz"])
+        subject.remove_alias("bar")
+        subject.discard("bar")  # should not raise
+        self.assertEqual(("baz",), subject.aliases)
+        with self.assertRaises(KeyError):
+            subject.identify("BAR")
+        self.assertEqual("foo", subject.identify("BAZ"))
+        with self.assertRaisesRegex(KeyError, "bar"):
+            subject.remove_alias("bar")
+
+    def test_add_transform(self):
+        subject = MOD.CompactAlias("foo", ["bar"], transforms=None)
+        subject.add_transform("esser")
+        subject.add_transform("esser")  # should not add twice
+        self.assertEqual((variation.esser,), subject.transforms)
+        self.assertEqual("foo", subject.identify("bars"))
+
+    def test_set_transforms(self):
+        subject = MOD.CompactAlias("foo", ["bar"])
+        subject.set_transforms(None)
+        self.assertEqual(("foo", "bar"), subject._lookup)
+
+    def test_resolver(self):
+        subject = AliasResolver.build(
+            MOD.CompactAlias("foo", ["bar"]),
+            {"hello": ["hola"]},
+            casefold=True,
+        )
+        self.assertEqual("foo", subject.identify("bAR"))
+        subject.add_alias("foo", "baz")
+        self.assertEqual("foo", subject.identify("BAZ"))
+        self.assertIsInstance(subject.aliases[0], MOD.CompactAlias)
+
+        with self.subTest("new transforms"):
+            subject = AliasResolver.build(
+                MOD.CompactAlias("foo", ["bar"]), transforms=["esser"]
+            )
+            self.assertEqual("foo", subject.identify("bars"))
+            self.assertEqual((variation.esser,), subject.aliases[0].transforms)
+            self.assertEqual(4, len(subject.aliases[0]._lookup))
+
+
+# __END__
@@ -38,6 +38,32 @@ class TestFrozenAlias(ThisTestCase):
             found = subject.identify("x")
             self.assertEqual(expected, found)
 
+    def test_lookup_is_set(self):
+        subject = MOD.FrozenAlias("a", tuple("xyz"))
+        expected = frozenset("xyz")
+        found = subject._lookup
+        self.assertEqual(expected, found)
+
+    def test_clone_keeps_casefold(self):
+        given = Alias("a", ["Xyz"], casefold=True)
+        subject = MOD.FrozenAlias.clone(given)
+        expected = "a"
+        found = subject.identify("XYZ")
+        self.assertEqual(expected, found)
+
+    def test_all_names(self):
+        subject = MOD.FrozenAlias("a", ("z", 1, "x"))
+        found = subject.all_names()
+        found.append("meh")  # copy of the cached names
+        self.assertEqual([1, "x", "z"], subject.all_names())
+        self.assertEqual(["z", "x", 1], subject.all_names(reverse=True))
+
+    def test_hash_ignores_sorted_names(self):
+        subject = MOD.FrozenAlias("a", tuple("xyz"))
+        subject.all_names()
+        self.assertEqual(MOD.FrozenAlias("a", tuple("xyz")), subject)
+        self.assertEqual(hash(MOD.FrozenAlias("a", tuple("xyz"))), hash(subject))
+
     def test_is_hashable(self):
         subject = MOD.FrozenAlias("a", tuple("xyz"))
         _ = {subject: True}  # should not raise
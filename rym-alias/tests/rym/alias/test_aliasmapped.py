@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+
+import rym.alias._aliasmapped as MOD
+from rym.alias._alias import numpy  # if installed
+from rym.alias._aliasresolver import AliasResolver
+from rym.alias.safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+    def get_temporary_directory(self) -> Path:
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        return Path(tmpdir.name)
+
+    def get_subject(self, resolver: AliasResolver) -> MOD.MappedAliasResolver:
+        path = Path(self.get_temporary_directory(), "aliases.rym")
+        resolver.dump(path)
+        subject = AliasResolver.open(path)
+        self.addCleanup(subject.close)
+        return subject
+
+
+class TestMappedAliasResolver(ThisTestCase):
+    """Test class."""
+
+    def get_resolver(self, **kwargs) -> AliasResolver:
+        return AliasResolver.build(
+            {"foo": ["bar", 42]},
+            {("x", "y"): ["xy", "Straße"]},
+            {"hello": [f"hola{i}" for i in range(100)]},
+            **kwargs,
+        )
+
+    def test_matches_resolver(self):
+        resolver = self.get_resolver()
+        subject = self.get_subject(resolver)
+        self.assertEqual(len(resolver._lookup), len(subject))
+        expected = safesorted(resolver._lookup)
+        self.assertEqual(expected, subject.all_names())
+        for name in resolver._lookup:
+            with self.subTest(name):
+                expected = resolver.identify(name)
+                found = subject.identify(name)
+                self.assertEqual(expected, found)
+
+    def test_raises_if_unknown(self):
+        subject = self.get_subject(self.get_resolver())
+        tests = ["meh", "", "Bar ", 43, ["bar"]]
+        for given in tests:
+            with self.subTest(given):
+                with self.assertRaises(KeyError):
+                    subject.identify(given)
+                self.assertIsNone(subject.identify(given, None))
+
+    def test_supports_casefold(self):
+        subject = self.get_subject(self.get_resolver(casefold=True))
+        self.assertTrue(subject.casefold)
+        self.assertEqual(("x", "y"), subject.identify("STRASSE"))
+        self.assertEqual("foo", subject.identify("bAr"))
+
+    def test_identify_many(self):
+        subject = self.get_subject(self.get_resolver())
+        given = ["BAR", "xy", "meh", 42]
+        expected = ["foo", ("x", "y"), None, "foo"]
+        found = subject.identify_many(given, default=None)
+        self.assertEqual(expected, found)
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.identify_many(given)
+
+    @skipIf(not numpy, "numpy not installed")
+    def test_identify_many_array(self):
+        subject = self.get_subject(self.get_resolver())
+        given = numpy.array([["BAR", "xy"], ["meh", "hola1"]])
+        expected = [["foo", ("x", "y")], [None, "hello"]]
+        found = subject.identify_many(given, default=None)
+        self.assertEqual(expected, found.tolist())
+
+    def test_raises_if_invalid_file(self):
+        path = Path(self.get_temporary_directory(), "aliases.rym")
+        path.write_bytes(b"not a lookup file" * 10)
+        with self.assertRaisesRegex(ValueError, "invalid lookup file"):
+            MOD.MappedAliasResolver(path)
+
+    def test_dump_replaces_file(self):
+        path = Path(self.get_temporary_directory(), "aliases.rym")
+        AliasResolver.build({"foo": ["bar"]}).dump(path)
+        AliasResolver.build({"hello": ["hola"]}).dump(path)
+        with AliasResolver.open(path) as subject:
+            self.assertEqual("hello", subject.identify("hola"))
+            self.assertIsNone(subject.identify("bar", None))
+        self.assertEqual([path], list(path.parent.iterdir()))
+
+
+# __END__
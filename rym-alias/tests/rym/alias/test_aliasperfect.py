@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+import os
+import pickle
+import subprocess
+import sys
+from unittest import TestCase
+
+import rym.alias._aliasperfect as MOD
+from rym.alias._aliasresolver import AliasResolver
+from rym.alias._aliasresolverfrozen import FrozenAliasResolver
+from rym.alias.safesort import safesorted
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+    def get_resolver(self, **kwargs) -> AliasResolver:
+        return AliasResolver.build(
+            {"foo": ["bar", 42]},
+            {("x", "y"): ["xy", "Straße"]},
+            {"hello": [f"hola{i}" for i in range(100)]},
+            {"neg": [-1, -2]},  # hash(-1) == hash(-2)
+            **kwargs,
+        )
+
+
+class TestBuildPerfectHash(ThisTestCase):
+    """Test function."""
+
+    def test_assigns_unique_slots(self):
+        for size in (1, 2, 3, 10, 1000):
+            with self.subTest(size):
+                hashes = [hash(f"name{i}") for i in range(size)]
+                table = MOD.build_perfect_hash(hashes)
+                self.assertEqual(size, len(table))
+                found = set()
+                for hashed in hashes:
+                    displacement = table[hashed % size]
+                    if displacement < 0:
+                        found.add(-displacement - 1)
+                    else:
+                        found.add(MOD._slot(displacement, hashed, size))
+                self.assertEqual(set(range(size)), found)
+
+
+class TestPerfectHashResolver(ThisTestCase):
+    """Test class."""
+
+    def test_matches_resolver(self):
+        resolver = self.get_resolver()
+        subject = resolver.compile()
+        self.assertIsInstance(subject, MOD.PerfectHashResolver)
+        self.assertEqual(len(resolver._lookup), len(subject))
+        self.assertEqual(safesorted(resolver._lookup), subject.all_names())
+        for name in resolver._lookup:
+            with self.subTest(name):
+                expected = resolver.identify(name)
+                found = subject.identify(name)
+                self.assertEqual(expected, found)
+
+    def test_raises_if_unknown(self):
+        subject = self.get_resolver().compile()
+        tests = ["meh", "", "Bar ", 43, -3, ("x",), float("nan")]
+        for given in tests:
+            with self.subTest(given):
+                with self.assertRaises(KeyError):
+                    subject.identify(given)
+                self.assertIsNone(subject.identify(given, None))
+
+    def test_raises_if_unhashable(self):
+        subject = self.get_resolver().compile()
+        with self.assertRaises(TypeError):
+            subject.identify(["bar"])
+
+    def test_matches_equal_values(self):
+        # same semantics as a dict lookup
+        nan = float("nan")
+        subject = AliasResolver.build({"yes": [True]}, {"nan": [nan]}).compile()
+        self.assertEqual("yes", subject.identify(1))
+        self.assertEqual("yes", subject.identify(1.0))
+        self.assertEqual("nan", subject.identify(nan))
+
+    def test_supports_casefold(self):
+        subject = self.get_resolver(casefold=True).compile()
+        self.assertTrue(subject.casefold)
+        self.assertEqual(("x", "y"), subject.identify("STRASSE"))
+        self.assertEqual("foo", subject.identify("bAr"))
+
+    def test_supports_empty(self):
+        subject = AliasResolver.build().compile()
+        self.assertEqual(0, len(subject))
+        self.assertIsNone(subject.identify("foo", None))
+
+    def test_identify_many(self):
+        subject = self.get_resolver().compile()
+        given = ["BAR", "xy", "meh", 42, -2]
+        expected = ["foo", ("x", "y"), None, "foo", "neg"]
+        found = subject.identify_many(given, default=None)
+        self.assertEqual(expected, found)
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.identify_many(given)
+
+    def test_rebuild_resolver(self):
+        subject = self.get_resolver().compile()
+        found = AliasResolver.build(subject)
+        self.assertEqual(subject.all_names(), safesorted(found._lookup))
+        self.assertEqual("neg", found.identify(-1))
+
+    def test_uses_less_memory_than_dict(self):
+        resolver = AliasResolver.build(
+            *({f"id{i}": [f"alias{i}"]} for i in range(1000)),
+            tracking="off",
+        )
+        subject = resolver.compile()
+        expected = sys.getsizeof(FrozenAliasResolver.clone(resolver)._lookup)
+        found = sum(
+            sys.getsizeof(x) for x in (subject._keys, subject._table, subject._values)
+        )
+        self.assertLess(found, expected)
+
+    def test_pickle(self):
+        subject = self.get_resolver(casefold=True).compile()
+        found = pickle.loads(pickle.dumps(subject))
+        self.assertEqual(subject.all_names(), found.all_names())
+        self.assertEqual("foo", found.identify("BAR"))
+        self.assertEqual("neg", found.identify(-2))
+
+    def test_pickle_across_hash_seeds(self):
+        dump = (
+            "import pickle, sys; from rym.alias import AliasResolver;"
+            "x = AliasResolver.build({'prd': ['prod']}, {'dev': ['develop']});"
+            "sys.stdout.buffer.write(pickle.dumps(x.compile()))"
+        )
+        load = (
+            "import pickle, sys; x = pickle.loads(sys.stdin.buffer.read());"
+            "print(x.identify('prod', 'MISSING'), x.identify('develop', 'MISSING'))"
+        )
+        data = self.run_python(dump, seed="1")
+        found = self.run_python(load, seed="2", input=data)
+        self.assertEqual(b"prd dev", found.strip())
+
+    def run_python(self, code: str, seed: str, **kwargs) -> bytes:
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            capture_output=True,
+            **kwargs,
+        ).stdout
+
+    def test_compile_snapshot(self):
+        subject = self.get_resolver().compile(perfect=False)
+        self.assertIsInstance(subject, FrozenAliasResolver)
+        self.assertEqual("neg", subject.identify(-2))
+
+
+# __END__
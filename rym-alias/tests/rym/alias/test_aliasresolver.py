@@ -3,6 +3,7 @@
 
 import json
 import logging
+from functools import partial
 from pathlib import Path
 from pprint import pformat
 from tempfile import TemporaryDirectory
@@ -10,8 +11,8 @@ from typing import Callable
 from unittest import TestCase, mock, skipIf
 
 import rym.alias as MOD
-from rym.alias import variation
-from rym.alias._alias import Alias, _default_transforms
+from rym.alias import _aliasresolver, variation
+from rym.alias._alias import Alias, _default_transforms, numpy  # if installed
 from rym.alias._aliasfrozen import FrozenAlias
 from rym.alias._aliasresolver import toml, yaml  # if installed
 
@@ -66,6 +67,61 @@ class TestAddAliases(ThisTestCase):
         found = subject.aliases
         self.assertEqual(expected, found)
 
+    def test_raises_if_collisions_within_new_aliases(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]})
+        with self.assertRaisesRegex(ValueError, "baz"):
+            subject.add({"a": ["baz"]}, {"b": ["baz"]})
+        self.assertEqual(1, len(subject.aliases))  # nothing added
+
+    def test_index_matches_full_rebuild(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]})
+        subject.add({"hello": ["hola"]})
+        subject.add({"bar": ["baz"]}, strict=False)  # later alias wins
+        expected = dict(subject._lookup)
+        subject._build_lookup_index()
+        found = subject._lookup
+        self.assertEqual(expected, found)
+        self.assertEqual("bar", subject.identify("bar"))
+
+    def test_preserves_attempts(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, transforms=None)
+        subject.identify("foo")
+        subject.add({"hello": ["hola"]}, transforms=None)
+        expected = {"foo": 1, "bar": 0, "hello": 0, "hola": 0}
+        found = subject._attempts
+        self.assertEqual(expected, found)
+
+
+class TestAddAlias(ThisTestCase):
+    """Test method."""
+
+    def test_adds_name_to_alias(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, {"hello": ["hola"]})
+        subject.add_alias("hello", "aloha")
+        self.assertEqual("hello", subject.identify("ALOHA"))
+        self.assertIn("aloha", subject.aliases[1].aliases)
+
+    def test_raises_if_unknown_identity(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]})
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.add_alias("meh", "ugh")
+
+    def test_raises_if_collisions_and_strict(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, {"hello": ["hola"]})
+        subject.logger = mock.Mock()
+        with self.assertRaisesRegex(ValueError, "bar"):
+            subject.add_alias("hello", "Bar")
+        self.assertEqual("foo", subject.identify("bar"))
+        subject.add_alias("hello", "Bar", strict=False)
+        self.assertEqual("hello", subject.identify("bar"))
+
+    def test_finds_identity_that_lost_a_collision(self):
+        subject = MOD.AliasResolver.build(
+            {"foo": ["bar"]}, {"bar": ["baz"]}, strict=False, logger=mock.Mock()
+        )
+        subject.add_alias("foo", "meh")
+        self.assertEqual("foo", subject.identify("meh"))
+
 
 class TestBuild(ThisTestCase):
     """Test classmethod."""
@@ -94,6 +150,87 @@ class TestBuild(ThisTestCase):
         self.assertEqual(expected, found)
 
 
+class TestBuildParallel(ThisTestCase):
+    """Test classmethod feature."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_aliasresolver.os, "cpu_count", return_value=4)
+        self.cpu_count = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_given(self) -> list:
+        path = Path(self.get_temporary_directory(), "aliases.ndjson")
+        path.write_text('{"a": ["aa"]}\n{"identity": "b", "aliases": ["bb"]}\n')
+        return [
+            path,
+            json.dumps({"aliases": [{"c": ["cc"], "d": "dd"}]}),
+            (Alias(f"x{i}", [f"y{i}"]) for i in range(20)),
+            {"identity": "e", "aliases": ["ee"], "transforms": "esser"},
+        ]
+
+    def test_matches_serial_build(self):
+        expected = MOD.AliasResolver.build(*self.get_given(), f=["ff"])
+        found = MOD.AliasResolver.build(*self.get_given(), f=["ff"], workers=2)
+        self.assertEqual(26, len(found.aliases))
+        self.assertEqual(expected.aliases, found.aliases)
+        self.assertEqual(expected._lookup, found._lookup)
+
+        with self.subTest("with transforms"):
+            kwargs = {"transforms": [variation.esser], "workers": 2}
+            subject = MOD.AliasResolver.build(*self.get_given(), **kwargs)
+            self.assertEqual(25, len(subject.aliases))
+            self.assertEqual("x19", subject.identify("y19s"))
+
+    def test_raises_if_collisions_and_strict(self):
+        with self.assertRaisesRegex(ValueError, "bar"):
+            MOD.AliasResolver.build({"foo": ["bar"]}, {"baz": ["bar"]}, workers=2)
+
+    def test_merges_collisions_across_shards(self):
+        given = [{f"x{i}": [f"y{i}"]} for i in range(20)]
+        tests = [
+            # (expected, given, kwargs)
+            (["y3s"], {"meh": "y3s"}, {}),
+            (["y3", "y3s"], {"meh": "Y3"}, {"casefold": True}),
+            (["Y3"], {"meh": "Y3"}, {"lazy": True}),
+        ]
+        for expected, extra, kwargs in tests:
+            kwargs = {"transforms": [variation.upper, variation.esser], **kwargs}
+            build = partial(MOD.AliasResolver.build, *given, extra, **kwargs)
+            with self.subTest(extra, **kwargs):
+                with self.assertRaises(_aliasresolver.CollisionError) as ctx:
+                    build()
+                self.assertEqual(expected, ctx.exception.args[0])
+                with self.assertRaises(_aliasresolver.CollisionError) as ctx:
+                    build(workers=2)
+                self.assertEqual(expected, ctx.exception.args[0])
+
+                serial = build(strict=False)
+                found = build(strict=False, workers=2)
+                self.assertEqual(serial.aliases, found.aliases)
+                self.assertEqual(serial._lookup, found._lookup)
+                self.assertEqual("meh", found.identify(expected[-1]))
+
+    def test_builds_here_if_transforms_not_picklable(self):
+        logger = mock.Mock()
+        with mock.patch.object(_aliasresolver, "ProcessPoolExecutor") as executor:
+            subject = MOD.AliasResolver.build(
+                {"foo": ["bar"]},
+                transforms=[lambda x: x.title()],
+                workers=2,
+                logger=logger,
+            )
+        executor.assert_not_called()
+        logger.warning.assert_called_once()
+        self.assertEqual("foo", subject.identify("Bar"))
+
+    def test_builds_here_if_one_cpu(self):
+        self.cpu_count.return_value = 1
+        with mock.patch.object(_aliasresolver, "ProcessPoolExecutor") as executor:
+            subject = MOD.AliasResolver.build(*self.get_given(), workers=2)
+        executor.assert_not_called()
+        self.assertEqual(25, len(subject.aliases))
+
+
 class TestBuildLookupIndex(ThisTestCase):
     """Test method."""
 
@@ -114,6 +251,575 @@ class TestBuildLookupIndex(ThisTestCase):
         self.assertEqual(expected, found)
 
 
+class TestCasefold(ThisTestCase):
+    """Test feature."""
+
+    def test_indexes_casefolded_names_only(self):
+        subject = MOD.AliasResolver.build({"foo": ["Bar"]}, casefold=True)
+        expected = {"foo": 0, "bar": 0}
+        found = subject._lookup
+        self.assertEqual(expected, found)
+        self.assertTrue(subject.aliases[0].casefold)
+
+    def test_identify_ignores_case(self):
+        subject = MOD.AliasResolver.build(
+            {"foo": ["Bar"]}, transforms=None, casefold=True
+        )
+        self.assertEqual("foo", subject.identify("bAR"))
+        self.assertEqual(["foo", None], subject.identify_many(["FOO", "x"], None))
+        subject.add({"hello": ["Hola"]})
+        self.assertEqual("hello", subject.identify("HOLA"))
+
+    def test_raises_if_casefold_collision(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, transforms=None)
+        subject.add({"hello": ["BAR"]}, transforms=None)  # no collision
+        subject = MOD.AliasResolver.build(
+            {"foo": ["bar"]}, transforms=None, casefold=True
+        )
+        with self.assertRaisesRegex(ValueError, "bar"):
+            subject.add({"hello": ["BAR"]}, transforms=None)
+
+    def test_does_not_change_given_aliases(self):
+        given = Alias("prd", ["prod"], transforms=None)
+        other = MOD.AliasResolver.build({"x": ["y"]}, transforms=None)
+        subject = MOD.AliasResolver.build(given, other, casefold=True, lazy=True)
+        self.assertEqual("prd", subject.identify("PROD"))
+        self.assertEqual("x", subject.identify("Y"))
+        self.assertFalse(given.casefold)
+        self.assertFalse(given.lazy)
+        self.assertIsNone(other.identify("Y", None))
+        subject.add_alias("prd", "live")
+        self.assertEqual(["prod"], given.aliases)
+
+    def test_matches_casefolded_alias_if_not_casefold(self):
+        tests = [
+            Alias("prd", ["prod"], casefold=True),
+            Alias("prd", ["prod"], casefold=True, lazy=True),
+            FrozenAlias.build("prd", ["prod"], casefold=True),
+        ]
+        for given in tests:
+            subject = MOD.AliasResolver.build(given, {"foo": ["bar"]})
+            with self.subTest(given):
+                self.assertEqual("prd", subject.identify("PROD"))
+                self.assertEqual("prd", subject.identify("pRoD"))
+                self.assertIn("PROD", subject)
+                self.assertEqual(["prd"], subject.identify_many(["PROD"]))
+                self.assertEqual(("prd", 0), subject.identify_fuzzy("PROD"))
+                self.assertIsNone(subject.identify("bAR", None))  # not casefold
+
+
+class TestLazy(ThisTestCase):
+    """Test feature."""
+
+    def get_subject(self, **kwargs) -> MOD.AliasResolver:
+        return MOD.AliasResolver.build(
+            {"foo": ["bar"]},
+            {"hello": ["hola", "hi"]},
+            transforms=["upper", "esser"],
+            **kwargs,
+        )
+
+    def test_indexes_raw_names_only(self):
+        subject = self.get_subject(lazy=True)
+        expected = {"foo": 0, "bar": 0, "hello": 1, "hola": 1, "hi": 1}
+        self.assertEqual(expected, subject._lookup)
+        self.assertTrue(all(x.lazy for x in subject.aliases))
+
+    def test_identify_matches_eager(self):
+        tests = ["FOO", "bars", "HOLAs", "HI", "his", "Hola", "meh"]
+        for casefold in (False, True):
+            eager = self.get_subject(casefold=casefold)
+            subject = self.get_subject(casefold=casefold, lazy=True)
+            for value in tests:
+                with self.subTest(value, casefold=casefold):
+                    expected = eager.identify(value, None)
+                    self.assertEqual(expected, subject.identify(value, None))
+                    found = subject.identify_fuzzy(value, 0, (None, 0))
+                    self.assertEqual(expected, found[0])
+            expected = eager.identify_many(tests, None)
+            self.assertEqual(expected, subject.identify_many(tests, None))
+
+    def test_index_updated_incrementally(self):
+        subject = self.get_subject(lazy=True)
+        self.assertIsNone(subject.identify("XYZ", None))
+        subject.add({"x": ["xyz"]}, transforms=["upper"])
+        subject.add_alias("foo", "baz")
+        self.assertEqual("x", subject.identify("XYZ"))
+        self.assertEqual("foo", subject.identify("BAZ"))
+
+    def test_collisions_match_eager(self):
+        given = {"a": ["Foo"], "b": ["FOO"]}
+        for casefold in (False, True):
+            eager = MOD.AliasResolver.build(given, strict=False, casefold=casefold)
+            with self.subTest(casefold=casefold):
+                with self.assertRaisesRegex(_aliasresolver.CollisionError, "(?i)foo"):
+                    MOD.AliasResolver.build(given, casefold=casefold, lazy=True)
+                subject = MOD.AliasResolver.build(
+                    given, strict=False, casefold=casefold, lazy=True
+                )
+                self.assertEqual(eager.validate(), subject.validate())
+
+    def test_collisions_with_indexed_variants(self):
+        subject = self.get_subject(lazy=True)
+        tests = [
+            # (expected, given)
+            ("bars", {"x": ["bars"]}),  # new name vs. indexed variant
+            ("HI", {"x": ["hI"]}),  # new variant vs. indexed name
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                with self.assertRaisesRegex(_aliasresolver.CollisionError, expected):
+                    subject.add(given, transforms=["upper"])
+        self.assertIsNone(subject.identify("x", None))  # unchanged
+
+    def test_add_alias_collisions_match_eager(self):
+        tests = [
+            # (expected, given)
+            ("X", ("b", "X")),  # new name vs. indexed variant
+            ("Y", ("a", "Y")),  # new variant vs. indexed variant
+        ]
+        for lazy in (False, True):
+            subject = MOD.AliasResolver.build(
+                {"a": ["x"]}, {"b": ["y"]}, transforms=["upper"], lazy=lazy
+            )
+            for expected, given in tests:
+                with self.subTest(given, lazy=lazy):
+                    with self.assertRaisesRegex(
+                        _aliasresolver.CollisionError, expected
+                    ):
+                        subject.add_alias(*given)
+            self.assertEqual("a", subject.identify("X"))  # unchanged
+            subject.add_alias("a", "z")  # should not raise
+            self.assertEqual("a", subject.identify("Z"))
+
+    def test_complete_matches_eager(self):
+        eager = self.get_subject()
+        subject = self.get_subject(lazy=True)
+        for prefix in ("H", "HOL", "ba", "BARS", "meh"):
+            with self.subTest(prefix):
+                self.assertEqual(eager.complete(prefix), subject.complete(prefix))
+        subject.add({"x": ["xyz"]}, transforms=["upper"])
+        subject.add_alias("foo", "baz")
+        self.assertEqual(["x"], subject.complete("XY"))
+        self.assertEqual(["foo"], subject.complete("BAZ"))
+
+    def test_snapshots_include_variants(self):
+        eager = self.get_subject()
+        subject = self.get_subject(lazy=True)
+        expected = MOD.FrozenAliasResolver.clone(eager)
+        self.assertEqual(expected, MOD.FrozenAliasResolver.clone(subject))
+        self.assertEqual(expected.all_names(), subject.compile().all_names())
+        path = Path(self.get_temporary_directory(), "aliases.rym")
+        subject.dump(path)
+        with MOD.AliasResolver.open(path) as found:
+            self.assertEqual(expected.all_names(), found.all_names())
+
+
+class TestComplete(ThisTestCase):
+    """Test method."""
+
+    def get_subject(self, **kwargs) -> MOD.AliasResolver:
+        return MOD.AliasResolver.build(
+            {"production": ["prod"]},
+            {"develop": ["dev"]},
+            {"deploy": ["dep"]},
+            {"developer": ["dv"]},
+            {42: ["answer"]},
+            transforms=None,
+            **kwargs,
+        )
+
+    def test_returns_ranked_identities(self):
+        subject = self.get_subject()
+        tests = [
+            # (expected, given)
+            (["deploy", "develop", "developer"], "de"),
+            (["develop", "developer"], "dev"),
+            (["developer"], "developer"),
+            (["production"], "p"),
+            ([42], "ans"),
+            ([], "x"),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = subject.complete(given)
+                self.assertEqual(expected, found)
+
+    def test_limit(self):
+        subject = self.get_subject()
+        expected = ["developer", "deploy"]  # "dv" is the shortest match
+        found = subject.complete("d", limit=2)
+        self.assertEqual(expected, found)
+
+    def test_index_updated_incrementally(self):
+        subject = self.get_subject()
+        subject.complete("d")  # build index
+        subject.add({"staging": ["stage"]}, transforms=None)
+        subject.add_alias("production", "prd")
+        self.assertEqual(["staging"], subject.complete("st"))
+        self.assertEqual(["production"], subject.complete("pr"))
+
+    def test_supports_casefold(self):
+        subject = self.get_subject(casefold=True)
+        expected = ["develop", "developer"]
+        found = subject.complete("DEV")
+        self.assertEqual(expected, found)
+
+
+class TestFrontCache(ThisTestCase):
+    """Test feature."""
+
+    def get_subject(self, **kwargs) -> MOD.AliasResolver:
+        return MOD.AliasResolver.build(
+            {"foo": ["bar"]},
+            {"hello": ["hola"]},
+            front_cache=8,
+            **kwargs,
+        )
+
+    def test_disabled_by_default(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]})
+        subject.identify("bar")
+        self.assertEqual((0, 0, 0, 0), subject.front_cache_info())
+
+    def test_counts_hits_and_misses(self):
+        subject = self.get_subject(casefold=True)
+        for value in ["BAR", "bar", "BAR", "meh", "BAR"]:
+            subject.identify(value, None)
+        self.assertEqual((2, 3, 8, 2), subject.front_cache_info())
+
+    def test_tracks_cached_attempts(self):
+        subject = self.get_subject(casefold=True)
+        for value in ["BAR", "BAR", "Bar"]:
+            self.assertEqual("foo", subject.identify(value))
+        self.assertEqual(3, subject._attempts["bar"])
+
+    def test_raises_if_unknown_alias(self):
+        subject = self.get_subject()
+        for _ in range(2):
+            with self.assertRaises(KeyError):
+                subject.identify("meh")
+
+    def test_invalidated_on_change(self):
+        subject = self.get_subject(strict=False)
+        tests = [
+            # (expected, change)
+            ("x", lambda: subject.add({"x": ["xyz"]}, strict=False)),
+            ("foo", lambda: subject.add_alias("foo", "xyz", strict=False)),
+            ("hello", lambda: subject.add({"hello": ["xyz"]}, strict=False)),
+        ]
+        self.assertIsNone(subject.identify("xyz", None))
+        for expected, change in tests:
+            with self.subTest(expected):
+                subject.identify("xyz", None)  # cache current
+                change()
+                self.assertEqual(expected, subject.identify("xyz"))
+
+    def test_invalidated_on_transform_change(self):
+        subject = self.get_subject()
+        self.assertEqual("foo", subject.identify("BAR"))
+        subject.set_transforms(None)
+        self.assertIsNone(subject.identify("BAR", None))
+        subject.add_transform("upper")
+        self.assertEqual("foo", subject.identify("BAR"))
+
+
+class TestContains(ThisTestCase):
+    """Test method."""
+
+    def test_contains(self):
+        subject = MOD.AliasResolver.build(
+            prd=["prod"],
+            casefold=True,
+            lazy=True,
+            transforms=[variation.esser],
+        )
+        tests = [
+            # (expected, given)
+            (True, "prod"),
+            (True, "PROD"),
+            (True, "prods"),  # found on demand
+            (False, "meh"),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = given in subject
+                self.assertEqual(expected, found)
+        self.assertNotIn("meh", subject._attempts)
+
+    def test_raises_if_unhashable(self):
+        subject = MOD.AliasResolver.build(prd=["prod"])
+        with self.assertRaises(TypeError):
+            _ = ["prod"] in subject
+
+
+class TestReverseIndex(ThisTestCase):
+    """Test methods."""
+
+    def test_alias_of(self):
+        subject = MOD.AliasResolver.build(foo=["bar"], transforms=None)
+        subject.add({("x", "y"): ["xy"]}, hello=["hola"])
+        tests = [
+            # (expected, given)
+            (subject.aliases[0], "foo"),
+            (subject.aliases[1], ("x", "y")),
+            (subject.aliases[2], "hello"),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = subject.alias_of(given)
+                self.assertIs(expected, found)
+
+    def test_raises_if_unknown_identity(self):
+        subject = MOD.AliasResolver.build(foo=["bar"])
+        for given in ["bar", "FOO", ["foo"]]:
+            with self.subTest(given):
+                with self.assertRaises(KeyError):
+                    subject.alias_of(given)
+                with self.assertRaises(KeyError):
+                    subject.names_of(given)
+
+    def test_names_of(self):
+        subject = MOD.AliasResolver.build(
+            foo=["bar"],
+            hello=["hola"],
+            transforms=[variation.upper],
+        )
+        subject.add_alias("foo", "baz")
+        expected = ["foo", "bar", "FOO", "BAR", "baz", "BAZ"]
+        found = subject.names_of("foo")
+        self.assertEqual(expected, list(found))
+        self.assertEqual(set(subject.alias_of("foo").all_names()), set(found))
+
+    def test_names_of_is_read_only(self):
+        subject = MOD.AliasResolver.build(foo=["bar"])
+        found = subject.names_of("foo")
+        self.assertFalse(hasattr(found, "__setitem__"))
+        self.assertFalse(hasattr(found, "add"))
+
+    def test_names_of_casefold(self):
+        subject = MOD.AliasResolver.build(foo=["Straße"], casefold=True)
+        self.assertIn("strasse", subject.names_of("foo"))
+
+    def test_later_alias_wins(self):
+        subject = MOD.AliasResolver.build(foo=["bar"])
+        subject.add({"foo": ["baz"]}, strict=False)
+        self.assertIs(subject.aliases[1], subject.alias_of("foo"))
+
+    def test_updated_on_reindex(self):
+        subject = MOD.AliasResolver.build(foo=["bar"], transforms=None)
+        subject.set_transforms([variation.upper])
+        self.assertIn("BAR", subject.names_of("foo"))
+        self.assertEqual("foo", subject.identify("BAR"))
+
+
+class TestRemove(ThisTestCase):
+    """Test removal methods."""
+
+    def get_subject(self, **kwargs) -> MOD.AliasResolver:
+        return MOD.AliasResolver.build(
+            prd=["prod"],
+            dev=["develop"],
+            qa=["test"],
+            **kwargs,
+        )
+
+    def test_remove_alias(self):
+        subject = self.get_subject()
+        subject.identify("PROD")
+        subject.remove_alias("prd", "prod")
+        self.assertIsNone(subject.identify("PROD", None))
+        self.assertEqual("prd", subject.identify("PRD"))
+        self.assertNotIn("prod", subject._lookup)
+        self.assertNotIn("Prod", subject._attempts)
+        self.assertEqual(1, subject._attempts["PROD"])  # attempted since removal
+        self.assertEqual([], subject.alias_of("prd").aliases)
+
+    def test_remove_alias_raises_if_unknown(self):
+        subject = self.get_subject()
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.remove_alias("meh", "prod")
+        with self.assertRaisesRegex(KeyError, "develop"):
+            subject.remove_alias("prd", "develop")
+
+    def test_remove_alias_keeps_collisions(self):
+        subject = self.get_subject(strict=False)
+        subject.add(live=["prod"], strict=False)  # later alias wins
+        subject.remove_alias("prd", "prod")
+        self.assertEqual("live", subject.identify("prod"))
+
+    def test_remove_identity(self):
+        subject = self.get_subject()
+        qa = subject.alias_of("qa")
+        subject.remove_identity("dev")
+        self.assertNotIn("develop", subject._attempts)
+        self.assertIsNone(subject.aliases[1])  # tombstone
+        self.assertIs(qa, subject.aliases[2])  # not renumbered
+        self.assertIsNone(subject.identify("develop", None))
+        self.assertIsNone(subject.identify("dev", None))
+        self.assertEqual("qa", subject.identify("test"))
+        self.assertNotIn("develop", subject)
+        with self.assertRaisesRegex(KeyError, "dev"):
+            subject.alias_of("dev")
+        with self.assertRaisesRegex(KeyError, "dev"):
+            subject.remove_identity("dev")
+
+    def test_discard(self):
+        subject = self.get_subject()
+        subject.discard("meh").discard("dev")  # should not raise
+        self.assertIsNone(subject.identify("dev", None))
+        self.assertEqual(1, subject._tombstones)
+
+    def test_remove_identity_removes_duplicates(self):
+        subject = self.get_subject()
+        subject.add({"prd": ["live"]}, strict=False)
+        subject.remove_identity("prd")
+        self.assertIsNone(subject.identify("prod", None))
+        self.assertIsNone(subject.identify("live", None))
+        self.assertIsNone(subject.aliases[0])  # tombstone
+        self.assertIsNone(subject.aliases[3])  # tombstone
+        self.assertEqual(2, subject._tombstones)
+        self.assertFalse(subject.validate())
+        with self.assertRaisesRegex(KeyError, "prd"):
+            subject.alias_of("prd")
+
+    def test_discard_removes_duplicates(self):
+        subject = MOD.AliasResolver.build({"a": ["x"]}, {"b": ["z"]})
+        subject.add({"a": ["y"]}, strict=False)
+        subject.discard("a")
+        self.assertIsNone(subject.identify("x", None))
+        self.assertIsNone(subject.identify("y", None))
+
+    def test_compact_keeps_duplicates(self):
+        subject = MOD.AliasResolver.build({"b": ["z"]}, {"a": ["x"]})
+        subject.add({"a": ["y"]}, strict=False)
+        subject.remove_identity("b")
+        subject.compact()
+        self.assertEqual([0, 1], subject._identities["a"])
+        subject.remove_identity("a")
+        self.assertIsNone(subject.identify("x", None))
+        self.assertIsNone(subject.identify("y", None))
+
+    def test_compacts_when_half_removed(self):
+        subject = MOD.AliasResolver.build(
+            *({f"id{i}": [f"alias{i}"]} for i in range(10)),
+            transforms=None,
+        )
+        for i in range(5):
+            subject.remove_identity(f"id{i}")
+        self.assertEqual(5, subject._tombstones)
+        self.assertEqual(10, len(subject.aliases))
+        subject.remove_identity("id5")  # more than half
+        self.assertEqual(0, subject._tombstones)
+        self.assertEqual(4, len(subject.aliases))
+        expected = ["id6", "id7", "id8", "id9"]
+        found = subject.identify_many([f"alias{i}" for i in range(6, 10)])
+        self.assertEqual(expected, found)
+        self.assertEqual(list(range(4)), sorted(set(subject._lookup.values())))
+        self.assertEqual("id9", subject.alias_of("id9").identity)
+
+    def test_compact(self):
+        subject = self.get_subject(lazy=True)
+        subject.complete("d")
+        subject.identify_fuzzy("tst")
+        subject.remove_identity("prd")
+        subject.compact().compact()
+        self.assertEqual(["dev", "qa"], [x.identity for x in subject.aliases])
+        self.assertEqual("qa", subject.identify("TEST"))
+        self.assertEqual("dev", subject.identify("Develop"))
+        self.assertEqual(["dev"], subject.complete("d"))
+        self.assertEqual(("qa", 1), subject.identify_fuzzy("tst"))
+        self.assertIsNone(subject.identify_fuzzy("prd", 1, None))
+
+    def test_indexes_skip_removed_names(self):
+        subject = self.get_subject()
+        self.assertEqual(["prd"], subject.complete("pro"))
+        self.assertEqual(("prd", 1), subject.identify_fuzzy("prodd"))
+        subject.remove_identity("prd")
+        self.assertEqual([], subject.complete("pro"))
+        self.assertIsNone(subject.identify_fuzzy("prodd", 1, None))
+
+    def test_lazy(self):
+        subject = self.get_subject(lazy=True, casefold=True)
+        subject.add_transform("esser")
+        self.assertEqual("prd", subject.identify("PRODS"))
+        subject.remove_alias("prd", "prod")
+        self.assertIsNone(subject.identify("PRODS", None))
+        self.assertEqual("prd", subject.identify("PRDS"))
+        subject.remove_identity("qa")
+        self.assertIsNone(subject.identify("tests", None))
+
+    def test_front_cache(self):
+        subject = self.get_subject(front_cache=4)
+        self.assertEqual("prd", subject.identify("prod"))
+        subject.remove_alias("prd", "prod")
+        self.assertIsNone(subject.identify("prod", None))
+        subject.remove_identity("dev")
+        self.assertIsNone(subject.identify("dev", None))
+
+    def test_add_after_remove(self):
+        subject = self.get_subject()
+        subject.remove_identity("prd")
+        subject.add(prd=["production"])
+        self.assertEqual("prd", subject.identify("production"))
+        self.assertIsNone(subject.identify("prod", None))
+        self.assertEqual(3, subject._find_identity("prd"))
+
+    def test_tombstones_skipped(self):
+        subject = self.get_subject()
+        subject.remove_identity("dev")
+        with self.subTest("usage"):
+            self.assertEqual({"prd": 0, "qa": 0}, subject.usage().identities)
+        with self.subTest("validate"):
+            self.assertEqual({}, subject.validate())
+        with self.subTest("resolve"):
+            found = MOD.resolve_aliases(subject)
+            self.assertEqual(["prd", "qa"], [x.identity for x in found])
+        with self.subTest("compile"):
+            self.assertIsNone(subject.compile().identify("dev", None))
+            self.assertEqual("qa", subject.compile().identify("test"))
+            self.assertEqual("qa", subject.compile(perfect=False).identify("test"))
+        with self.subTest("set transforms"):
+            subject.set_transforms(None)
+            self.assertEqual(0, subject._tombstones)
+            self.assertEqual("qa", subject.identify("test"))
+
+    def test_dump_skips_tombstones(self):
+        subject = self.get_subject()
+        subject.remove_identity("dev")
+        path = self.get_temporary_directory() / "lookup.bin"
+        subject.dump(path)
+        with MOD.AliasResolver.open(path) as found:
+            self.assertEqual("qa", found.identify("test"))
+            self.assertIsNone(found.identify("dev", None))
+            self.assertEqual(len(subject._lookup), len(found))
+
+
+class TestSetTransforms(ThisTestCase):
+    """Test feature."""
+
+    def test_updates_every_alias(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, {"hello": ["hola"]})
+        subject.set_transforms(["esser"])
+        given = ["bars", "foos", "hellos", "holas"]
+        expected = ["foo", "foo", "hello", "hello"]
+        self.assertEqual(expected, subject.identify_many(given))
+        self.assertIsNone(subject.identify("BAR", None))
+
+    def test_add_transform(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, transforms=None)
+        subject.add_transform(["upper", "esser"])
+        self.assertEqual("foo", subject.identify("BAR"))
+        self.assertEqual("foo", subject.identify("bars"))
+
+    def test_preserves_attempts(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]})
+        subject.identify("bar")
+        subject.set_transforms(["esser"])
+        self.assertEqual(1, subject._attempts["bar"])
+        self.assertEqual(0, subject._attempts["bars"])
+
+
 class TestFindCollisions(ThisTestCase):
     """Test classmethod."""
 
@@ -200,6 +906,184 @@ class TestIdentify(ThisTestCase):
         self.assertEqual(expected, found, self.pcompare(expected, found))
 
 
+class TestIdentifyFuzzy(ThisTestCase):
+    """Test method."""
+
+    def get_subject(self, **kwargs) -> MOD.AliasResolver:
+        return MOD.AliasResolver.build(
+            {"production": ["prod"]},
+            {"develop": ["dev"]},
+            transforms=None,
+            **kwargs,
+        )
+
+    def test_returns_exact_match(self):
+        subject = self.get_subject()
+        expected = ("production", 0)
+        found = subject.identify_fuzzy("prod")
+        self.assertEqual(expected, found)
+        self.assertIsNone(subject._fuzzy, "index built for exact match")
+
+    def test_returns_closest_match(self):
+        subject = self.get_subject()
+        tests = [
+            # (expected, given)
+            (("production", 2), "prodcution"),
+            (("production", 1), "prd"),
+            (("develop", 1), "develp"),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = subject.identify_fuzzy(given)
+                self.assertEqual(expected, found)
+
+    def test_raises_if_too_far(self):
+        subject = self.get_subject()
+        with self.assertRaisesRegex(KeyError, "staging"):
+            subject.identify_fuzzy("staging")
+        self.assertIsNone(subject.identify_fuzzy("staging", default=None))
+        self.assertEqual(("develop", 1), subject.identify_fuzzy("dv", 1))
+        self.assertIsNone(subject.identify_fuzzy("dv", 0, default=None))
+
+    def test_index_updated_incrementally(self):
+        subject = self.get_subject()
+        subject.identify_fuzzy("prd")  # build index
+        subject.add({"staging": ["stage"]}, transforms=None)
+        subject.add_alias("develop", "development")
+        self.assertEqual(("staging", 1), subject.identify_fuzzy("stagin"))
+        self.assertEqual(("develop", 1), subject.identify_fuzzy("developmnt"))
+
+    def test_supports_casefold(self):
+        subject = self.get_subject(casefold=True)
+        expected = ("develop", 1)
+        found = subject.identify_fuzzy("DEVELP")
+        self.assertEqual(expected, found)
+
+    def test_matches_eager_if_lazy(self):
+        eager = MOD.AliasResolver.build(prod=["production"])
+        subject = MOD.AliasResolver.build(prod=["production"], lazy=True)
+        for given in ("PRODUCTON", "Prodution", "producton"):
+            with self.subTest(given):
+                expected = eager.identify_fuzzy(given)
+                self.assertEqual(expected, subject.identify_fuzzy(given))
+                self.assertEqual(("prod", 1), expected)
+
+        with self.subTest("index updated incrementally"):
+            subject.add({"dev": ["develop"]})
+            subject.add_alias("dev", "development")
+            self.assertEqual(("dev", 1), subject.identify_fuzzy("DEVELOPMNT"))
+            self.assertEqual(("dev", 1), subject.identify_fuzzy("DEVELP"))
+
+
+class TestIdentifyMany(ThisTestCase):
+    """Test method."""
+
+    def get_subject(self) -> MOD.AliasResolver:
+        return MOD.AliasResolver.build(
+            {"foo": ["bar"]},
+            {"hello": ["hola"]},
+            {("x", "y"): ["xy"]},
+        )
+
+    def test_raises_if_unknown_alias(self):
+        subject = self.get_subject()
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.identify_many(["foo", "meh"])
+
+    def test_returns_identity_for_each(self):
+        subject = self.get_subject()
+        given = ["BAR", "hola", "meh", "BAR", "xy"]
+        expected = ["foo", "hello", None, "foo", ("x", "y")]
+        found = subject.identify_many(given, default=None)
+        self.assertEqual(expected, found)
+
+    def test_tracks_attempts_in_bulk(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, transforms=None)
+        subject.identify_many(("bar", "bar", "meh", "foo"), default=None)
+        expected = {"foo": 1, "bar": 2, "meh": 1}
+        found = subject._attempts
+        self.assertEqual(expected, found)
+
+    @skipIf(not numpy, "numpy not installed")
+    def test_supports_array(self):
+        subject = self.get_subject()
+        given = numpy.array([["BAR", "hola"], ["xy", "meh"]])
+        expected = [["foo", "hello"], [("x", "y"), None]]
+        found = subject.identify_many(given, default=None)
+        self.assertEqual((2, 2), found.shape)
+        self.assertEqual(expected, found.tolist())
+
+
+class TestSetTracking(ThisTestCase):
+    """Test method."""
+
+    def test_disable(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, tracking="off")
+        subject.identify("bar")
+        subject.identify_many(["meh"], default=None)
+        subject.add({"hello": ["hola"]})
+        self.assertIsNone(subject._attempts)
+
+    def test_replaces_tracker(self):
+        subject = MOD.AliasResolver.build({"foo": ["bar"]}, transforms=None)
+        subject.identify("bar")
+        subject.set_tracking("exact")
+        subject.identify("foo")
+        expected = {"foo": 1, "bar": 0}
+        found = subject._attempts
+        self.assertEqual(expected, found)
+
+
+class TestValidate(ThisTestCase):
+    """Test method."""
+
+    def test_reports_lost_collisions(self):
+        subject = MOD.AliasResolver.build(
+            {"foo": ["bar"]},
+            {"baz": ["bar"]},
+            {"meh": ["BAR", "ugh"]},
+            transforms=None,
+            strict=False,
+            logger=mock.Mock(),
+        )
+        expected = {"bar": ["foo", "baz"]}
+        found = subject.validate()
+        self.assertEqual(expected, found)
+
+    def test_supports_casefold(self):
+        subject = MOD.AliasResolver.build(
+            {"foo": ["bar", "Bar"]},  # same alias, not a collision
+            transforms=None,
+            casefold=True,
+        )
+        self.assertEqual({}, subject.validate())
+        subject.add({"meh": ["BAR"]}, transforms=None, strict=False)
+        expected = {"bar": ["foo", "meh"]}
+        found = subject.validate()
+        self.assertEqual(expected, found)
+
+
+class TestReportCollisions(ThisTestCase):
+    """Test function."""
+
+    def test_returns_identities_by_name(self):
+        given = [
+            Alias("foo", ["bar", "baz"], transforms=None),
+            Alias("foo", ["x"], transforms=None),
+            Alias("meh", ["bar"], transforms=None),
+            Alias(42, ["baz", "bar"], transforms=None),
+        ]
+        expected = {
+            "bar": ["foo", "meh", 42],
+            "baz": ["foo", 42],
+            "foo": ["foo", "foo"],
+        }
+        found = MOD.report_collisions(given)
+        self.assertEqual(expected, found)
+        self.assertEqual(list(expected), list(found))  # sorted by name
+        self.assertEqual({}, MOD.report_collisions(given[:1]))
+
+
 class TestResolveAlias(ThisTestCase):
     """Test function.
 
@@ -282,6 +1166,26 @@ class TestResolveAlias(ThisTestCase):
         found = MOD.resolve_aliases(*args, **kwargs)
         self.assertEqual(expected, found)
 
+    def test_transforms_applied_once(self):
+        calls = []
+
+        def shout(value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        given = [
+            {"a": ["ay"], "b": ["bee"]},
+            {"identity": "c", "aliases": ["see"], "transforms": "esser"},
+        ]
+        found = MOD.resolve_aliases(given, transforms=[shout])
+        self.assertEqual(["a", "ay", "b", "bee", "c", "see"], calls)
+        expected = [
+            Alias("a", ["ay"], [shout]),
+            Alias("b", ["bee"], [shout]),
+            Alias("c", ["see"], [shout]),
+        ]
+        self.assertEqual(expected, found)
+
 
 class TestResolveAliasEncoding(ThisTestCase):
     """Test function feature."""
@@ -330,6 +1234,81 @@ class TestResolveAliasEncoding(ThisTestCase):
                 suffix=".yaml", encode=yaml.safe_dump
             )
 
+    def test_cache(self):
+        data = [{"identity": "foo", "aliases": ["bar"]}]
+        tmpdir = self.get_temporary_directory()
+        path = Path(tmpdir, "aliases.json")
+        path.write_text(json.dumps(data))
+        cache_dir = Path(tmpdir, "cache")
+        kwargs = {"cache": cache_dir, "transforms": [variation.esser]}
+
+        initial = MOD.AliasResolver.build(path, **kwargs)
+        with mock.patch.object(_aliasresolver, "_read_json") as read_json:
+            subject = MOD.AliasResolver.build(path, **kwargs)
+        read_json.assert_not_called()
+        self.assertEqual(initial.aliases, subject.aliases)
+        self.assertEqual("foo", subject.identify("bars"))
+
+        with self.subTest("new transforms"):
+            subject = MOD.AliasResolver.build(path, cache=cache_dir, transforms=None)
+            self.assertEqual(2, len(list(cache_dir.iterdir())))
+            with self.assertRaises(KeyError):
+                subject.identify("bars")
+
+        with self.subTest("uncacheable transforms"):
+            subject = MOD.AliasResolver.build(
+                path, cache=cache_dir, transforms=[lambda x: x.title()]
+            )
+            self.assertEqual(2, len(list(cache_dir.iterdir())))
+            self.assertEqual("foo", subject.identify("Bar"))
+
+    # streaming
+    # ----------------------------------
+
+    def test_ndjson(self):
+        data = [
+            {"identity": "foo", "aliases": ["bar"], "transforms": "deesser"},
+            {"hello": ["aloha"]},
+        ]
+        expected = [
+            Alias("foo", ["bar"], [variation.deesser]),
+            Alias("hello", ["aloha"], _default_transforms()),
+        ]
+        for suffix in (".ndjson", ".jsonl"):
+            with self.subTest(suffix):
+                path = Path(self.get_temporary_directory(), "aliases" + suffix)
+                path.write_text("\n".join(json.dumps(x) for x in data) + "\n\n")
+                subject = MOD.AliasResolver.build(path)
+                found = subject.aliases
+                self.assertEqual(expected, found)
+
+    def test_ndjson_is_lazy(self):
+        path = Path(self.get_temporary_directory(), "aliases.ndjson")
+        path.write_text('{"foo": ["bar"]}\nnot json\n')
+        stream = _aliasresolver._yield_aliases(path)
+        expected = Alias("foo", ["bar"])
+        found = next(stream)  # should not raise
+        self.assertEqual(expected, found)
+        with self.assertRaises(ValueError):
+            next(stream)
+
+    @skipIf(not yaml, "yaml not intalled")
+    def test_yaml_documents(self):
+        data = [
+            {"identity": "foo", "aliases": ["bar"]},
+            None,
+            {"aliases": [{"identity": "hello", "aliases": ["aloha"]}]},
+        ]
+        expected = [
+            Alias("foo", ["bar"]),
+            Alias("hello", ["aloha"]),
+        ]
+        path = Path(self.get_temporary_directory(), "aliases.yaml")
+        path.write_text(yaml.safe_dump_all(data))
+        subject = MOD.AliasResolver.build(path)
+        found = subject.aliases
+        self.assertEqual(expected, found)
+
     # section
     # ----------------------------------
 
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+import threading
+from unittest import TestCase
+
+import rym.alias._aliasresolverconcurrent as MOD
+from rym.alias._aliasresolver import AliasResolver, CollisionError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestConcurrentAliasResolver(ThisTestCase):
+    """Test class."""
+
+    def test_build(self):
+        subject = MOD.ConcurrentAliasResolver.build({"foo": ["bar"]})
+        self.assertEqual("foo", subject.identify("BAR"))
+        self.assertEqual(["foo", None], subject.identify_many(["bar", "x"], None))
+        self.assertIsNone(subject.resolver._attempts)
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.identify("meh")
+
+    def test_writes_publish_new_snapshot(self):
+        subject = MOD.ConcurrentAliasResolver(
+            AliasResolver.build({"foo": ["bar"]}, transforms=None)
+        )
+        initial = subject.snapshot
+        found = subject.add({"hello": ["hola"]}, transforms=None)
+        self.assertIs(subject, found.add_alias("foo", "baz"))  # chainable
+        self.assertIsNot(initial, subject.snapshot)
+        self.assertIsNone(initial.identify("hola", None))
+        self.assertEqual("hello", subject.identify("hola"))
+        self.assertEqual("foo", subject.identify("baz"))
+        self.assertEqual(["bar", "baz", "foo", "hello", "hola"], subject.all_names())
+
+    def test_failed_write_keeps_snapshot(self):
+        subject = MOD.ConcurrentAliasResolver.build({"foo": ["bar"]})
+        initial = subject.snapshot
+        with self.assertRaises(CollisionError):
+            subject.add({"meh": ["bar"]})
+        self.assertIs(initial, subject.snapshot)
+
+    def test_readers_see_consistent_state(self):
+        subject = MOD.ConcurrentAliasResolver.build({"foo": ["bar"]}, transforms=None)
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                try:
+                    assert "foo" == subject.identify("bar")
+                    found = subject.identify_many(["bar", "x0"], default=None)
+                    assert found in (["foo", None], ["foo", "id0"]), found
+                except Exception as err:  # pragma: no cover
+                    errors.append(err)
+                    return
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            for i in range(200):
+                subject.add({f"id{i}": [f"x{i}"]}, transforms=None)
+        finally:
+            done.set()
+            for thread in readers:
+                thread.join()
+        self.assertEqual([], errors)
+        self.assertEqual("id199", subject.identify("x199"))
+
+
+# __END__
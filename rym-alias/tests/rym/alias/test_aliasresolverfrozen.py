@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import json
+import logging
+import os
+import pickle
+import subprocess
+import sys
+from unittest import TestCase
+
+import rym.alias._aliasresolverfrozen as MOD
+from rym.alias._alias import Alias
+from rym.alias._aliasresolver import AliasResolver, resolve_aliases
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+    def get_resolver(self) -> AliasResolver:
+        return AliasResolver.build(
+            {"foo": ["bar"]},
+            {"hello": ["hola"]},
+            {json.loads: ["json.loads"]},
+        )
+
+
+class TestFrozenAliasResolver(ThisTestCase):
+    """Test class."""
+
+    def test_build(self):
+        subject = MOD.FrozenAliasResolver.build({"foo": ["bar"]})
+        expected = "foo"
+        found = subject.identify("BAR")
+        self.assertEqual(expected, found)
+
+    def test_clone(self):
+        resolver = self.get_resolver()
+
+        with self.subTest("from resolver"):
+            subject = MOD.FrozenAliasResolver.clone(resolver)
+            self.assertEqual(set(resolver._lookup), set(subject.all_names()))
+
+        with self.subTest("from frozen"):
+            found = MOD.FrozenAliasResolver.clone(subject)
+            self.assertEqual(subject, found)
+
+    def test_clone_keeps_collision_winner(self):
+        resolver = AliasResolver.build({"a": ["x"]}, {"b": ["x"]}, strict=False)
+        subject = MOD.FrozenAliasResolver.clone(resolver)
+        expected = resolver.identify("x")
+        found = subject.identify("x")
+        self.assertEqual(expected, found)
+
+    def test_clone_keeps_casefold(self):
+        resolver = AliasResolver.build({"foo": ["bar"]}, casefold=True)
+        subject = MOD.FrozenAliasResolver.clone(resolver)
+        self.assertEqual("foo", subject.identify("bAr"))
+        self.assertEqual(["foo"], subject.identify_many(["BAR"]))
+        found = resolve_aliases(subject)
+        self.assertTrue(found[0].casefold)
+
+    def test_does_not_change_with_source(self):
+        resolver = self.get_resolver()
+        subject = MOD.FrozenAliasResolver.clone(resolver)
+        resolver.add({"meh": ["ugh"]})
+        with self.assertRaises(KeyError):
+            subject.identify("ugh")
+
+    def test_is_hashable(self):
+        subject = MOD.FrozenAliasResolver.clone(self.get_resolver())
+        other = MOD.FrozenAliasResolver.clone(self.get_resolver())
+        self.assertEqual({subject: True}, {other: True})
+
+    def test_is_picklable(self):
+        subject = MOD.FrozenAliasResolver.clone(self.get_resolver())
+        found = pickle.loads(pickle.dumps(subject))
+        self.assertEqual(subject, found)
+        self.assertEqual(hash(subject), hash(found))
+        self.assertIs(json.loads, found.identify("json.loads"))
+
+    def test_pickle_across_hash_seeds(self):
+        dump = (
+            "import pickle, sys; from rym.alias import FrozenAliasResolver as F;"
+            "x = F.build(prd=['prod'], dev=['develop']); hash(x);"
+            "sys.stdout.buffer.write(pickle.dumps(x))"
+        )
+        load = (
+            "import pickle, sys; from rym.alias import FrozenAliasResolver as F;"
+            "x = pickle.loads(sys.stdin.buffer.read());"
+            "y = F.build(prd=['prod'], dev=['develop']);"
+            "print(x == y, hash(x) == hash(y), x in {y})"
+        )
+        env = {**os.environ, "PYTHONHASHSEED": "1"}
+        data = subprocess.run(
+            [sys.executable, "-c", dump], env=env, check=True, capture_output=True
+        ).stdout
+        env["PYTHONHASHSEED"] = "2"
+        found = subprocess.run(
+            [sys.executable, "-c", load],
+            env=env,
+            input=data,
+            check=True,
+            capture_output=True,
+        ).stdout
+        self.assertEqual(b"True True True", found.strip())
+
+    def test_identify(self):
+        subject = MOD.FrozenAliasResolver.clone(self.get_resolver())
+        with self.subTest("found"):
+            self.assertEqual("hello", subject.identify("HOLA"))
+        with self.subTest("default"):
+            self.assertIsNone(subject.identify("nope", None))
+        with self.subTest("missing"):
+            with self.assertRaisesRegex(KeyError, "nope"):
+                subject.identify("nope")
+
+    def test_identify_many(self):
+        subject = MOD.FrozenAliasResolver.clone(self.get_resolver())
+        expected = ["foo", None, "foo"]
+        found = subject.identify_many(["bar", "nope", "bar"], default=None)
+        self.assertEqual(expected, found)
+        with self.assertRaisesRegex(KeyError, "nope"):
+            subject.identify_many(["bar", "nope"])
+
+
+class TestResolveAliases(ThisTestCase):
+    """Test function support."""
+
+    def test_supports_frozen_resolver(self):
+        subject = MOD.FrozenAliasResolver.build({"foo": ["bar"]}, transforms=None)
+        expected = [Alias("foo", ["bar", "foo"], None)]
+        found = resolve_aliases(subject)
+        found[0].aliases.sort()
+        self.assertEqual(expected, found)
+
+
+# __END__
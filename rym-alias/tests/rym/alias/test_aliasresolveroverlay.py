@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from unittest import TestCase, mock
+
+import rym.alias._aliasresolveroverlay as MOD
+from rym.alias._aliasresolver import AliasResolver, CollisionError
+from rym.alias._aliasresolverfrozen import FrozenAliasResolver
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+    def get_base(self, **kwargs) -> AliasResolver:
+        return AliasResolver.build(
+            {"prd": ["prod"], "dev": ["develop"], "qa": ["test"]},
+            transforms=None,
+            **kwargs,
+        )
+
+
+class TestOverlayAliasResolver(ThisTestCase):
+    """Test class."""
+
+    def test_identify_top_down(self):
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(
+            base, {"live": ["prod"], "uat": ["uat"]}, transforms=None
+        )
+        tests = [
+            # (expected, given)
+            ("live", "prod"),
+            ("uat", "uat"),
+            ("dev", "develop"),
+            ("prd", "prd"),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = subject.identify(given)
+                self.assertEqual(expected, found)
+        self.assertIsNone(subject.identify("meh", None))
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.identify("meh")
+
+    def test_identify_many(self):
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(base, live=["prod"], transforms=None)
+        given = ["prod", "develop", "meh", "prod", "live"]
+        expected = ["live", "dev", None, "live", "live"]
+        found = subject.identify_many(given, default=None)
+        self.assertEqual(expected, found)
+        with self.assertRaisesRegex(KeyError, "meh"):
+            subject.identify_many(given)
+
+    def test_identify_many_counts_attempts_per_layer(self):
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(base, live=["prod"], transforms=None)
+        subject.identify_many(["prod", "prod", "develop"])
+        self.assertEqual(2, subject.top._attempts["prod"])
+        self.assertEqual(1, subject.top._attempts["develop"])  # miss
+        self.assertEqual(0, base._attempts["prod"])  # not searched
+        self.assertEqual(1, base._attempts["develop"])
+
+    def test_does_not_copy_base(self):
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(base, live=["prod"])
+        self.assertIs(base, subject.layers[-1])
+        base.add(staging=["stage"])
+        self.assertEqual("staging", subject.identify("stage"))
+        self.assertEqual("prd", base.identify("prod"))
+
+    def test_tenants_share_base(self):
+        base = MOD.OverlayAliasResolver([self.get_base()])
+        a = base.over(AliasResolver.build(live=["prod"], transforms=None))
+        b = base.over(AliasResolver.build(main=["prod"], transforms=None))
+        self.assertEqual("live", a.identify("prod"))
+        self.assertEqual("main", b.identify("prod"))
+        self.assertEqual("prd", base.identify("prod"))
+        self.assertEqual(1, len(base.layers))
+
+    def test_supports_read_only_layers(self):
+        base = FrozenAliasResolver.clone(self.get_base())
+        subject = MOD.OverlayAliasResolver.build(
+            base, live=["prod"], transforms=None, policy="warn"
+        )
+        self.assertEqual("live", subject.identify("prod"))
+        self.assertEqual("dev", subject.identify("develop"))
+        self.assertEqual(["live", "dev"], subject.identify_many(["prod", "develop"]))
+        with self.assertRaisesRegex(TypeError, "read-only"):
+            subject.over(base).add(meh=["ugh"])
+
+    def test_supports_casefold_per_layer(self):
+        base = self.get_base(casefold=True)
+        subject = MOD.OverlayAliasResolver.build(base, live=["Prod"], transforms=None)
+        self.assertEqual("live", subject.identify("Prod"))
+        self.assertEqual("prd", subject.identify("PROD"))  # found in base
+
+    def test_all_names(self):
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(base, live=["prod"], transforms=None)
+        expected = ["dev", "develop", "live", "prd", "prod", "qa", "test"]
+        found = subject.all_names()
+        self.assertEqual(expected, found)
+
+    def test_raises_if_invalid_policy(self):
+        base = self.get_base()
+        with self.assertRaisesRegex(ValueError, "invalid policy"):
+            MOD.OverlayAliasResolver([base], ["meh"])
+        with self.assertRaisesRegex(ValueError, "invalid policy"):
+            MOD.OverlayAliasResolver([base]).over(base, policy="meh")
+        with self.assertRaisesRegex(ValueError, "expected 1 policies"):
+            MOD.OverlayAliasResolver([base], ["strict", "strict"])
+
+
+class TestCollisionPolicy(ThisTestCase):
+    """Test collision policies."""
+
+    def test_override(self):
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(base, live=["prod"])
+        subject.add(testing=["test"])
+        self.assertEqual("testing", subject.identify("test"))
+
+    def test_warn(self):
+        logger = mock.Mock()
+        base = self.get_base()
+        subject = MOD.OverlayAliasResolver.build(
+            base, live=["prod"], policy="warn", logger=logger
+        )
+        logger.warning.assert_called_once_with(
+            "Collisions with lower layers: %s", ["prod"]
+        )
+        subject.add_alias("live", "develop")
+        self.assertEqual("live", subject.identify("develop"))
+        self.assertEqual(2, logger.warning.call_count)
+
+    def test_strict(self):
+        base = self.get_base()
+        with self.assertRaisesRegex(CollisionError, "prod"):
+            MOD.OverlayAliasResolver.build(base, live=["prod"], policy="strict")
+        subject = MOD.OverlayAliasResolver.build(base, live=["now"], policy="strict")
+        with self.assertRaisesRegex(CollisionError, "test"):
+            subject.add(testing=["test"])
+        with self.assertRaisesRegex(CollisionError, "develop"):
+            subject.add_alias("live", "develop")
+        self.assertIsNone(subject.identify("testing", None))  # unchanged
+        self.assertEqual("dev", subject.identify("develop"))
+
+    def test_strict_casefold(self):
+        base = self.get_base(casefold=True)
+        with self.assertRaisesRegex(CollisionError, "PROD"):
+            MOD.OverlayAliasResolver.build(
+                base, live=["PROD"], transforms=None, policy="strict"
+            )
+
+    def test_strict_checks_names_as_stored_by_top(self):
+        base = self.get_base()
+        tests = [
+            # (expected, top, name, kwargs)
+            (
+                "prod",
+                AliasResolver.build(live=["now"], casefold=True),
+                "PROD",
+                {"transforms": None},
+            ),
+            (
+                "develop",
+                AliasResolver.build(live=["now"], lazy=True),
+                "DEVELOP",
+                {},  # default transforms
+            ),
+        ]
+        for expected, top, name, kwargs in tests:
+            subject = MOD.OverlayAliasResolver([base]).over(top, "strict")
+            with self.subTest(expected):
+                with self.assertRaisesRegex(CollisionError, expected):
+                    subject.add(meh=[name], **kwargs)
+                with self.assertRaisesRegex(CollisionError, expected):
+                    subject.add_alias("live", name)
+                self.assertIsNone(top.identify(expected, None))  # unchanged
+
+    def test_applies_per_layer(self):
+        base = self.get_base()
+        strict = AliasResolver.build(live=["now"], transforms=None)
+        subject = MOD.OverlayAliasResolver([strict, base], ["strict", "override"])
+        view = subject.over(AliasResolver.build(testing=["test", "now"]))
+        self.assertEqual("testing", view.identify("now"))  # override
+        with self.assertRaisesRegex(CollisionError, "prod"):
+            subject.add(meh=["prod"])
+
+    def test_checks_only_new_layer(self):
+        base = self.get_base()
+        middle = AliasResolver.build(x=["y"], transforms=None)
+        subject = MOD.OverlayAliasResolver([middle, base], ["strict", "override"])
+        with mock.patch.object(MOD, "_has_name", return_value=False) as has_name:
+            subject.over(AliasResolver.build(live=["now"], transforms=None), "strict")
+        self.assertEqual(4, has_name.call_count)  # live, now in two layers
+
+    def test_check_does_not_count_attempts(self):
+        base = self.get_base()
+        MOD.OverlayAliasResolver.build(base, live=["now"], policy="strict")
+        self.assertNotIn("now", base._attempts)
+        self.assertNotIn("live", base._attempts)
+
+
+# __END__
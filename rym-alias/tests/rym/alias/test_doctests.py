@@ -6,7 +6,24 @@ import logging
 import unittest as ut
 from typing import Union
 
-from rym.alias import _alias, _aliasresolver
+from rym.alias import (
+    _alias,
+    _aliascompact,
+    _aliasmapped,
+    _aliasperfect,
+    _aliasresolver,
+    _aliasresolverconcurrent,
+    _aliasresolverfrozen,
+    _aliasresolveroverlay,
+    _frontcache,
+    _fuzzy,
+    _lazy,
+    _prefix,
+    _tracking,
+    _transformcache,
+    _usage,
+    safesort,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,7 +35,21 @@ def load_tests(
 ) -> ut.TestSuite:
     """Load doctests. For use with the unittest load_tests protocol."""
     tests.addTests(doctest.DocTestSuite(_alias))
+    tests.addTests(doctest.DocTestSuite(_aliascompact))
+    tests.addTests(doctest.DocTestSuite(_aliasmapped))
+    tests.addTests(doctest.DocTestSuite(_aliasperfect))
     tests.addTests(doctest.DocTestSuite(_aliasresolver))
+    tests.addTests(doctest.DocTestSuite(_aliasresolverconcurrent))
+    tests.addTests(doctest.DocTestSuite(_aliasresolverfrozen))
+    tests.addTests(doctest.DocTestSuite(_aliasresolveroverlay))
+    tests.addTests(doctest.DocTestSuite(_frontcache))
+    tests.addTests(doctest.DocTestSuite(_fuzzy))
+    tests.addTests(doctest.DocTestSuite(_lazy))
+    tests.addTests(doctest.DocTestSuite(_prefix))
+    tests.addTests(doctest.DocTestSuite(_tracking))
+    tests.addTests(doctest.DocTestSuite(_transformcache))
+    tests.addTests(doctest.DocTestSuite(_usage))
+    tests.addTests(doctest.DocTestSuite(safesort))
     return tests
 
 
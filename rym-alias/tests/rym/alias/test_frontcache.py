@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from unittest import TestCase
+
+import rym.alias._frontcache as MOD
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestFrontCache(ThisTestCase):
+    """Test class."""
+
+    def test_counts_hits_and_misses(self):
+        subject = MOD.FrontCache(maxsize=4)
+        self.assertIsNone(subject.get("a"))
+        subject.put("a", 1)
+        self.assertEqual(1, subject.get("a"))
+        self.assertEqual((1, 1, 4, 1), subject.cache_info())
+        subject.cache_clear()
+        self.assertEqual((0, 0, 4, 0), subject.cache_info())
+
+    def test_keeps_used_entries(self):
+        subject = MOD.FrontCache(maxsize=4)
+        for i in range(4):
+            subject.put(i, i)
+        subject.get(0)  # hot
+        subject.put(4, 4)  # evict unused
+        expected = {0: 0, 4: 4}
+        found = {k: subject.get(k) for k in range(5) if subject.get(k) is not None}
+        self.assertEqual(expected, found)
+
+    def test_keeps_newest_half_if_all_used(self):
+        subject = MOD.FrontCache(maxsize=4)
+        for i in range(4):
+            subject.put(i, i)
+            subject.get(i)
+        subject.put(4, 4)
+        self.assertEqual(3, len(subject))
+        self.assertIsNone(subject.get(0))
+        self.assertEqual(4, subject.get(4))
+
+    def test_never_exceeds_maxsize(self):
+        for maxsize in (1, 2, 3):
+            subject = MOD.FrontCache(maxsize=maxsize)
+            with self.subTest(maxsize):
+                for i in range(10):
+                    subject.put(i, i)
+                    subject.get(i)  # every entry used
+                    self.assertLessEqual(len(subject), maxsize)
+                self.assertEqual(9, subject.get(9))
+
+    def test_raises_if_invalid_maxsize(self):
+        for maxsize in (0, -1):
+            with self.subTest(maxsize):
+                with self.assertRaisesRegex(ValueError, "invalid maxsize"):
+                    MOD.FrontCache(maxsize=maxsize)
+
+    def test_invalidate_keeps_statistics(self):
+        subject = MOD.FrontCache(maxsize=4)
+        subject.put("a", 1)
+        subject.get("a")
+        subject.invalidate()
+        self.assertEqual((1, 0, 4, 0), subject.cache_info())
+
+    def test_raises_if_unhashable(self):
+        subject = MOD.FrontCache()
+        with self.assertRaises(TypeError):
+            subject.get(["a"])
+
+
+# __END__
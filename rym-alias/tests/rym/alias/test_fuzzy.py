@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from unittest import TestCase
+
+import rym.alias._fuzzy as MOD
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestLevenshtein(ThisTestCase):
+    """Test function."""
+
+    def test_returns_expected(self):
+        tests = [
+            # (expected, a, b)
+            (0, "", ""),
+            (0, "foo", "foo"),
+            (3, "", "foo"),
+            (1, "foo", "fo"),
+            (1, "foo", "fox"),
+            (2, "production", "prodcution"),
+            (3, "kitten", "sitting"),
+            (2, "abcdef", "abXYef"),
+        ]
+        for expected, a, b in tests:
+            with self.subTest((a, b)):
+                self.assertEqual(expected, MOD.levenshtein(a, b))
+                self.assertEqual(expected, MOD.levenshtein(b, a))
+
+
+class TestBKTree(ThisTestCase):
+    """Test class."""
+
+    def test_search_matches_brute_force(self):
+        keys = [f"{a}{b}{c}" for a in "abc" for b in "abcd" for c in "ab"] + ["", "a"]
+        subject = MOD.BKTree(keys)
+        for query in ["abc", "x", "aaaa", "", "dd"]:
+            for max_distance in range(3):
+                with self.subTest((query, max_distance)):
+                    expected = sorted(
+                        (d, k)
+                        for k in set(keys)
+                        if (d := MOD.levenshtein(query, k)) <= max_distance
+                    )
+                    found = subject.search(query, max_distance)
+                    self.assertEqual(expected, found)
+
+    def test_ignores_duplicates_and_non_strings(self):
+        subject = MOD.BKTree(["a", "a", None, 42, "b"])
+        expected = 2
+        found = len(subject)
+        self.assertEqual(expected, found)
+        self.assertEqual([], subject.search(None, 2))
+
+    def test_empty(self):
+        subject = MOD.BKTree()
+        self.assertEqual([], subject.search("a", 2))
+
+
+# __END__
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from unittest import TestCase
+
+import stringcase as sc
+
+import rym.alias._lazy as MOD
+from rym.alias import variation
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestSplitTransforms(ThisTestCase):
+    """Test function."""
+
+    def test_returns_eager_and_lazy(self):
+        given = [variation.upper, sc.snakecase, variation.esser]
+        expected = ([sc.snakecase], [variation.upper, variation.esser])
+        found = MOD.split_transforms(given)
+        self.assertEqual(expected, found)
+
+
+class TestVariantIndex(ThisTestCase):
+    """Test class."""
+
+    def get_subject(self, **kwargs) -> MOD.VariantIndex:
+        subject = MOD.VariantIndex(**kwargs)
+        subject.add(["foo", 42], [variation.upper, sc.snakecase], "x")
+        subject.add(["bars"], [variation.lower, variation.deesser], "y")
+        return subject
+
+    def test_finds_transformed_names(self):
+        subject = self.get_subject()
+        tests = [
+            # (expected, given)
+            ("x", "FOO"),
+            ("y", "bar"),  # deesser("bars")
+            (None, "Bars"),
+            (None, "foo"),  # raw names are not indexed
+            (None, "Foo"),
+            (None, "BAR"),
+            (None, 42),
+            (None, ["unhashable"]),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = subject.find(given)
+                self.assertEqual(expected, found)
+
+    def test_ignores_eager_transforms(self):
+        subject = MOD.VariantIndex()
+        subject.add(["foo"], [sc.snakecase], "x")
+        self.assertEqual(0, len(subject))
+        self.assertEqual(3, len(self.get_subject()))
+
+    def test_later_names_win(self):
+        subject = self.get_subject()
+        self.assertEqual("x", subject.find("FOO"))
+        subject.add(["Foo"], [variation.upper], "z")
+        self.assertEqual("z", subject.find("FOO"))
+
+    def test_supports_fold(self):
+        subject = self.get_subject(fold=variation.casefold)
+        self.assertEqual("x", subject.find("foo"))
+        self.assertIsNone(subject.find("FOO"))  # queries are folded by caller
+        subject.add(["fooBar"], [variation.esser], "z")
+        self.assertEqual("z", subject.find("foobars"))
+
+    def test_discard(self):
+        subject = self.get_subject()
+        self.assertEqual("x", subject.find("FOO"))
+        subject.discard(["foo"], "x")
+        subject.discard(["meh"], "x")  # should not raise
+        self.assertIsNone(subject.find("FOO"))
+        self.assertEqual("y", subject.find("bar"))
+        subject.add(["foo"], [variation.upper], "x")
+        self.assertEqual("x", subject.find("FOO"))
+
+    def test_clear(self):
+        subject = self.get_subject()
+        subject.clear()
+        self.assertEqual(0, len(subject))
+        self.assertIsNone(subject.find("FOO"))
+
+
+# __END__
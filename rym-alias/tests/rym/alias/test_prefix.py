@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from unittest import TestCase
+
+import rym.alias._prefix as MOD
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestPrefixIndex(ThisTestCase):
+    """Test class."""
+
+    def test_search_matches_brute_force(self):
+        keys = ["", "a", "ab", "abc", "abd", "b", "ba", "bab", "\\U0010ffff"]
+        subject = MOD.PrefixIndex(keys)
+        for prefix in ["", "a", "ab", "abc", "b", "c", "\\U0010ffff"]:
+            with self.subTest(prefix):
+                expected = sorted(k for k in keys if k.startswith(prefix))
+                found = list(subject.search(prefix))
+                self.assertEqual(expected, found)
+
+    def test_merges_pending_keys(self):
+        subject = MOD.PrefixIndex([f"k{i:03d}" for i in range(100)])
+        subject.add("k050x")
+        subject.update(["k050", "k050y", "j"])  # includes duplicate
+        expected = ["k050", "k050x", "k050y"]
+        found = list(subject.search("k050"))
+        self.assertEqual(expected, found)
+        self.assertEqual(103, len(subject))
+
+    def test_ignores_non_strings(self):
+        subject = MOD.PrefixIndex([42, None, "foo"])
+        subject.add(("f",))
+        self.assertEqual(1, len(subject))
+        self.assertEqual(["foo"], list(subject.search("f")))
+
+
+# __END__
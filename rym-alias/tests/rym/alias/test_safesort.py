@@ -50,5 +50,51 @@ class TestSafeSort(ThisTestCase):
         found = MOD.safesorted(given, reverse=True)
         self.assertEqual(expected, found, found)
 
+    def test_sorts_each_kind_natively(self):
+        class Name(str):
+            ...
+
+        tests = [
+            # (expected, given)
+            ([-10, -1, 0.5, 2, 10], [10, 2, -1, 0.5, -10]),
+            ([False, 1, True, 2], [2, True, False, 1]),  # stable for equal values
+            (["", "B", "a", Name("b")], [Name("b"), "a", "", "B"]),
+            ([1, "a", (1, 2), None], [None, "a", (1, 2), 1]),  # others by str
+            ([], []),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = MOD.safesorted(given)
+                self.assertEqual(expected, found)
+
+    def test_accepts_iterator(self):
+        given = iter(["b", 2, "a", 1])
+        expected = [1, 2, "a", "b"]
+        found = MOD.safesorted(given)
+        self.assertEqual(expected, found)
+
+    def test_raises_if_invalid_keyword(self):
+        with self.assertRaises(TypeError):
+            MOD.safesorted(["a"], cmp=None)
+
+
+class TestGetSafekey(ThisTestCase):
+    """Test function."""
+
+    def test_matches_safesorted(self):
+        given = ["b", 10, -1, 2.5, "A", None, (1, 2), True]
+        tests = [
+            # (key)
+            None,
+            lambda x: x.upper(),
+        ]
+        for key in tests:
+            with self.subTest(key):
+                expected = MOD.safesorted(given, key=key)
+                with self.assertWarns(DeprecationWarning):
+                    safekey = MOD.get_safekey(key)
+                found = sorted(given, key=safekey)
+                self.assertEqual(expected, found)
+
 
 # __END__
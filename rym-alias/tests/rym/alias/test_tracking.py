@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+import pickle
+from unittest import TestCase
+
+import rym.alias._tracking as MOD
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestExactTracker(ThisTestCase):
+    """Test class."""
+
+    def test_counts_every_attempt(self):
+        subject = MOD.ExactTracker()
+        subject.register(["a", "b"])
+        subject.track("a")
+        subject.track("c")
+        subject.track_many({"a": 2, "d": 1})
+        expected = {"a": 3, "b": 0, "c": 1, "d": 1}
+        found = subject
+        self.assertEqual(expected, found)
+
+    def test_is_picklable(self):
+        subject = MOD.ExactTracker({"a": 1})
+        found = pickle.loads(pickle.dumps(subject))
+        self.assertEqual(subject, found)
+
+
+class TestSampledTracker(ThisTestCase):
+    """Test class."""
+
+    def test_estimates_attempts(self):
+        subject = MOD.SampledTracker(rate=10)
+        for _ in range(10000):
+            subject.track("a")
+        found = subject["a"]
+        self.assertTrue(8000 < found < 12000, found)
+        self.assertEqual(0, found % 10)
+
+    def test_is_picklable(self):
+        subject = MOD.SampledTracker({"a": 1}, rate=10)
+        found = pickle.loads(pickle.dumps(subject))
+        self.assertEqual(subject, found)
+        self.assertEqual(10, found.rate)
+
+    def test_raises_if_invalid_rate(self):
+        for rate in (0, -1):
+            with self.subTest(rate):
+                with self.assertRaisesRegex(ValueError, "invalid rate"):
+                    MOD.SampledTracker(rate=rate)
+
+
+class TestTopKTracker(ThisTestCase):
+    """Test class."""
+
+    def test_bounded(self):
+        subject = MOD.TopKTracker(k=3)
+        subject.register(["never", "seen"])
+        for i in range(100):
+            subject.track(i)
+            subject.track("hot")
+        self.assertEqual(3, len(subject))
+        self.assertEqual(100, subject["hot"])
+
+    def test_raises_if_invalid_k(self):
+        for k in (0, -1):
+            with self.subTest(k):
+                with self.assertRaisesRegex(ValueError, "invalid k"):
+                    MOD.TopKTracker(k=k)
+
+    def test_replacement_inherits_count(self):
+        subject = MOD.TopKTracker(k=2)
+        subject.track_many({"a": 5, "b": 2})
+        subject.track("c")
+        expected = {"a": 5, "c": 3}
+        found = subject
+        self.assertEqual(expected, found)
+
+    def test_matches_linear_scan(self):
+        given = [f"v{i % 37}" if i % 3 else f"u{i}" for i in range(2000)]
+        subject = MOD.TopKTracker(k=10)
+        expected = {}
+        for value in given:
+            subject.track(value)
+            if value in expected:
+                expected[value] += 1
+            elif len(expected) < 10:
+                expected[value] = 1
+            else:
+                victim = min(expected, key=expected.__getitem__)
+                expected[value] = expected.pop(victim) + 1
+        self.assertEqual(sorted(expected.values()), sorted(subject.values()))
+        self.assertEqual(len(given), sum(subject.values()))
+        self.assertLessEqual(len(subject._heap), 2 * subject.k)
+
+    def test_skips_removed_values(self):
+        subject = MOD.TopKTracker(k=2)
+        subject.track_many({"a": 1, "b": 2})
+        subject.pop("a")  # e.g., alias removed
+        subject.track_many({"c": 1, "d": 1})  # evicts c, not removed a
+        self.assertEqual({"b": 2, "d": 2}, subject)
+
+    def test_is_picklable(self):
+        subject = MOD.TopKTracker(k=2)
+        subject.track_many({"a": 1, "b": 5})
+        found = pickle.loads(pickle.dumps(subject))
+        found.track("c")
+        self.assertEqual({"b": 5, "c": 2}, found)
+
+
+class TestResolveTracker(ThisTestCase):
+    """Test function."""
+
+    def test_raises_for_invalid(self):
+        for value in ["nope", 42]:
+            with self.subTest(value):
+                with self.assertRaisesRegex(ValueError, "invalid tracking"):
+                    MOD.resolve_tracker(value)
+
+    def test_returns_expected(self):
+        tests = [
+            # (expected, given)
+            (None, None),
+            (None, False),
+            (None, "off"),
+            (MOD.ExactTracker, True),
+            (MOD.ExactTracker, "exact"),
+            (MOD.SampledTracker, "sampled"),
+            (MOD.TopKTracker, "topk"),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = MOD.resolve_tracker(given)
+                self.assertIs(expected, found if found is None else type(found))
+
+    def test_returns_instance_as_is(self):
+        given = MOD.TopKTracker(k=5)
+        found = MOD.resolve_tracker(given)
+        self.assertIs(given, found)
+
+
+# __END__
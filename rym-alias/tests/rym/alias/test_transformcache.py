@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import logging
+from unittest import TestCase, mock
+
+import rym.alias._transformcache as MOD
+from rym.alias import Alias, variation
+
+LOGGER = logging.getLogger(__name__)
+
+
+def shout(value: str) -> str:
+    return f"{value.upper()}!"
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+
+class TestTransformCache(ThisTestCase):
+    """Test class."""
+
+    def test_reuses_results(self):
+        subject = MOD.TransformCache()
+        func = mock.Mock(side_effect=shout, spec=shout)
+        expected = ["A!", "B!", "A!"]
+        self.assertEqual(expected, subject.transform_many(func, ["a", "b", "a"]))
+        self.assertEqual(expected, subject.transform_many(func, ["a", "b", "a"]))
+        self.assertEqual(2, func.call_count)
+        expected = MOD.CacheInfo(hits=4, misses=2, maxsize=2**16, currsize=2)
+        self.assertEqual(expected, subject.cache_info())
+
+    def test_uses_batch(self):
+        subject = MOD.TransformCache()
+        func = mock.Mock(spec=shout, batch=mock.Mock(return_value=["A", "B"]))
+        found = subject.transform_many(func, ["a", "b", "a"])
+        self.assertEqual(["A", "B", "A"], found)
+        func.batch.assert_called_once_with(["a", "b"])
+        func.assert_not_called()
+
+    def test_bounded(self):
+        subject = MOD.TransformCache(maxsize=4)
+        subject.transform_many(shout, list("abcde"))
+        self.assertEqual(2, subject.cache_info().currsize)  # newest half
+        self.assertEqual(["D!", "E!"], subject.transform_many(shout, ["d", "e"]))
+        self.assertEqual(2, subject.hits)
+
+    def test_skips_uncacheable(self):
+        subject = MOD.TransformCache()
+        tests = [
+            # (expected, func, values)
+            (["A", "B"], variation.upper, ["a", "b"]),  # memo is False
+            (["A", "B"], str.upper, ["a", "b"]),  # no weak reference
+            ([["a"]], lambda x: x, [["a"]]),  # unhashable value
+        ]
+        for expected, func, values in tests:
+            with self.subTest(func):
+                found = subject.transform_many(func, values)
+                self.assertEqual(expected, found)
+        self.assertEqual(0, subject.cache_info().currsize)
+
+        subject = MOD.TransformCache(maxsize=0)
+        self.assertEqual(["A!"], subject.transform_many(shout, ["a"]))
+        self.assertEqual((0, 0, 0, 0), subject.cache_info())
+
+    def test_raises_and_caches_nothing(self):
+        subject = MOD.TransformCache()
+        with self.assertRaises(AttributeError):
+            subject.transform_many(shout, ["a", 42])
+        self.assertEqual((0, 0), subject.cache_info()[:2])
+        self.assertEqual(0, subject.cache_info().currsize)
+
+    def test_keys_by_type(self):
+        subject = MOD.TransformCache()
+        found = subject.transform_many(str, [1, True, 1.0, 1])
+        self.assertEqual(["1", "True", "1.0", "1"], found)
+        self.assertEqual(["True"], subject.transform_many(str, [True]))
+
+    def test_equal_names_of_other_types_do_not_share_results(self):
+        MOD.get_transform_cache().cache_clear()
+        Alias("a", [1], transforms=[str])
+        found = Alias("b", [True], transforms=[str])
+        self.assertEqual({"b", True, "True"}, set(found._lookup))
+
+    def test_clear(self):
+        subject = MOD.TransformCache()
+        subject.transform_many(shout, ["a"])
+        subject.cache_clear()
+        self.assertEqual((0, 0, 2**16, 0), subject.cache_info())
+
+
+# __END__
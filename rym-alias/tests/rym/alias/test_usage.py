@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Test."""
+
+import csv
+import io
+import json
+import logging
+from unittest import TestCase
+
+import rym.alias._usage as MOD
+from rym.alias import Alias, AliasResolver, TopKTracker
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ThisTestCase(TestCase):
+    """Base test case for the module."""
+
+    def get_resolver(self, **kwargs) -> AliasResolver:
+        subject = AliasResolver.build(
+            {"foo": ["bar"]},
+            {"hello": ["hola"]},
+            {("x", "y"): ["xy"]},
+            transforms=None,
+            **kwargs,
+        )
+        given = ["bar", "bar", "foo", "hola", "meh", "meh", "nope", "HOLA"]
+        subject.identify_many(given, default=None)
+        return subject
+
+
+class TestBuildUsageReport(ThisTestCase):
+    """Test function."""
+
+    def test_returns_hits_by_name_and_identity(self):
+        subject = self.get_resolver().usage()
+        expected = [
+            ("foo", "foo", 1),
+            ("bar", "foo", 2),
+            ("hello", "hello", 0),
+            ("hola", "hello", 1),
+            (("x", "y"), ("x", "y"), 0),
+            ("xy", ("x", "y"), 0),
+        ]
+        self.assertEqual(expected, subject.names)
+        expected = {"foo": 3, "hello": 1, ("x", "y"): 0}
+        self.assertEqual(expected, subject.identities)
+
+    def test_uses_find_for_other_values(self):
+        def find(value):
+            if value == "FOO":
+                return "foo"
+            raise KeyError(value)
+
+        attempts = {"foo": 1, "FOO": 2, "x": 3}
+        found = MOD.build_usage_report(attempts, {"foo": "foo"}, ["foo"], find=find)
+        self.assertEqual([("foo", "foo", 1), ("FOO", "foo", 2)], found.names)
+        self.assertEqual({"foo": 3}, found.identities)
+        self.assertEqual([("x", 3)], found.misses)
+
+    def test_returns_top_misses(self):
+        tests = [
+            # (expected, top)
+            ([("meh", 2)], 1),
+            ([("meh", 2), ("nope", 1), ("HOLA", 1)], 10),
+        ]
+        resolver = self.get_resolver()
+        for expected, top in tests:
+            with self.subTest(top):
+                found = resolver.usage(top=top).misses
+                self.assertEqual(expected, found)
+
+    def test_returns_unused(self):
+        subject = self.get_resolver().usage()
+        self.assertEqual(["hello", ("x", "y"), "xy"], subject.unused())
+        self.assertEqual([("x", "y")], subject.unused_identities())
+
+    def test_returns_top_names(self):
+        subject = self.get_resolver().usage()
+        expected = [("bar", "foo", 2), ("foo", "foo", 1)]
+        found = subject.top(2)
+        self.assertEqual(expected, found)
+
+    def test_includes_names_found_on_demand(self):
+        subject = self.get_resolver(lazy=True)
+        subject.add_transform("upper")
+        subject.identify("HOLA")
+        report = subject.usage()
+        self.assertIn(("HOLA", "hello", 2), report.names)
+        self.assertEqual(["meh", "nope"], [k for k, _ in report.misses])
+
+    def test_supports_alias(self):
+        subject = Alias("foo", ["bar"], transforms=None)
+        subject.identify_many(["bar", "meh"], default=None)
+        report = subject.usage()
+        self.assertEqual({"foo": 1}, report.identities)
+        self.assertEqual([("meh", 1)], report.misses)
+
+    def test_supports_topk_tracker(self):
+        subject = self.get_resolver(tracking=TopKTracker(k=10))
+        report = subject.usage()
+        self.assertEqual({"foo": 3, "hello": 1, ("x", "y"): 0}, report.identities)
+        self.assertEqual([("meh", 2), ("nope", 1), ("HOLA", 1)], report.misses)
+
+    def test_raises_if_not_tracked(self):
+        subject = self.get_resolver(tracking="off")
+        with self.assertRaisesRegex(ValueError, "not tracked"):
+            subject.usage()
+
+
+class TestExport(ThisTestCase):
+    """Test feature."""
+
+    def test_csv(self):
+        stream = io.StringIO()
+        self.get_resolver().usage().to_csv(stream)
+        stream.seek(0)
+        rows = list(csv.DictReader(stream))
+        self.assertEqual(9, len(rows))
+        expected = {"kind": "name", "value": "bar", "identity": "foo", "hits": "2"}
+        self.assertEqual(expected, rows[1])
+        expected = {"kind": "miss", "value": "meh", "identity": "", "hits": "2"}
+        self.assertEqual(expected, rows[6])
+
+    def test_json(self):
+        stream = io.StringIO()
+        self.get_resolver().usage().to_json(stream)
+        found = json.loads(stream.getvalue())
+        self.assertEqual(["identities", "misses", "names"], sorted(found))
+        expected = {"name": "xy", "identity": ["x", "y"], "hits": 0}
+        self.assertEqual(expected, found["names"][-1])
+        self.assertEqual({"value": "meh", "hits": 2}, found["misses"][0])
+
+
+# __END__
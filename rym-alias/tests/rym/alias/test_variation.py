@@ -13,6 +13,67 @@ class ThisTestCase(TestCase):
     """Base test case for the module."""
 
 
+class TestBatch(ThisTestCase):
+    """Test feature."""
+
+    def test_matches_single_transform(self):
+        given = ["foo", "FoOs", "Straße", "", "s"]
+        for func in (
+            MOD.capitalize,
+            MOD.casefold,
+            MOD.deesser,
+            MOD.esser,
+            MOD.lower,
+            MOD.upper,
+        ):
+            with self.subTest(func.__name__):
+                expected = [func(x) for x in given]
+                found = func.batch(given)
+                self.assertEqual(expected, found)
+
+    def test_raises_for_invalid_values(self):
+        with self.assertRaises(TypeError):
+            MOD.upper.batch(["foo", 42])
+
+
+class TestNormalize(ThisTestCase):
+    """Test feature."""
+
+    def test_transform_keeps_normalized_value(self):
+        given = ["foo", "FoOs", "Straße", "", "s", "ǅ", "ı", "K"]
+        for func in (
+            MOD.capitalize,
+            MOD.casefold,
+            MOD.deesser,
+            MOD.esser,
+            MOD.lower,
+            MOD.upper,
+        ):
+            normalize = func.normalize
+            for value in given:
+                with self.subTest(func.__name__, value=value):
+                    expected = normalize(value)
+                    found = normalize(func(value))
+                    self.assertEqual(expected, found)
+
+
+class TestCasefold(ThisTestCase):
+    """Test function."""
+
+    def test_returns_expected(self):
+        tests = [
+            # (expected, given)
+            ("foo", "FoO"),
+            ("strasse", "Straße"),
+            (42, 42),
+            (None, None),
+        ]
+        for expected, given in tests:
+            with self.subTest(given):
+                found = MOD.casefold(given)
+                self.assertEqual(expected, found)
+
+
 class TestDeesser(ThisTestCase):
     """Test function."""
 